@@ -1,9 +1,58 @@
 """Password strength analyzer with CLI interface."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 
-from .analyzer import AnalysisResult, PasswordAnalyzer
-from .checks import CheckResult
-from .generator import generate_password
+if TYPE_CHECKING:
+    from .analyzer import PasswordAnalyzer
+    from .cache import ResultCache
+    from .generator import generate_password
+    from .instrument import Instrumentation
+    from .messages import Message, MessageCode
+    from .registry import CheckRegistry, CheckSpec
+    from .results import AnalysisResult, CheckResult
+
+# Public names and the submodule each one lives in. They are imported on
+# first access so ``import password_analyzer`` stays cheap.
+_LAZY = {
+    "PasswordAnalyzer": "analyzer",
+    "AnalysisResult": "results",
+    "CheckResult": "results",
+    "ResultCache": "cache",
+    "generate_password": "generator",
+    "Instrumentation": "instrument",
+    "CheckRegistry": "registry",
+    "CheckSpec": "registry",
+    "Message": "messages",
+    "MessageCode": "messages",
+}
+
+__all__ = [
+    "PasswordAnalyzer",
+    "AnalysisResult",
+    "CheckResult",
+    "ResultCache",
+    "Instrumentation",
+    "CheckRegistry",
+    "CheckSpec",
+    "Message",
+    "MessageCode",
+    "generate_password",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["PasswordAnalyzer", "AnalysisResult", "CheckResult", "generate_password"]
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -0,0 +1,134 @@
+"""Reversal of "word plus affixes" mangling rules.
+
+Cracking rules turn dictionary words into passwords like "Summer2024!":
+capitalize, then append a year, a digit run or a symbol or two, or put
+them in front. Instead of applying the rules forward to every word, the
+affixes are stripped from the password and what is left is looked up.
+
+An affix is up to ``MAX_AFFIX_RUNS`` runs of digits (at most
+``MAX_DIGITS`` long, which covers years) or symbols (at most
+``MAX_SYMBOLS`` long). The language is recognized by a small DFA over
+character classes, compiled once at import. It is run inwards from
+each end of the password and stops at the first letter, so a password
+costs a few table lookups plus one dictionary probe per way of splitting
+off affixes. Case is ignored, which undoes capitalization rules.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import string
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .wordlist import WordList
+
+MAX_DIGITS = 4
+MAX_SYMBOLS = 3
+MAX_AFFIX_RUNS = 2
+
+_DIGIT, _SYMBOL = 0, 1
+_DEAD = -1
+_CLASSES = {
+    **dict.fromkeys(string.digits, _DIGIT),
+    **dict.fromkeys(string.punctuation + " ", _SYMBOL),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class AffixMatch:
+    """A dictionary entry at ``text[start:end]`` with only affixes around it.
+
+    Attributes:
+        word: The dictionary entry, lowercased.
+        prefix: The affix stripped from the front, possibly empty.
+        suffix: The affix stripped from the end, possibly empty.
+    """
+
+    start: int
+    end: int
+    word: str
+    prefix: str
+    suffix: str
+
+    def describe(self) -> str:
+        """Describe the affixes, e.g. "'2024!' at the end"."""
+        parts = []
+        if self.prefix:
+            parts.append(f"'{self.prefix}' at the start")
+        if self.suffix:
+            parts.append(f"'{self.suffix}' at the end")
+        return " and ".join(parts)
+
+
+def _compile() -> tuple[tuple[int, int], ...]:
+    """Build the affix DFA: a row of (digit, symbol) transitions per state.
+
+    States stand for (runs so far, class of the current run, its length).
+    State 0 is the start state and every other state accepts. Letters and
+    other characters always lead to ``_DEAD``, so they get no column.
+    """
+    limits = {_DIGIT: MAX_DIGITS, _SYMBOL: MAX_SYMBOLS}
+    ids: dict[tuple[int, int, int], int] = {(0, _DEAD, 0): 0}
+    rows: list[tuple[int, int]] = []
+    pending = [(0, _DEAD, 0)]
+    while pending:
+        runs, current, length = pending.pop(0)
+        row = []
+        for cls in (_DIGIT, _SYMBOL):
+            if cls == current:
+                target = (runs, cls, length + 1) if length < limits[cls] else None
+            else:
+                target = (runs + 1, cls, 1) if runs < MAX_AFFIX_RUNS else None
+            if target is None:
+                row.append(_DEAD)
+                continue
+            if target not in ids:
+                ids[target] = len(ids)
+                pending.append(target)
+            row.append(ids[target])
+        rows.append((row[0], row[1]))
+    return tuple(rows)
+
+
+_TABLE = _compile()
+
+
+def _boundaries(chars: str) -> list[int]:
+    """Return the lengths of the leading affixes of ``chars``, shortest first."""
+    table, classes = _TABLE, _CLASSES
+    state = 0
+    found = []
+    for length, char in enumerate(chars, 1):
+        cls = classes.get(char)
+        if cls is None:
+            break
+        state = table[state][cls]
+        if state == _DEAD:
+            break
+        found.append(length)
+    return found
+
+
+def strip_affixes(text: str, wordlist: WordList, min_length: int = 1) -> AffixMatch | None:
+    """Return the entry of ``min_length``+ chars left after stripping affixes.
+
+    ``text`` should already be lowercased. ``text`` itself is not looked
+    up. When several entries are left by different splits, the longest
+    one, i.e. the one with the least stripped, is returned.
+    """
+    ends = [len(text)] + [len(text) - n for n in _boundaries(text[::-1])]
+    if len(ends) == 1 and text[:1] not in _CLASSES:
+        return None
+    starts = [0] + _boundaries(text)
+    best: AffixMatch | None = None
+    for end in ends:
+        for start in starts:
+            if end - start < min_length or (start == 0 and end == len(text)):
+                continue
+            if best is not None and end - start <= best.end - best.start:
+                continue
+            word = text[start:end]
+            if word in wordlist:
+                best = AffixMatch(start, end, word, text[:start], text[end:])
+    return best
@@ -2,57 +2,212 @@
 
 from __future__ import annotations
 
-import dataclasses
-
-from .checks import (
-    CheckResult,
-    check_character_variety,
-    check_common_password,
-    check_entropy,
-    check_length,
-    check_sequential_characters,
-)
-from .entropy import calculate_entropy
+import functools
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING
+
+from .checks import NEAR_MISS_DISTANCE
+from .options import MAX_NEAR_MISS_DISTANCE
+from .profile import PasswordInput, PasswordProfile, build_profile
+from .registry import Check, CheckRegistry, CheckSpec, Score, default_registry
+from .results import AnalysisResult, CheckResult
 from .scoring import get_strength_label, normalize_score
 
+if TYPE_CHECKING:
+    from .breach import BreachIndex
+    from .cache import ResultCache
+    from .instrument import Instrumentation
+    from .wordlist import WordList
+
 
-@dataclasses.dataclass
-class AnalysisResult:
-    """Complete result of a password analysis."""
+def _score_of(check: Check) -> Score:
+    return lambda profile: check(profile).score
 
-    password_length: int
-    score: int
-    strength: str
-    strength_color: str
-    entropy_bits: float
-    checks: list[CheckResult]
-    feedback: list[str]
+
+@functools.lru_cache(maxsize=4096)
+def _label_for(raw_score: float, max_score: float) -> str:
+    """Return the strength label of a raw score; raw scores repeat a lot."""
+    return get_strength_label(normalize_score(raw_score, max_score))[0]
 
 
 class PasswordAnalyzer:
-    """Analyzes password strength across multiple dimensions."""
+    """Analyzes password strength across multiple dimensions.
 
-    def analyze(self, password: str) -> AnalysisResult:
-        """Run all checks and return an aggregated result."""
-        entropy_bits = calculate_entropy(password)
+    Args:
+        wordlist: Dictionary for the common-password check. Defaults to the
+            bundled top-100 list.
+        substitutions: Leetspeak table mapping each character to the
+            letters it may stand for when matching the dictionary. Defaults
+            to ``leet.SUBSTITUTIONS``; pass ``{}`` to turn it off.
+        near_miss_distance: Passwords within this many typos (0-2) of a
+            dictionary entry are penalized as near misses; 0 turns it off.
+            File-backed dictionaries only get near misses once their index
+            is built, e.g. with ``build-dict --near-miss-distance``.
+        breach_index: Optional offline breach index; when given, an extra
+            prevalence-weighted "Breached password" check runs after the
+            common-password check.
+        cache: Optional ``ResultCache`` reused across calls for repeated
+            passwords. Caching is off when this is None. Clear the cache
+            after changing the analyzer's configuration.
+        instrumentation: Optional ``Instrumentation`` that times each check
+            and runs its hooks. Checks run untimed when this is None.
+        registry: The checks to run. Defaults to the built-in checks; pass a
+            ``CheckRegistry`` to add, remove or reorder checks.
+
+    Raises:
+        ValueError: If ``near_miss_distance`` is not between 0 and 2.
+    """
+
+    def __init__(
+        self,
+        wordlist: WordList | None = None,
+        breach_index: BreachIndex | None = None,
+        cache: ResultCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        registry: CheckRegistry | None = None,
+        substitutions: Mapping[str, str] | None = None,
+        near_miss_distance: int = NEAR_MISS_DISTANCE,
+    ) -> None:
+        if not 0 <= near_miss_distance <= MAX_NEAR_MISS_DISTANCE:
+            raise ValueError(
+                f"near_miss_distance must be between 0 and {MAX_NEAR_MISS_DISTANCE}."
+            )
+        self.wordlist = wordlist
+        self.substitutions = substitutions
+        self.near_miss_distance = near_miss_distance
+        self.breach_index = breach_index
+        self.cache = cache
+        self.instrumentation = instrumentation
+        self.registry = registry if registry is not None else default_registry()
+
+    def _steps(self) -> list[tuple[CheckSpec, Check]]:
+        """Bind the registered checks to the current configuration.
+
+        Checks whose spec builds None are skipped. With instrumentation,
+        each check is wrapped to record its time under the check's name.
+        """
+        steps = []
+        instrumentation = self.instrumentation
+        for spec in self.registry:
+            check = spec.build(self)
+            if check is None:
+                continue
+            if instrumentation is not None:
+                check = instrumentation.wrap(spec.name, check)
+            steps.append((spec, check))
+        return steps
+
+    def _pipeline(self) -> list[Check]:
+        """Build the checks to run, in result order."""
+        return [check for _, check in self._steps()]
+
+    def _score_plan(self) -> tuple[list[tuple[Score, float, float]], float]:
+        """Bind score-only checks for early-exit evaluation, cheapest first.
+
+        Returns ``(score, min_rest, max_rest)`` triples, where the bounds are
+        the lowest and highest total the checks after it can still add, and
+        the maximum raw score used to normalize.
+        """
+        steps: list[tuple[CheckSpec, Score]] = []
+        instrumentation = self.instrumentation
+        for spec in sorted(self.registry, key=lambda spec: spec.cost):
+            if spec.build_score is not None:
+                score = spec.build_score(self)
+            else:
+                check = spec.build(self)
+                score = None if check is None else _score_of(check)
+            if score is None:
+                continue
+            if instrumentation is not None:
+                score = instrumentation.wrap(spec.name, score)
+            steps.append((spec, score))
+
+        plan = []
+        min_rest = sum(spec.min_score for spec, _ in steps)
+        max_rest = sum(spec.max_score for spec, _ in steps)
+        max_score = max_rest
+        for spec, score in steps:
+            min_rest -= spec.min_score
+            max_rest -= spec.max_score
+            plan.append((score, min_rest, max_rest))
+        return plan, max_score
+
+    def _timed_profile(self, password: PasswordInput) -> PasswordProfile:
+        from .instrument import PROFILE_STEP
+
+        start = time.perf_counter_ns()
+        profile = build_profile(password)
+        self.instrumentation.histogram(PROFILE_STEP).record(time.perf_counter_ns() - start)
+        return profile
+
+    def _run(self, password: PasswordInput, pipeline: list[Check]) -> AnalysisResult:
+        if self.instrumentation is None:
+            profile = build_profile(password)
+        else:
+            profile = self._timed_profile(password)
+        checks = [check(profile) for check in pipeline]
+        return self._aggregate(profile.password, profile.entropy_bits, checks)
 
-        checks = [
-            check_length(password),
-            check_character_variety(password),
-            check_common_password(password),
-            check_sequential_characters(password),
-            check_entropy(entropy_bits),
-        ]
+    def _cached(self, password: PasswordInput) -> AnalysisResult | None:
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.key(password))
 
+    def _label(
+        self, password: PasswordInput, plan: list[tuple[Score, float, float]], max_score: float,
+    ) -> str:
+        cached = self._cached(password)
+        if cached is not None:
+            return cached.strength
+        if self.instrumentation is None:
+            profile = build_profile(password)
+        else:
+            profile = self._timed_profile(password)
+        raw = 0.0
+        label = _label_for(raw, max_score)
+        for score, min_rest, max_rest in plan:
+            raw += score(profile)
+            label = _label_for(raw + min_rest, max_score)
+            if label == _label_for(raw + max_rest, max_score):
+                break
+        return label
+
+    def _meets(
+        self,
+        password: PasswordInput,
+        min_score: int,
+        plan: list[tuple[Score, float, float]],
+        max_score: float,
+    ) -> bool:
+        cached = self._cached(password)
+        if cached is not None:
+            return cached.score >= min_score
+        if min_score <= 0:
+            return True
+        if min_score > 100:
+            return False
+        if self.instrumentation is None:
+            profile = build_profile(password)
+        else:
+            profile = self._timed_profile(password)
+        raw = 0.0
+        for score, min_rest, max_rest in plan:
+            raw += score(profile)
+            if normalize_score(raw + min_rest, max_score) >= min_score:
+                return True
+            if normalize_score(raw + max_rest, max_score) < min_score:
+                return False
+        return normalize_score(raw, max_score) >= min_score
+
+    def _aggregate(
+        self, password: str, entropy_bits: float, checks: list[CheckResult],
+    ) -> AnalysisResult:
+        """Combine check results into the scored ``AnalysisResult``."""
         raw_score = sum(c.score for c in checks)
         max_score = sum(c.max_score for c in checks)
         score = normalize_score(raw_score, max_score)
         strength, color = get_strength_label(score)
-
-        feedback: list[str] = []
-        for check in checks:
-            feedback.extend(check.feedback)
-
         return AnalysisResult(
             password_length=len(password),
             score=score,
@@ -60,5 +215,56 @@ class PasswordAnalyzer:
             strength_color=color,
             entropy_bits=entropy_bits,
             checks=checks,
-            feedback=feedback,
         )
+
+    def _run_cached(self, password: PasswordInput, pipeline: list[Check]) -> AnalysisResult:
+        cache = self.cache
+        if cache is None:
+            return self._run(password, pipeline)
+        key = cache.key(password)
+        result = cache.get(key)
+        if result is None:
+            result = self._run(password, pipeline)
+            cache.put(key, result)
+        return result
+
+    def analyze(self, password: PasswordInput) -> AnalysisResult:
+        """Run all checks and return an aggregated result."""
+        return self._run_cached(password, self._pipeline())
+
+    def strength(self, password: PasswordInput) -> str:
+        """Return only the strength label, in score-only mode.
+
+        Checks run cheapest first, and evaluation stops as soon as the
+        remaining checks' score ranges can no longer change the label. The
+        label always matches ``analyze(password).strength``.
+        """
+        return self._label(password, *self._score_plan())
+
+    def meets(self, password: PasswordInput, min_score: int) -> bool:
+        """Return whether ``password`` scores at least ``min_score`` (0-100).
+
+        A score-only gate: checks run cheapest first without building
+        feedback, and evaluation stops as soon as the running lower and
+        upper score bounds settle the answer. The answer always equals
+        ``analyze(password).score >= min_score``. Use ``STRENGTH_THRESHOLDS``
+        from ``scoring`` to gate on a label, e.g. at least "Strong".
+        """
+        return self._meets(password, min_score, *self._score_plan())
+
+    def meets_many(self, passwords: Iterable[PasswordInput], min_score: int) -> Iterator[bool]:
+        """Gate passwords lazily like ``meets``, sharing setup across the batch."""
+        plan, max_score = self._score_plan()
+        for password in passwords:
+            yield self._meets(password, min_score, plan, max_score)
+
+    def analyze_many(self, passwords: Iterable[PasswordInput]) -> Iterator[AnalysisResult]:
+        """Analyze passwords lazily, yielding one result per input.
+
+        The check pipeline is set up once for the whole batch and results are
+        produced one at a time, so memory use does not grow with the input.
+        """
+        pipeline = self._pipeline()
+        run = self._run if self.cache is None else self._run_cached
+        for password in passwords:
+            yield run(password, pipeline)
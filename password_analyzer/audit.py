@@ -0,0 +1,115 @@
+"""Bulk password auditing: newline-delimited input, one record per password."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+from .analyzer import AnalysisResult, PasswordAnalyzer
+from .options import FORMATS
+
+FIELDS = ("line", "length", "score", "strength", "entropy_bits")
+
+# Records are joined and written in batches of this many lines.
+WRITE_BATCH = 4096
+
+_SEPARATORS = {"csv": ",", "tsv": "\t"}
+
+
+def read_passwords(
+    lines: Iterable[bytes], first_line: int = 1,
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(line_number, password)`` for each non-empty input line.
+
+    Input is raw bytes; line endings are stripped and undecodable bytes are
+    replaced rather than aborting the audit.
+    """
+    for number, raw in _read_lines(lines, first_line):
+        yield number, raw.decode("utf-8", errors="replace")
+
+
+def _read_lines(lines: Iterable[bytes], first_line: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(line_number, line)`` for each non-empty line, still undecoded."""
+    for number, raw in enumerate(lines, first_line):
+        raw = raw.rstrip(b"\r\n")
+        if raw:
+            yield number, raw
+
+
+def format_header(fmt: str) -> str | None:
+    """Return the header line for ``fmt``, or None if it has none."""
+    if fmt == "jsonl":
+        return None
+    return _SEPARATORS[fmt].join(FIELDS) + "\n"
+
+
+def format_record(line: int, result: AnalysisResult, fmt: str) -> str:
+    """Render one audit record, including the trailing newline."""
+    entropy = round(result.entropy_bits, 2)
+    if fmt == "jsonl":
+        return json.dumps({
+            "line": line,
+            "length": result.password_length,
+            "score": result.score,
+            "strength": result.strength,
+            "entropy_bits": entropy,
+        }) + "\n"
+    return _SEPARATORS[fmt].join((
+        str(line), str(result.password_length), str(result.score),
+        result.strength, f"{entropy:.2f}",
+    )) + "\n"
+
+
+def check_format(fmt: str) -> None:
+    """Raise ValueError if ``fmt`` is not a supported record format."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+
+
+def iter_records(
+    lines: Iterable[bytes],
+    fmt: str,
+    analyzer: PasswordAnalyzer,
+    first_line: int = 1,
+) -> Iterator[str]:
+    """Analyze each password in ``lines`` and yield its formatted record.
+
+    Lines go to the analyzer as bytes, so ASCII passwords are never decoded
+    up front; decoding matches ``read_passwords``.
+    """
+    numbered, passwords = itertools.tee(_read_lines(lines, first_line))
+    results = analyzer.analyze_many(password for _, password in passwords)
+    for (line, _), result in zip(numbered, results):
+        yield format_record(line, result, fmt)
+
+
+def audit(
+    lines: Iterable[bytes],
+    out: TextIO,
+    fmt: str = "jsonl",
+    analyzer: PasswordAnalyzer | None = None,
+) -> int:
+    """Analyze every password in ``lines`` and write one record each to ``out``.
+
+    Returns the number of passwords analyzed.
+    """
+    check_format(fmt)
+    if analyzer is None:
+        analyzer = PasswordAnalyzer()
+
+    header = format_header(fmt)
+    if header is not None:
+        out.write(header)
+
+    count = 0
+    batch: list[str] = []
+    for record in iter_records(lines, fmt, analyzer):
+        batch.append(record)
+        if len(batch) >= WRITE_BATCH:
+            out.write("".join(batch))
+            batch.clear()
+        count += 1
+    out.write("".join(batch))
+    return count
@@ -0,0 +1,104 @@
+"""Aho-Corasick automaton for multi-pattern substring matching."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """Finds every occurrence of a fixed set of words in a single linear scan.
+
+    The automaton is built once from the word set and can then be reused for
+    any number of searches. Each search walks the text exactly once, so the
+    cost is independent of the dictionary size.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._depth: list[int] = [0]
+        self._terminal: list[bool] = [False]
+
+        for word in words:
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._depth.append(self._depth[state] + 1)
+                    self._terminal.append(False)
+                state = nxt
+            self._terminal[state] = True
+
+        self._fail: list[int] = [0] * len(self._goto)
+        # Lengths of all words ending at each state, longest first. Words
+        # reached through failure links are suffixes of the state's own
+        # string, so they are always shorter than a word ending at the state.
+        self._outputs: list[tuple[int, ...]] = [()] * len(self._goto)
+
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            own = (self._depth[state],) if self._terminal[state] else ()
+            self._outputs[state] = own + self._outputs[self._fail[state]]
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                queue.append(child)
+
+    def __len__(self) -> int:
+        """Return the number of states in the automaton."""
+        return len(self._goto)
+
+    def trie_step(self, state: int, char: str) -> tuple[int, bool] | None:
+        """Follow the trie edge for ``char`` out of ``state``, if there is one.
+
+        Returns the next state and whether a word ends there. Unlike a
+        search step this never follows failure links, so callers can walk
+        the automaton as a plain trie from state 0.
+        """
+        child = self._goto[state].get(char)
+        if child is None:
+            return None
+        return child, self._terminal[child]
+
+    def _step(self, state: int, char: str) -> int:
+        goto = self._goto
+        fail = self._fail
+        while state and char not in goto[state]:
+            state = fail[state]
+        return goto[state].get(char, 0)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, end)`` spans of every dictionary word in ``text``."""
+        state = 0
+        outputs = self._outputs
+        for end, char in enumerate(text, 1):
+            state = self._step(state, char)
+            for length in outputs[state]:
+                yield end - length, end
+
+    def longest_match(self, text: str) -> str | None:
+        """Return the longest dictionary word occurring in ``text``.
+
+        Ties are broken in favour of the earliest occurrence.
+        """
+        state = 0
+        outputs = self._outputs
+        best_length = 0
+        best_end = 0
+        for end, char in enumerate(text, 1):
+            state = self._step(state, char)
+            found = outputs[state]
+            if found and found[0] > best_length:
+                best_length = found[0]
+                best_end = end
+        if not best_length:
+            return None
+        return text[best_end - best_length:best_end]
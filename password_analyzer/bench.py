@@ -0,0 +1,306 @@
+"""Benchmark suite for the checks, the analyzer and the generator.
+
+Every run scores the same seeded corpora, so results are comparable across
+commits. Each target is timed call by call and its throughput and p50/p99
+latency are reported per corpus. Results can be saved as a JSON baseline
+and later compared against it to catch regressions::
+
+    password-analyzer bench --save baseline.json
+    password-analyzer bench --compare baseline.json --threshold 10
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import os
+import platform
+import random
+import string
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .analyzer import PasswordAnalyzer
+from .checks import (
+    KEYBOARD_PATTERNS,
+    check_character_variety,
+    check_common_password,
+    check_entropy,
+    check_length,
+    check_sequential_characters,
+    default_wordlist,
+)
+from .common_passwords import COMMON_PASSWORDS
+from .entropy import calculate_entropy
+from .generator import generate_password
+from .guesses import estimate_guesses
+
+BASELINE_VERSION = 1
+DEFAULT_SIZE = 1000
+DEFAULT_REPEAT = 3
+DEFAULT_SEED = 0
+# Throughput drop, as a fraction of the baseline, reported as a regression.
+DEFAULT_THRESHOLD = 0.10
+
+_SYMBOLS = "!@#$%^&*()-_=+[]{}|;:,.<>?"
+_UNICODE = "äöüßéèêñçøåłžšđπλΩждяשאحب日本語中文한글😀🔒"
+# Sorted so seeded picks do not depend on set iteration order.
+_COMMON_WORDS = sorted(COMMON_PASSWORDS)
+
+
+def _short_ascii(rng: random.Random) -> str:
+    alphabet = string.ascii_letters + string.digits + _SYMBOLS
+    return "".join(rng.choices(alphabet, k=rng.randint(4, 8)))
+
+
+def _long_ascii(rng: random.Random) -> str:
+    alphabet = string.ascii_letters + string.digits + _SYMBOLS
+    return "".join(rng.choices(alphabet, k=rng.randint(24, 64)))
+
+
+def _unicode(rng: random.Random) -> str:
+    alphabet = string.ascii_letters + string.digits + _UNICODE
+    return "".join(rng.choices(alphabet, k=rng.randint(8, 24)))
+
+
+def _common(rng: random.Random) -> str:
+    word = rng.choice(_COMMON_WORDS)
+    variant = rng.randrange(4)
+    if variant == 1:
+        word = word.capitalize()
+    elif variant == 2:
+        word += str(rng.randint(0, 9999))
+    elif variant == 3:
+        word = rng.choice(_SYMBOLS) + word + rng.choice(_SYMBOLS)
+    return word
+
+
+def _random(rng: random.Random) -> str:
+    alphabet = string.ascii_letters + string.digits + _SYMBOLS
+    return "".join(rng.choices(alphabet, k=rng.randint(12, 20)))
+
+
+def _patterns(rng: random.Random) -> str:
+    pieces = []
+    for _ in range(rng.randint(2, 4)):
+        kind = rng.randrange(4)
+        if kind == 0:
+            start = rng.randrange(24)
+            pieces.append(string.ascii_lowercase[start:start + rng.randint(3, 5)])
+        elif kind == 1:
+            start = rng.randrange(7)
+            pieces.append("0123456789"[start:start + 3][::rng.choice((1, -1))])
+        elif kind == 2:
+            pieces.append(rng.choice(KEYBOARD_PATTERNS))
+        else:
+            pieces.append(rng.choice(string.ascii_letters + string.digits) * rng.randint(3, 5))
+    return "".join(pieces)
+
+
+# Corpus name -> generator of one password from a seeded RNG.
+CORPORA: dict[str, Callable[[random.Random], str]] = {
+    "short-ascii": _short_ascii,
+    "long-ascii": _long_ascii,
+    "unicode": _unicode,
+    "common": _common,
+    "random": _random,
+    "patterns": _patterns,
+}
+
+
+def make_corpus(kind: str, size: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED) -> list[str]:
+    """Return ``size`` passwords of corpus ``kind``; the same seed gives the same list."""
+    if kind not in CORPORA:
+        raise ValueError(f"Unknown corpus {kind!r}; expected one of {', '.join(CORPORA)}.")
+    rng = random.Random(f"{kind}:{seed}")
+    return [CORPORA[kind](rng) for _ in range(size)]
+
+
+# Functions that can be benchmarked, in report order.
+TARGETS = (
+    "check_length",
+    "check_character_variety",
+    "check_common_password",
+    "check_sequential_characters",
+    "check_entropy",
+    "calculate_entropy",
+    "estimate_guesses",
+    "analyze",
+    "generate_password",
+)
+
+# The generator takes no password, so it is timed once, not per corpus.
+GENERATOR_CORPUS = "-"
+
+
+def _targets() -> dict[str, tuple[Callable[[Any], object], Callable[[str], Any] | None]]:
+    """Return target name -> (function, argument preparation or None)."""
+    return {
+        "check_length": (check_length, None),
+        "check_character_variety": (check_character_variety, None),
+        "check_common_password": (check_common_password, None),
+        "check_sequential_characters": (check_sequential_characters, None),
+        "check_entropy": (check_entropy, calculate_entropy),
+        "calculate_entropy": (calculate_entropy, None),
+        "estimate_guesses": (lambda p: estimate_guesses(p, default_wordlist()), None),
+        "analyze": (PasswordAnalyzer().analyze, None),
+        "generate_password": (lambda _: generate_password(), None),
+    }
+
+
+@dataclasses.dataclass
+class BenchResult:
+    """Timing of one target over one corpus."""
+
+    target: str
+    corpus: str
+    calls: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+
+
+@dataclasses.dataclass
+class Comparison:
+    """A result compared against its baseline."""
+
+    target: str
+    corpus: str
+    baseline_ops: float
+    current_ops: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """Relative throughput change; negative means slower."""
+        return self.current_ops / self.baseline_ops - 1 if self.baseline_ops else 0.0
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Return the nearest-rank ``q``-th percentile (0-100) of sorted samples."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def time_target(
+    func: Callable[[Any], object], inputs: list[Any], repeat: int = DEFAULT_REPEAT,
+) -> tuple[int, float, list[float]]:
+    """Call ``func`` on every input ``repeat`` times.
+
+    Returns the number of calls, the total time in seconds and the sorted
+    per-call times in seconds.
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    for _ in range(repeat):
+        for value in inputs:
+            start = clock()
+            func(value)
+            samples.append(clock() - start)
+    samples.sort()
+    return len(samples), sum(samples) / 1e9, [s / 1e9 for s in samples]
+
+
+def run_benchmarks(
+    targets: Iterable[str] = TARGETS,
+    corpora: Iterable[str] = tuple(CORPORA),
+    size: int = DEFAULT_SIZE,
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+) -> list[BenchResult]:
+    """Time each target over each corpus."""
+    available = _targets()
+    targets = list(targets)
+    for name in targets:
+        if name not in available:
+            raise ValueError(f"Unknown target {name!r}; expected one of {', '.join(TARGETS)}.")
+    jobs = [
+        (name, corpus)
+        for corpus in corpora
+        for name in targets
+        if name != "generate_password"
+    ]
+    if "generate_password" in targets:
+        jobs.append(("generate_password", GENERATOR_CORPUS))
+
+    corpus_cache: dict[str, list[str]] = {GENERATOR_CORPUS: [""] * size}
+    results = []
+    for name, corpus in jobs:
+        if corpus not in corpus_cache:
+            corpus_cache[corpus] = make_corpus(corpus, size, seed)
+        func, prepare = available[name]
+        inputs = corpus_cache[corpus]
+        if prepare is not None:
+            inputs = [prepare(p) for p in inputs]
+        if inputs:
+            func(inputs[0])  # warm up caches such as the default word list
+        calls, total, samples = time_target(func, inputs, repeat)
+        results.append(BenchResult(
+            target=name,
+            corpus=corpus,
+            calls=calls,
+            ops_per_sec=round(calls / total, 1) if total else 0.0,
+            p50_us=round(percentile(samples, 50) * 1e6, 3),
+            p99_us=round(percentile(samples, 99) * 1e6, 3),
+        ))
+    return results
+
+
+def save_baseline(results: list[BenchResult], path: str | os.PathLike[str]) -> None:
+    """Write results as a JSON baseline."""
+    data = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "results": [dataclasses.asdict(r) for r in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path: str | os.PathLike[str]) -> list[BenchResult]:
+    """Read a baseline written by ``save_baseline``.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not a baseline of a supported version.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{os.fspath(path)} is not a version {BASELINE_VERSION} baseline")
+    try:
+        return [BenchResult(**r) for r in data["results"]]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{os.fspath(path)} has malformed results") from e
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: list[BenchResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare results with a baseline, matching them by target and corpus.
+
+    A result regresses when its throughput falls more than ``threshold``
+    (a fraction) below the baseline's. Results missing from the baseline
+    are skipped.
+    """
+    previous = {(r.target, r.corpus): r for r in baseline}
+    comparisons = []
+    for result in results:
+        old = previous.get((result.target, result.corpus))
+        if old is None:
+            continue
+        comparisons.append(Comparison(
+            target=result.target,
+            corpus=result.corpus,
+            baseline_ops=old.ops_per_sec,
+            current_ops=result.ops_per_sec,
+            regressed=result.ops_per_sec < old.ops_per_sec * (1 - threshold),
+        ))
+    return comparisons
@@ -0,0 +1,225 @@
+"""Bloom-filter pre-screen for large dictionaries.
+
+Most candidate passwords are not in the breach corpus, so a compact
+approximate-membership filter in front of the exact lookup answers the
+common case with a handful of bit probes. At the default false-positive
+rate the filter costs about one byte per entry.
+
+File layout (all integers little-endian)::
+
+    header  magic "PWBLOOM\\0", format version (u16), hash count (u16),
+            longest entry in characters (u32), bit count (u64),
+            entry count (u64), SHA-256 of the source word list (32 bytes)
+    bits    ``ceil(bit count / 8)`` bytes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .compiled import source_hash
+from .wordlist import WordList, map_file
+
+if TYPE_CHECKING:
+    from .fuzzy import DeletionIndex
+
+MAGIC = b"PWBLOOM\0"
+FORMAT_VERSION = 1
+DEFAULT_FP_RATE = 0.02
+
+_HEADER = struct.Struct("<8sHHIQQ32s")
+
+
+def optimal_parameters(entries: int, fp_rate: float) -> tuple[int, int]:
+    """Return ``(bit_count, hash_count)`` for a target false-positive rate."""
+    if not 0 < fp_rate < 1:
+        raise ValueError("False-positive rate must be between 0 and 1.")
+    entries = max(entries, 1)
+    bits = math.ceil(-entries * math.log(fp_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / entries * math.log(2)))
+    return max(bits, 8), hashes
+
+
+def _key(word: str) -> bytes:
+    # Lone surrogates (from JSON or undecodable argv) must not crash a lookup.
+    return word.encode("utf-8", errors="surrogatepass")
+
+
+def _probes(key: bytes, hashes: int, bits: int) -> Iterable[int]:
+    # Double hashing: two 64-bit halves of one digest generate all probes.
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return ((h1 + i * h2) % bits for i in range(hashes))
+
+
+class BloomFilter:
+    """A Bloom filter over lowercased UTF-8 entries.
+
+    Filters are built in memory with ``add`` and ``save``d to disk;
+    ``load`` memory-maps a saved filter instead of reading it.
+    """
+
+    def __init__(
+        self,
+        bit_count: int,
+        hash_count: int,
+        bits: bytes | bytearray | None = None,
+        entry_count: int = 0,
+        max_length: int = 0,
+        content_hash: str = "",
+    ) -> None:
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.entry_count = entry_count
+        self.max_length = max_length
+        self.content_hash = content_hash
+        self._bits = bits if bits is not None else bytearray((bit_count + 7) // 8)
+        self._offset = 0
+
+    @classmethod
+    def for_capacity(cls, entries: int, fp_rate: float = DEFAULT_FP_RATE) -> BloomFilter:
+        """Create an empty filter sized for ``entries`` at ``fp_rate``."""
+        return cls(*optimal_parameters(entries, fp_rate))
+
+    def add(self, word: str) -> None:
+        """Insert a (lowercased) entry."""
+        bits = self._bits
+        for pos in _probes(_key(word), self.hash_count, self.bit_count):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.entry_count += 1
+        self.max_length = max(self.max_length, len(word))
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        bits, offset = self._bits, self._offset
+        for pos in _probes(_key(word), self.hash_count, self.bit_count):
+            if not bits[offset + (pos >> 3)] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def save(self, path: str | os.PathLike[str]) -> int:
+        """Write the filter to ``path``; returns the file size in bytes."""
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.hash_count, self.max_length,
+            self.bit_count, self.entry_count,
+            bytes.fromhex(self.content_hash) if self.content_hash else bytes(32),
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self._bits)
+        return len(header) + len(self._bits)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> BloomFilter:
+        """Memory-map a saved filter."""
+        data = map_file(path)
+        try:
+            if len(data) < _HEADER.size:
+                raise ValueError(f"{os.fspath(path)}: file too short")
+            (magic, version, hash_count, max_length, bit_count, entry_count,
+             digest) = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{os.fspath(path)}: not a Bloom filter")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{os.fspath(path)}: unsupported format version {version}")
+            if len(data) < _HEADER.size + (bit_count + 7) // 8:
+                raise ValueError(f"{os.fspath(path)}: file truncated")
+        except ValueError:
+            close = getattr(data, "close", None)
+            if close is not None:
+                close()
+            raise
+        bloom = cls(
+            bit_count, hash_count, data, entry_count, max_length,
+            digest.hex() if any(digest) else "",
+        )
+        bloom._offset = _HEADER.size
+        return bloom
+
+    def close(self) -> None:
+        """Release the mapping of a loaded filter."""
+        close = getattr(self._bits, "close", None)
+        if close is not None:
+            close()
+
+
+def build_filter(
+    source: str | os.PathLike[str],
+    dest: str | os.PathLike[str],
+    fp_rate: float = DEFAULT_FP_RATE,
+) -> BloomFilter:
+    """Build a filter from a text word list and save it to ``dest``.
+
+    The source is streamed twice (once to size the filter, once to fill
+    it) so the word list never has to fit in memory.
+    """
+    with open(source, "rb") as f:
+        lines = sum(1 for _ in f)
+    bloom = BloomFilter.for_capacity(lines, fp_rate)
+    with open(source, "rb") as f:
+        for raw in f:
+            try:
+                word = raw.decode("utf-8").strip().lower()
+            except UnicodeDecodeError:
+                continue
+            if word:
+                bloom.add(word)
+    bloom.content_hash = source_hash(source)
+    bloom.save(dest)
+    return bloom
+
+
+class FilteredWordList(WordList):
+    """A word list fronted by a Bloom filter.
+
+    Every lookup consults the filter first and only reaches the exact
+    backend on a (possibly false) positive. Substring probes are limited to
+    the longest entry length recorded in the filter.
+    """
+
+    def __init__(self, bloom: BloomFilter, wordlist: WordList) -> None:
+        expected = getattr(wordlist, "content_hash", "")
+        if bloom.content_hash and expected and bloom.content_hash != expected:
+            raise ValueError("Bloom filter was built from a different word list.")
+        self.bloom = bloom
+        self.wordlist = wordlist
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.bloom and word in self.wordlist
+
+    def longest_substring(self, text: str, min_length: int) -> str | None:
+        longest = min(len(text), self.bloom.max_length)
+        for length in range(longest, min_length - 1, -1):
+            for start in range(len(text) - length + 1):
+                candidate = text[start:start + length]
+                if candidate in self:
+                    return candidate
+        return None
+
+    def matches(self, text: str, min_length: int) -> Iterator[tuple[int, int]]:
+        longest = self.bloom.max_length
+        for start in range(len(text) - min_length + 1):
+            for end in range(start + min_length, min(len(text), start + longest) + 1):
+                if text[start:end] in self:
+                    yield start, end
+
+    def trie_root(self) -> Hashable:
+        return self.wordlist.trie_root()
+
+    def trie_step(self, node: Hashable, char: str) -> tuple[Hashable, bool] | None:
+        # The filter cannot answer prefix queries, so walk the backend.
+        return self.wordlist.trie_step(node, char)
+
+    def deletion_index(self, max_distance: int) -> DeletionIndex | None:
+        return self.wordlist.deletion_index(max_distance)
+
+    def close(self) -> None:
+        self.bloom.close()
+        self.wordlist.close()
@@ -0,0 +1,145 @@
+"""Offline SHA-1 breach index (Have I Been Pwned style dumps).
+
+Hashes are grouped into buckets by their first five hex characters, the
+same k-anonymity prefix the online range API uses. A fixed-size offset
+table maps every prefix to its bucket, so a lookup reads one table entry
+and binary searches one small bucket of the memory-mapped file.
+
+File layout (all integers little-endian)::
+
+    header   magic "PWBREACH", format version (u16), padding,
+             record count (u64)
+    offsets  2**20 + 1 record indices (u64); bucket ``p`` holds records
+             ``offsets[p]`` up to ``offsets[p + 1]``
+    records  bytes 2-19 of the SHA-1 digest followed by the prevalence
+             count (u32), sorted by digest
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import struct
+from collections.abc import Iterable
+
+from .wordlist import map_file
+
+MAGIC = b"PWBREACH"
+FORMAT_VERSION = 1
+PREFIX_BITS = 20
+BUCKETS = 1 << PREFIX_BITS
+
+_HEADER = struct.Struct("<8sH6xQ")
+_OFFSET = struct.Struct("<Q")
+_RECORD = struct.Struct("<18sI")
+_TABLE_SIZE = _OFFSET.size * (BUCKETS + 1)
+_COUNT_MAX = 0xFFFFFFFF
+
+
+def _parse_line(line: str) -> tuple[bytes, int]:
+    """Parse a ``HASH[:COUNT]`` dump line into ``(digest, count)``."""
+    digest_hex, _, count = line.strip().partition(":")
+    digest = bytes.fromhex(digest_hex)
+    if len(digest) != 20:
+        raise ValueError(f"not a SHA-1 hash: {digest_hex!r}")
+    return digest, int(count) if count else 1
+
+
+def convert_dump(
+    lines: Iterable[str], dest: str | os.PathLike[str],
+) -> int:
+    """Convert a hash-sorted ``HASH:COUNT`` dump into an index at ``dest``.
+
+    The dump is streamed, so its size is not limited by memory. Returns the
+    number of records written.
+
+    Raises:
+        ValueError: If a line is malformed or the dump is not sorted by hash.
+    """
+    counts = [0] * (BUCKETS + 1)
+    records = 0
+    previous = b""
+    with open(dest, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0))
+        f.write(bytes(_TABLE_SIZE))
+        for line in lines:
+            if not line.strip():
+                continue
+            digest, count = _parse_line(line)
+            if digest <= previous:
+                raise ValueError("dump must be sorted by hash without duplicates")
+            previous = digest
+            counts[(int.from_bytes(digest[:3], "big") >> 4) + 1] += 1
+            f.write(_RECORD.pack(digest[2:], min(count, _COUNT_MAX)))
+            records += 1
+
+        # Per-bucket counts become starting record indices.
+        offsets = itertools.accumulate(counts)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, records))
+        f.write(struct.pack(f"<{BUCKETS + 1}Q", *offsets))
+    return records
+
+
+def convert_dump_file(
+    source: str | os.PathLike[str], dest: str | os.PathLike[str],
+) -> int:
+    """Convert a dump file on disk; see ``convert_dump``."""
+    with open(source, encoding="ascii") as f:
+        return convert_dump(f, dest)
+
+
+class BreachIndex:
+    """A memory-mapped breach index built by ``convert_dump``."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._data = map_file(self.path)
+        try:
+            if len(self._data) < _HEADER.size + _TABLE_SIZE:
+                raise ValueError(f"{self.path}: file too short")
+            magic, version, self.record_count = _HEADER.unpack_from(self._data, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path}: not a breach index")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{self.path}: unsupported format version {version}")
+        except ValueError:
+            self.close()
+            raise
+        self._records = _HEADER.size + _TABLE_SIZE
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def count_digest(self, digest: bytes) -> int:
+        """Return the prevalence count for a SHA-1 digest (0 if absent)."""
+        prefix = int.from_bytes(digest[:3], "big") >> 4
+        lo, hi = struct.unpack_from("<2Q", self._data, _HEADER.size + 8 * prefix)
+        key = digest[2:]
+        data, base, size = self._data, self._records, _RECORD.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = base + mid * size
+            suffix = data[start:start + 18]
+            if suffix < key:
+                lo = mid + 1
+            elif suffix > key:
+                hi = mid
+            else:
+                return _RECORD.unpack_from(data, start)[1]
+        return 0
+
+    def count(self, password: str) -> int:
+        """Return how many times ``password`` appears in the breach data.
+
+        Text with lone surrogates is hashed with ``surrogatepass``; it can
+        never be in the dump, which holds hashes of valid UTF-8.
+        """
+        data = password.encode("utf-8", errors="surrogatepass")
+        return self.count_digest(hashlib.sha1(data).digest())
+
+    def close(self) -> None:
+        close = getattr(self._data, "close", None)
+        if close is not None:
+            close()
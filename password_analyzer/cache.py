@@ -0,0 +1,129 @@
+"""Bounded, privacy-safe LRU cache of analysis results."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import hashlib
+import hmac
+import secrets
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analyzer import AnalysisResult
+    from .profile import PasswordInput
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def estimate_size(result: AnalysisResult) -> int:
+    """Roughly estimate the memory held by a cached result, in bytes."""
+    size = sys.getsizeof(result) + sys.getsizeof(result.checks)
+    for check in result.checks:
+        size += sys.getsizeof(check) + sys.getsizeof(check.messages)
+        size += sum(sys.getsizeof(m) + sys.getsizeof(m.args) for m in check.messages)
+    return size
+
+
+class ResultCache:
+    """An LRU cache mapping passwords to their ``AnalysisResult``.
+
+    Passwords are never stored: entries are keyed by an HMAC-SHA256 of the
+    password under a random per-process secret, so the cache contents
+    cannot be reversed or correlated across processes.
+
+    Args:
+        max_entries: Maximum number of cached results.
+        max_bytes: Optional budget on the estimated memory held by results.
+        secret: HMAC key; a fresh random key is generated by default.
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        secret: bytes | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._secret = secret if secret is not None else secrets.token_bytes(32)
+        self._entries: collections.OrderedDict[bytes, tuple[AnalysisResult, int]] = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, password: PasswordInput) -> bytes:
+        """Return the keyed hash used in place of ``password``.
+
+        Passwords given as UTF-8 bytes share the key of the same ``str``.
+        """
+        if isinstance(password, str):
+            data = password.encode("utf-8", errors="surrogatepass")
+        else:
+            data = bytes(password)
+        return hmac.new(self._secret, data, hashlib.sha256).digest()
+
+    def get(self, key: bytes) -> AnalysisResult | None:
+        """Return the cached result for ``key`` and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: bytes, result: AnalysisResult) -> None:
+        """Store a result, evicting least recently used entries as needed."""
+        size = estimate_size(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (result, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        return CacheStats(
+            self.hits, self.misses, self.evictions, len(self._entries), self._bytes,
+        )
@@ -3,8 +3,31 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import math
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING
 
-from .common_passwords import COMMON_PASSWORDS
+from .affixes import AffixMatch, strip_affixes
+from .keyboard import find_walks
+from .leet import SUBSTITUTIONS, LeetMatch, leet_matcher
+from .messages import Message, MessageCode
+from .profile import PasswordProfile, build_profile
+from .results import CheckResult
+
+if TYPE_CHECKING:
+    from .breach import BreachIndex
+    from .fuzzy import NearMatch
+    from .guesses import GuessEstimate
+    from .wordlist import MemoryWordList, WordList
+
+# Dictionary words shorter than this are only matched exactly, never as substrings.
+SUBSTRING_MIN_LENGTH = 4
+# Passwords within this many edits of an entry are near misses.
+NEAR_MISS_DISTANCE = 1
+# Near misses get one edit per this many characters, so short passwords
+# are not matched to every short entry nearby.
+NEAR_MISS_CHARS_PER_EDIT = 4
 
 KEYBOARD_PATTERNS: list[str] = [
     "qwerty", "qwertz", "azerty",
@@ -13,118 +36,323 @@ KEYBOARD_PATTERNS: list[str] = [
 ]
 
 
-@dataclasses.dataclass
-class CheckResult:
-    """Result from a single password check."""
+# Feedback without parameters is shared by every result.
+_LENGTH_FEEDBACK = (
+    (Message(MessageCode.LENGTH_TOO_SHORT),),
+    (Message(MessageCode.LENGTH_DECENT),),
+    (Message(MessageCode.LENGTH_GOOD),),
+    (Message(MessageCode.LENGTH_GREAT),),
+)
+_COMMON_PASSWORD = (Message(MessageCode.COMMON_PASSWORD),)
+_NO_PATTERNS = (Message(MessageCode.NO_PATTERNS),)
+_REPEATED = Message(MessageCode.REPEATED)
+_SEQUENTIAL = Message(MessageCode.SEQUENTIAL)
+_REVERSE_SEQUENTIAL = Message(MessageCode.REVERSE_SEQUENTIAL)
+_CLASS_NAMES = ("uppercase letters", "lowercase letters", "digits", "symbols")
+_HAS_CLASS = tuple(Message(MessageCode.HAS_CLASS, (name,)) for name in _CLASS_NAMES)
+_MISSING_CLASS = tuple(Message(MessageCode.MISSING_CLASS, (name,)) for name in _CLASS_NAMES)
 
-    name: str
-    score: float
-    max_score: float
-    feedback: list[str]
 
-
-def check_length(password: str) -> CheckResult:
-    """Score password based on length."""
+def score_length(password: str) -> int:
+    """Return the length check's score without building feedback."""
     length = len(password)
     if length >= 16:
-        return CheckResult("Length", 3, 3, ["Great length (16+ characters)."])
+        return 3
     elif length >= 12:
-        return CheckResult("Length", 2, 3, ["Good length (12-15 characters)."])
+        return 2
     elif length >= 8:
-        return CheckResult("Length", 1, 3, ["Decent length (8-11 characters)."])
-    else:
-        return CheckResult("Length", 0, 3, ["Too short — use at least 8 characters."])
+        return 1
+    return 0
+
 
+def check_length(password: str) -> CheckResult:
+    """Score password based on length."""
+    score = score_length(password)
+    return CheckResult("Length", score, 3, _LENGTH_FEEDBACK[score])
 
-def check_character_variety(password: str) -> CheckResult:
+
+def score_character_variety(
+    password: str, profile: PasswordProfile | None = None,
+) -> int:
+    """Return the character-variety score without building feedback."""
+    if profile is None:
+        profile = build_profile(password)
+    return profile.has_upper + profile.has_lower + profile.has_digit + profile.has_symbol
+
+
+def check_character_variety(
+    password: str, profile: PasswordProfile | None = None,
+) -> CheckResult:
     """Score password based on character class diversity."""
-    score = 0
-    feedback: list[str] = []
+    if profile is None:
+        profile = build_profile(password)
+    present = (profile.has_upper, profile.has_lower, profile.has_digit, profile.has_symbol)
+    messages = tuple(
+        _HAS_CLASS[i] if has else _MISSING_CLASS[i] for i, has in enumerate(present)
+    )
+    return CheckResult("Character variety", sum(present), 4, messages)
+
 
-    classes = [
-        (any(c.isupper() for c in password), "uppercase letters"),
-        (any(c.islower() for c in password), "lowercase letters"),
-        (any(c.isdigit() for c in password), "digits"),
-        (any(not c.isalnum() for c in password), "symbols"),
-    ]
+@functools.lru_cache(maxsize=None)
+def default_wordlist() -> MemoryWordList:
+    """Return the shared word list built from the bundled dictionary.
 
-    for present, name in classes:
-        if present:
-            score += 1
-            feedback.append(f"Contains {name}.")
-        else:
-            feedback.append(f"Add {name}.")
+    The dictionary and word-list machinery are imported on first use so
+    importing the checks stays cheap.
+    """
+    from .common_passwords import COMMON_PASSWORDS
+    from .wordlist import MemoryWordList
 
-    return CheckResult("Character variety", score, 4, feedback)
+    return MemoryWordList(COMMON_PASSWORDS)
 
 
-def check_common_password(password: str) -> CheckResult:
-    """Check if the password appears in a common password dictionary."""
-    lower = password.lower()
+def check_common_password(
+    password: str,
+    wordlist: WordList | None = None,
+    profile: PasswordProfile | None = None,
+    substitutions: Mapping[str, str] | None = None,
+    max_distance: int = NEAR_MISS_DISTANCE,
+) -> CheckResult:
+    """Check if the password appears in a common password dictionary.
 
-    if lower in COMMON_PASSWORDS:
+    Uses the bundled top-100 list unless another ``wordlist`` is given.
+    Entries disguised with leetspeak ("p@ssw0rd") are matched through
+    ``substitutions``, which defaults to ``SUBSTITUTIONS``; pass an
+    empty mapping to match entries only as written. Passwords within
+    ``max_distance`` typos of an entry ("passwprd") count as near misses;
+    pass 0 to turn that off. Entries with only affixes such as years,
+    digits and symbols added ("Summer2024!") score like near misses.
+    """
+    score, found = _common_match(password, wordlist, profile, substitutions, max_distance)
+    if score == -3:
+        return CheckResult("Common password", -3, 0, _COMMON_PASSWORD)
+    if isinstance(found, str):
+        return CheckResult(
+            "Common password", -1, 0, (Message(MessageCode.COMMON_WORD, (found,)),),
+        )
+    if isinstance(found, LeetMatch):
+        code = MessageCode.LEET_PASSWORD if score == -2 else MessageCode.LEET_WORD
+        return CheckResult(
+            "Common password", score, 0, (Message(code, (found.word, found.describe())),),
+        )
+    if isinstance(found, AffixMatch):
+        return CheckResult(
+            "Common password", -2, 0,
+            (Message(MessageCode.AFFIXED_PASSWORD, (found.word, found.describe())),),
+        )
+    if found is not None:
         return CheckResult(
-            "Common password", -3, 0,
-            ["This is an extremely common password — choose something unique."],
+            "Common password", -2, 0,
+            (Message(MessageCode.NEAR_PASSWORD, (found.word, found.distance)),),
         )
+    return CheckResult("Common password", 0, 0)
+
+
+def score_common_password(
+    password: str,
+    wordlist: WordList | None = None,
+    profile: PasswordProfile | None = None,
+    substitutions: Mapping[str, str] | None = None,
+    max_distance: int = NEAR_MISS_DISTANCE,
+) -> int:
+    """Return the common-password score without building feedback."""
+    return _common_match(password, wordlist, profile, substitutions, max_distance)[0]
+
+
+def _common_match(
+    password: str,
+    wordlist: WordList | None,
+    profile: PasswordProfile | None,
+    substitutions: Mapping[str, str] | None,
+    max_distance: int,
+) -> tuple[int, str | LeetMatch | AffixMatch | NearMatch | None]:
+    """Return the common-password score and the dictionary word behind it.
+
+    Exact entries score -3; entries spelled with substitutions, entries
+    with affixes added and near misses score -2. Otherwise the longest
+    entry contained as written, or failing that one contained with
+    substitutions, scores -1.
+    """
+    if wordlist is None:
+        wordlist = default_wordlist()
+    lower = profile.lower if profile is not None else password.lower()
+    if lower in wordlist:
+        return -3, None
+    if substitutions is None:
+        substitutions = SUBSTITUTIONS
+    leet = leet_matcher(wordlist, substitutions) if substitutions else None
+    if leet is not None:
+        disguised = leet.entry(lower)
+        if disguised is not None:
+            return -2, disguised
+    affixed = strip_affixes(lower, wordlist, SUBSTRING_MIN_LENGTH)
+    if affixed is not None:
+        return -2, affixed
+    near = _near_miss(lower, wordlist, max_distance)
+    if near is not None:
+        return -2, near
+    common = wordlist.longest_substring(lower, SUBSTRING_MIN_LENGTH)
+    if common is not None:
+        return -1, common
+    if leet is not None:
+        found = leet.matches(lower, SUBSTRING_MIN_LENGTH)
+        if found:
+            return -1, max(found, key=lambda match: match.end - match.start)
+    return 0, None
+
+
+def _near_miss(lower: str, wordlist: WordList, max_distance: int) -> NearMatch | None:
+    """Return the closest entry a typo or two away from ``lower``.
+
+    Passwords containing a nearby entry as written are left to the
+    substring match: "password1" is a word plus a suffix, not a typo.
+    """
+    distance = min(max_distance, len(lower) // NEAR_MISS_CHARS_PER_EDIT)
+    if distance <= 0:
+        return None
+    index = wordlist.deletion_index(max_distance)
+    if index is None:
+        return None
+    found = index.lookup(lower, distance)
+    if not found or any(near.word in lower for near in found):
+        return None
+    return found[0]
+
+
+def check_breached_password(password: str, index: BreachIndex) -> CheckResult:
+    """Penalize passwords found in an offline breach index.
+
+    The penalty grows with prevalence: -1 for a single sighting, -2 at 100
+    sightings and the full -3 from 10,000 on.
+    """
+    count = index.count(password)
+    if not count:
+        return CheckResult("Breached password", 0, 0)
+    return CheckResult(
+        "Breached password", _breach_score(count), 0,
+        (Message(MessageCode.BREACHED, (count,)),),
+    )
 
-    for common in COMMON_PASSWORDS:
-        if len(common) >= 4 and common in lower:
-            return CheckResult(
-                "Common password", -1, 0,
-                [f"Contains the common word '{common}' — avoid dictionary words."],
-            )
 
-    return CheckResult("Common password", 0, 0, [])
+def score_breached_password(password: str, index: BreachIndex) -> float:
+    """Return the breached-password score without building feedback."""
+    return _breach_score(index.count(password))
 
 
-def check_sequential_characters(password: str) -> CheckResult:
-    """Detect repeated, sequential, and keyboard-pattern characters."""
-    issues: list[str] = []
+def _breach_score(count: int) -> float:
+    if not count:
+        return 0
+    return -round(min(3.0, 1.0 + math.log10(count) / 2), 2)
+
+
+def _pattern_issues(profile: PasswordProfile) -> Iterator[Message]:
+    """Yield a message for each kind of pattern found, lazily."""
+    codepoints = profile.codepoints
 
     # Repeated characters (3+ identical in a row)
-    for i in range(len(password) - 2):
-        if password[i] == password[i + 1] == password[i + 2]:
-            issues.append("Contains repeated characters (e.g., 'aaa').")
+    for i in range(len(codepoints) - 2):
+        if codepoints[i] == codepoints[i + 1] == codepoints[i + 2]:
+            yield _REPEATED
             break
 
     # Sequential runs (3+ ascending or descending ASCII)
-    for i in range(len(password) - 2):
-        a, b, c = ord(password[i]), ord(password[i + 1]), ord(password[i + 2])
+    for i in range(len(codepoints) - 2):
+        a, b, c = codepoints[i], codepoints[i + 1], codepoints[i + 2]
         if b - a == 1 and c - b == 1:
-            issues.append("Contains sequential characters (e.g., 'abc', '123').")
+            yield _SEQUENTIAL
             break
         if a - b == 1 and b - c == 1:
-            issues.append("Contains reverse sequential characters (e.g., 'cba', '321').")
+            yield _REVERSE_SEQUENTIAL
             break
 
     # Keyboard patterns
-    lower = password.lower()
+    lower = profile.lower
+    literal = (0, 0)
     for pattern in KEYBOARD_PATTERNS:
-        if pattern in lower:
-            issues.append(f"Contains keyboard pattern '{pattern}'.")
+        index = lower.find(pattern)
+        if index >= 0:
+            literal = (index, index + len(pattern))
+            yield Message(MessageCode.KEYBOARD_PATTERN, (pattern,))
             break
 
+    # Deliberate keyboard walks other than the literal pattern found above
+    password = profile.password
+    for walk in find_walks(password):
+        if walk.deliberate and (walk.end <= literal[0] or walk.start >= literal[1]):
+            yield Message(
+                MessageCode.KEYBOARD_WALK,
+                (password[walk.start:walk.end], walk.length, walk.layout),
+            )
+
+
+def check_sequential_characters(
+    password: str, profile: PasswordProfile | None = None,
+) -> CheckResult:
+    """Detect repeated, sequential, and keyboard-pattern characters.
+
+    Keyboard patterns include adjacency walks on the layouts in
+    ``keyboard.LAYOUTS``, such as "xsw2" or "poiuy".
+    """
+    if profile is None:
+        profile = build_profile(password)
+    issues = tuple(_pattern_issues(profile))
     if issues:
         return CheckResult("Patterns", 0, 1, issues)
 
-    return CheckResult("Patterns", 1, 1, ["No common patterns detected."])
+    return CheckResult("Patterns", 1, 1, _NO_PATTERNS)
 
 
-def check_entropy(entropy_bits: float) -> CheckResult:
-    """Score based on pre-computed entropy value."""
+def score_sequential_characters(
+    password: str, profile: PasswordProfile | None = None,
+) -> int:
+    """Return the patterns score, stopping at the first pattern found."""
+    if profile is None:
+        profile = build_profile(password)
+    return 0 if next(_pattern_issues(profile), None) is not None else 1
+
+
+# log10 of the guess counts that earn each further point of the guesses check.
+GUESS_THRESHOLDS = (3, 6, 8, 10)
+_GUESS_CODES = (
+    MessageCode.GUESSES_LOW, MessageCode.GUESSES_LOW, MessageCode.GUESSES_MODERATE,
+    MessageCode.GUESSES_HIGH, MessageCode.GUESSES_HIGH,
+)
+
+
+def score_guesses(estimate: GuessEstimate) -> int:
+    """Return the guesses check's score without building feedback."""
+    return sum(estimate.log10 >= threshold for threshold in GUESS_THRESHOLDS)
+
+
+def check_guesses(estimate: GuessEstimate) -> CheckResult:
+    """Score based on a pattern-aware guess estimate (see ``guesses``).
+
+    Unlike ``check_entropy``, which assumes random characters, this scores
+    how many guesses the cheapest mix of dictionary words, keyboard walks,
+    repeats, sequences, dates and brute force needs.
+    """
+    score = score_guesses(estimate)
+    return CheckResult(
+        "Guesses", score, len(GUESS_THRESHOLDS),
+        (Message(_GUESS_CODES[score], (estimate.log10,)),),
+    )
+
+
+_ENTROPY_CODES = (
+    MessageCode.ENTROPY_LOW, MessageCode.ENTROPY_MODERATE, MessageCode.ENTROPY_GOOD,
+)
+
+
+def score_entropy(entropy_bits: float) -> int:
+    """Return the entropy check's score without building feedback."""
     if entropy_bits >= 50:
-        return CheckResult(
-            "Entropy", 2, 2,
-            [f"Good entropy ({entropy_bits:.1f} bits)."],
-        )
+        return 2
     elif entropy_bits >= 28:
-        return CheckResult(
-            "Entropy", 1, 2,
-            [f"Moderate entropy ({entropy_bits:.1f} bits)."],
-        )
-    else:
-        return CheckResult(
-            "Entropy", 0, 2,
-            [f"Low entropy ({entropy_bits:.1f} bits) — use a longer, more varied password."],
-        )
+        return 1
+    return 0
+
+
+def check_entropy(entropy_bits: float) -> CheckResult:
+    """Score based on pre-computed entropy value."""
+    score = score_entropy(entropy_bits)
+    return CheckResult("Entropy", score, 2, (Message(_ENTROPY_CODES[score], (entropy_bits,)),))
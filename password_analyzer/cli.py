@@ -1,12 +1,26 @@
-"""Command-line interface for the password analyzer."""
+"""Command-line interface for the password analyzer.
+
+Only what every invocation needs is imported at module level; dictionaries,
+the daemon client, subcommands and their dependencies are imported by the
+code paths that use them, to keep start-up fast for single-password runs.
+"""
+
+from __future__ import annotations
 
 import argparse
-import getpass
+import functools
 import os
 import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .generator import DEFAULT_LENGTH
+from .options import FORMATS, ORDERS
+from .scoring import get_strength_label
 
-from .analyzer import AnalysisResult, PasswordAnalyzer
-from .generator import DEFAULT_LENGTH, generate_password
+if TYPE_CHECKING:
+    from .analyzer import AnalysisResult, PasswordAnalyzer
+    from .instrument import Instrumentation
 
 COLORS = {
     "red": "\033[91m",
@@ -32,16 +46,7 @@ def build_score_bar(score: int, width: int = 30) -> str:
     """Build a visual score bar like [========------] 80/100."""
     filled = round(score / 100 * width)
     empty = width - filled
-
-    if score >= 76:
-        bar_color = "bright_green"
-    elif score >= 51:
-        bar_color = "green"
-    elif score >= 26:
-        bar_color = "yellow"
-    else:
-        bar_color = "red"
-
+    _, bar_color = get_strength_label(score)
     bar = colorize("=" * filled, bar_color) + colorize("-" * empty, "dim")
     return f"[{bar}] {score}/100"
 
@@ -68,13 +73,9 @@ def print_result(result: AnalysisResult, verbose: bool = False) -> None:
             print(f"  {check.name:<22} {score_str:>7}  {detail}")
         print()
 
-    suggestions = [f for f in result.feedback if any(
-        word in f.lower() for word in ["add ", "too ", "low entropy", "extremely common",
-                                        "common word", "contains repeated",
-                                        "contains sequential", "contains reverse",
-                                        "contains keyboard"]
-    )]
-    positives = [f for f in result.feedback if f not in suggestions]
+    messages = result.messages
+    suggestions = [str(m) for m in messages if m.is_suggestion]
+    positives = [str(m) for m in messages if not m.is_suggestion]
 
     if positives:
         print(f"  {colorize('Strengths:', 'green')}")
@@ -89,8 +90,525 @@ def print_result(result: AnalysisResult, verbose: bool = False) -> None:
         print()
 
 
+def add_analyzer_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the dictionary and breach-index options shared by several commands."""
+    parser.add_argument(
+        "--wordlist",
+        metavar="PATH",
+        help="Check against a word list (text or compiled) instead of the bundled top-100.",
+    )
+    parser.add_argument(
+        "--filter",
+        metavar="PATH",
+        help="Bloom filter (from build-filter) to consult before dictionary lookups.",
+    )
+    parser.add_argument(
+        "--breach-index",
+        metavar="PATH",
+        help="Offline SHA-1 breach index (from build-breach-index) to check against.",
+    )
+
+
+def open_analyzer(
+    wordlist: str | None = None,
+    filter: str | None = None,
+    breach_index: str | None = None,
+) -> PasswordAnalyzer:
+    """Create an analyzer from on-disk dictionary, filter and breach index paths.
+
+    Raises:
+        OSError: If a file cannot be opened.
+        ValueError: If a file is not in the expected format.
+    """
+    from .analyzer import PasswordAnalyzer
+
+    words = index = None
+    if wordlist is not None:
+        from .compiled import load_wordlist
+
+        words = load_wordlist(wordlist)
+    if filter is not None:
+        from .bloom import BloomFilter, FilteredWordList
+        from .checks import default_wordlist
+
+        words = FilteredWordList(BloomFilter.load(filter), words or default_wordlist())
+    if breach_index is not None:
+        from .breach import BreachIndex
+
+        index = BreachIndex(breach_index)
+    return PasswordAnalyzer(wordlist=words, breach_index=index)
+
+
+def analyzer_factory(args: argparse.Namespace) -> Callable[[], PasswordAnalyzer]:
+    """Return a picklable factory for the analyzer described by ``args``."""
+    return functools.partial(
+        open_analyzer, args.wordlist, args.filter, args.breach_index,
+    )
+
+
+def build_analyzer(args: argparse.Namespace) -> PasswordAnalyzer:
+    """Create an analyzer configured from parsed command-line options."""
+    try:
+        return analyzer_factory(args)()
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot load analyzer data: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def print_timings(instrumentation: Instrumentation) -> None:
+    """Print the per-check timing breakdown to stderr."""
+    timings = instrumentation.report()
+    total = sum(t.total_ms for t in timings) or 1.0
+    err = sys.stderr
+    print(file=err)
+    print("  Per-check timings:", file=err)
+    print(f"  {'Check':<20} {'Calls':>9} {'Total ms':>10} {'Mean us':>9} "
+          f"{'p50 us':>8} {'p99 us':>8} {'Max us':>9} {'Share':>6}", file=err)
+    print(f"  {'-' * 86}", file=err)
+    for t in timings:
+        print(f"  {t.name:<20} {t.calls:>9,} {t.total_ms:>10.2f} {t.mean_us:>9.2f} "
+              f"{t.p50_us:>8.2f} {t.p99_us:>8.2f} {t.max_us:>9.2f} "
+              f"{t.total_ms / total:>6.1%}", file=err)
+    print(file=err)
+
+
+def analyze_password(args: argparse.Namespace, password: str) -> AnalysisResult:
+    """Analyze through a running daemon if there is one, else in-process."""
+    if args.profile:
+        from .instrument import Instrumentation
+
+        analyzer = build_analyzer(args)
+        analyzer.instrumentation = Instrumentation()
+        result = analyzer.analyze(password)
+        print_timings(analyzer.instrumentation)
+        return result
+    if not args.no_daemon:
+        from .daemon import absolute_config, remote_analyze
+
+        config = absolute_config(args.wordlist, args.filter, args.breach_index)
+        result = remote_analyze(password, config)
+        if result is not None:
+            return result
+    return build_analyzer(args).analyze(password)
+
+
+def build_dict_main(argv: list[str]) -> None:
+    """Entry point for ``password-analyzer build-dict``."""
+    from .compiled import CompiledWordList, cache_dir, cached_compile, compile_wordlist
+    from .fuzzy import MAX_DISTANCE
+
+    parser = argparse.ArgumentParser(
+        prog="password-analyzer build-dict",
+        description="Compile a text word list into a binary dictionary.",
+    )
+    parser.add_argument("source", help="Text word list, one entry per line.")
+    parser.add_argument(
+        "--output", "-o",
+        metavar="PATH",
+        help=f"Where to write the dictionary (default: the cache in {cache_dir()}).",
+    )
+    parser.add_argument(
+        "--near-miss-distance",
+        type=int,
+        choices=range(MAX_DISTANCE + 1),
+        default=0,
+        metavar="EDITS",
+        help="Also build the index that lets analysis flag passwords within this "
+             "many typos of an entry (default: 0, no index).",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.output is None:
+            info = cached_compile(args.source)
+        else:
+            info = compile_wordlist(args.source, args.output)
+        index = None
+        if args.near_miss_distance:
+            with CompiledWordList(info.path) as words:
+                index = words.build_deletion_index(args.near_miss_distance)
+                keys = len(index)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot build dictionary: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Compiled {info.word_count:,} entries into {info.path}")
+    print(f"  Size:   {info.size:,} bytes")
+    print(f"  SHA-256 of source: {info.content_hash}")
+    if info.skipped:
+        print(f"  Skipped {info.skipped:,} lines that are not valid UTF-8")
+    if index is not None:
+        print(f"  Near-miss index: {keys:,} keys in {index.path}")
+
+
+def build_filter_main(argv: list[str]) -> None:
+    """Entry point for ``password-analyzer build-filter``."""
+    from .bloom import DEFAULT_FP_RATE, build_filter
+
+    parser = argparse.ArgumentParser(
+        prog="password-analyzer build-filter",
+        description="Build a Bloom-filter pre-screen from a text word list.",
+    )
+    parser.add_argument("source", help="Text word list, one entry per line.")
+    parser.add_argument(
+        "--output", "-o",
+        metavar="PATH",
+        required=True,
+        help="Where to write the filter.",
+    )
+    parser.add_argument(
+        "--fp-rate",
+        type=float,
+        default=DEFAULT_FP_RATE,
+        metavar="RATE",
+        help=f"Target false-positive rate (default: {DEFAULT_FP_RATE}).",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        bloom = build_filter(args.source, args.output, args.fp_rate)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot build filter: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    size = (bloom.bit_count + 7) // 8
+    print(f"Built filter over {bloom.entry_count:,} entries into {args.output}")
+    print(f"  Size:   {size:,} bytes ({size / max(bloom.entry_count, 1):.2f} per entry)")
+    print(f"  Hashes: {bloom.hash_count}")
+
+
+def build_breach_index_main(argv: list[str]) -> None:
+    """Entry point for ``password-analyzer build-breach-index``."""
+    from .breach import convert_dump_file
+
+    parser = argparse.ArgumentParser(
+        prog="password-analyzer build-breach-index",
+        description="Convert a hash-sorted SHA-1 breach dump (HASH:COUNT lines) "
+                    "into a prefix-bucketed index.",
+    )
+    parser.add_argument("source", help="Breach dump sorted by hash.")
+    parser.add_argument(
+        "--output", "-o",
+        metavar="PATH",
+        required=True,
+        help="Where to write the index.",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        records = convert_dump_file(args.source, args.output)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot build breach index: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Indexed {records:,} hashes into {args.output}")
+
+
+# Buffer size for bulk audit input and output files.
+IO_BUFFER_SIZE = 1 << 20
+
+
+def run_audit(args: argparse.Namespace) -> None:
+    """Audit every password in ``--input`` and write one record per line."""
+    from .audit import audit
+    from .parallel import parallel_audit
+
+    if args.jobs < 0:
+        print("Error: --jobs must be 0 or more.", file=sys.stderr)
+        sys.exit(1)
+    if args.jobs != 1 and args.input == "-":
+        print("Error: --jobs needs a file for --input, not stdin.", file=sys.stderr)
+        sys.exit(1)
+    if args.jobs != 1 and args.profile:
+        print("Error: --profile needs --jobs 1.", file=sys.stderr)
+        sys.exit(1)
+
+    # Fail fast on bad dictionary options before spawning any workers.
+    analyzer = build_analyzer(args)
+    if args.profile:
+        from .instrument import Instrumentation
+
+        analyzer.instrumentation = Instrumentation()
+
+    try:
+        if args.input == "-":
+            source = sys.stdin.buffer
+        else:
+            source = open(args.input, "rb", buffering=IO_BUFFER_SIZE)
+        if args.output is None:
+            out = sys.stdout
+        else:
+            out = open(
+                args.output, "w", encoding="utf-8", newline="",
+                buffering=IO_BUFFER_SIZE,
+            )
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        if args.jobs == 1:
+            audit(source, out, args.format, analyzer)
+        else:
+            parallel_audit(
+                args.input, out, args.format,
+                make_analyzer=analyzer_factory(args),
+                jobs=args.jobs or None,
+                order=args.order,
+            )
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+    if analyzer.instrumentation is not None:
+        print_timings(analyzer.instrumentation)
+
+
+def serve_main(argv: list[str]) -> None:
+    """Entry point for ``password-analyzer serve``."""
+    from .server import DEFAULT_HOST, DEFAULT_MAX_BATCH, DEFAULT_MAX_WAIT, DEFAULT_PORT, serve
+
+    parser = argparse.ArgumentParser(
+        prog="password-analyzer serve",
+        description="Run a local HTTP scoring service (POST /score, GET /stats).",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help=f"Address to listen on (default: {DEFAULT_HOST}).",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"TCP port to listen on (default: {DEFAULT_PORT}).",
+    )
+    parser.add_argument(
+        "--unix",
+        metavar="PATH",
+        help="Listen on a Unix domain socket instead of TCP.",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        metavar="N",
+        help=f"Most requests analyzed per batch (default: {DEFAULT_MAX_BATCH}).",
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=DEFAULT_MAX_WAIT * 1000,
+        metavar="MS",
+        help=f"Longest a request waits for its batch to fill "
+             f"(default: {DEFAULT_MAX_WAIT * 1000:g}).",
+    )
+    add_analyzer_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.max_batch < 1:
+        print("Error: --max-batch must be at least 1.", file=sys.stderr)
+        sys.exit(1)
+
+    serve(
+        build_analyzer(args),
+        host=args.host,
+        port=args.port,
+        unix_path=args.unix,
+        max_batch=args.max_batch,
+        max_wait=args.max_wait_ms / 1000,
+    )
+
+
+def daemon_main(argv: list[str]) -> None:
+    """Entry point for ``password-analyzer daemon``."""
+    from .daemon import absolute_config, run_daemon, socket_path, stop_daemon
+
+    parser = argparse.ArgumentParser(
+        prog="password-analyzer daemon",
+        description="Keep analyzers and dictionaries loaded behind a Unix socket "
+                    "so single-password runs skip start-up work.",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help=f"Socket to listen on (default: {socket_path()}).",
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the daemon listening on the socket and exit.",
+    )
+    add_analyzer_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.stop:
+        if not stop_daemon(args.socket):
+            print("Error: no daemon is running.", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    # Load the requested dictionaries up front so the first request is warm
+    # and bad paths are reported here rather than silently ignored.
+    build_analyzer(args)
+    try:
+        run_daemon(
+            open_analyzer,
+            args.socket,
+            preload=absolute_config(args.wordlist, args.filter, args.breach_index),
+        )
+    except OSError as e:
+        print(f"Error: cannot start daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def bench_main(argv: list[str]) -> None:
+    """Entry point for ``password-analyzer bench``."""
+    from .bench import (
+        CORPORA,
+        DEFAULT_REPEAT,
+        DEFAULT_SEED,
+        DEFAULT_SIZE,
+        DEFAULT_THRESHOLD,
+        TARGETS,
+        compare,
+        load_baseline,
+        run_benchmarks,
+        save_baseline,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="password-analyzer bench",
+        description="Time the checks, the analyzer and the generator on seeded corpora.",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=TARGETS,
+        help="Benchmark only this function (repeatable; default: all).",
+    )
+    parser.add_argument(
+        "--corpus",
+        action="append",
+        choices=list(CORPORA),
+        help="Use only this corpus (repeatable; default: all).",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=DEFAULT_SIZE,
+        metavar="N",
+        help=f"Passwords per corpus (default: {DEFAULT_SIZE}).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        metavar="N",
+        help=f"Passes over each corpus (default: {DEFAULT_REPEAT}).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Corpus seed (default: {DEFAULT_SEED}).",
+    )
+    parser.add_argument(
+        "--save",
+        metavar="PATH",
+        help="Write the results as a JSON baseline.",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare against a saved baseline; exit 1 on any regression.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD * 100,
+        metavar="PERCENT",
+        help=f"Throughput drop that counts as a regression "
+             f"(default: {DEFAULT_THRESHOLD * 100:g}).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.size < 1 or args.repeat < 1:
+        print("Error: --size and --repeat must be at least 1.", file=sys.stderr)
+        sys.exit(1)
+
+    baseline = None
+    if args.compare is not None:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot load baseline: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    results = run_benchmarks(
+        targets=args.target or TARGETS,
+        corpora=args.corpus or list(CORPORA),
+        size=args.size,
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+    changes = {}
+    if baseline is not None:
+        comparisons = compare(results, baseline, args.threshold / 100)
+        changes = {(c.target, c.corpus): c for c in comparisons}
+
+    print(f"  {'Target':<28} {'Corpus':<12} {'ops/s':>12} {'p50 us':>9} {'p99 us':>9}"
+          + ("  vs baseline" if baseline is not None else ""))
+    print(f"  {'-' * (74 + (14 if baseline is not None else 0))}")
+    regressions = 0
+    for r in results:
+        line = (f"  {r.target:<28} {r.corpus:<12} {r.ops_per_sec:>12,.0f} "
+                f"{r.p50_us:>9.2f} {r.p99_us:>9.2f}")
+        change = changes.get((r.target, r.corpus))
+        if change is not None:
+            line += f"  {change.change:>+7.1%}"
+            if change.regressed:
+                regressions += 1
+                line += "  REGRESSED"
+        print(line)
+
+    if args.save is not None:
+        try:
+            save_baseline(results, args.save)
+        except OSError as e:
+            print(f"Error: cannot save baseline: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\nSaved baseline to {args.save}")
+
+    if regressions:
+        print(
+            f"\n{regressions} result(s) regressed more than {args.threshold:g}%.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+COMMANDS = {
+    "build-dict": build_dict_main,
+    "build-filter": build_filter_main,
+    "build-breach-index": build_breach_index_main,
+    "serve": serve_main,
+    "daemon": daemon_main,
+    "bench": bench_main,
+}
+
+
 def main(argv: list[str] | None = None) -> None:
     """Entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+
     # Enable ANSI colors on Windows
     if sys.platform == "win32":
         os.system("")
@@ -100,6 +618,8 @@ def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         prog="password-analyzer",
         description="Analyze password strength and get improvement suggestions.",
+        epilog="Other commands: build-dict, build-filter, build-breach-index, serve, daemon, "
+               "bench (run with --help for details).",
     )
     parser.add_argument(
         "password",
@@ -134,6 +654,47 @@ def main(argv: list[str] | None = None) -> None:
         action="store_true",
         help="Exclude symbols from generated passwords.",
     )
+    add_analyzer_arguments(parser)
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Analyze in-process even if an analysis daemon is running.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each check and print a per-check breakdown to stderr "
+             "(analyzes in-process).",
+    )
+    parser.add_argument(
+        "--input", "-i",
+        metavar="FILE",
+        help="Audit newline-delimited passwords from FILE ('-' for stdin).",
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=FORMATS,
+        default="jsonl",
+        help="Record format for --input audits (default: jsonl).",
+    )
+    parser.add_argument(
+        "--output", "-o",
+        metavar="FILE",
+        help="Write --input audit records to FILE instead of stdout.",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for --input audits (0 = one per CPU; default: 1).",
+    )
+    parser.add_argument(
+        "--order",
+        choices=ORDERS,
+        default="input",
+        help="With --jobs, write records in input order or as chunks complete.",
+    )
 
     args = parser.parse_args(argv)
 
@@ -142,6 +703,8 @@ def main(argv: list[str] | None = None) -> None:
 
     # Generate mode
     if args.generate is not None:
+        from .generator import generate_password
+
         password = generate_password(
             length=args.generate,
             use_symbols=not args.no_symbols,
@@ -149,9 +712,12 @@ def main(argv: list[str] | None = None) -> None:
         print()
         print(f"  {colorize('Generated password:', 'bold')} {password}")
 
-        analyzer = PasswordAnalyzer()
-        result = analyzer.analyze(password)
-        print_result(result, verbose=args.verbose)
+        print_result(analyze_password(args, password), verbose=args.verbose)
+        return
+
+    # Bulk audit mode
+    if args.input is not None:
+        run_audit(args)
         return
 
     # Analyze mode
@@ -160,12 +726,12 @@ def main(argv: list[str] | None = None) -> None:
     elif args.password is not None:
         password = args.password
     else:
+        import getpass
+
         password = getpass.getpass("Enter password to analyze: ")
 
     if not password:
         print("Error: empty password provided.", file=sys.stderr)
         sys.exit(1)
 
-    analyzer = PasswordAnalyzer()
-    result = analyzer.analyze(password)
-    print_result(result, verbose=args.verbose)
+    print_result(analyze_password(args, password), verbose=args.verbose)
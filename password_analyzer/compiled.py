@@ -0,0 +1,454 @@
+"""Compiled binary dictionaries and the compiled-artifact cache.
+
+Text word lists are compiled once into a compact, front-coded binary file
+that is memory-mapped on load, so opening even a very large dictionary
+costs a header read rather than a parse.
+
+File layout (all integers little-endian)::
+
+    header  magic "PWADICT\\0", format version (u16), block size (u16),
+            entry count (u64), block count (u64), index offset (u64),
+            SHA-256 of the source file (32 bytes)
+    blocks  runs of up to ``block size`` sorted entries; the first entry is
+            stored whole, the rest as (shared prefix length, suffix)
+    index   byte offset of each block (u64 each)
+
+Lengths inside blocks are unsigned LEB128 varints.
+"""
+
+from __future__ import annotations
+
+import array
+import dataclasses
+import hashlib
+import heapq
+import itertools
+import os
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, TYPE_CHECKING
+
+from .wordlist import (
+    SortedFileWordList,
+    SortedWordList,
+    WordList,
+    is_sorted_wordlist,
+    map_file,
+)
+
+if TYPE_CHECKING:
+    from .fuzzy import DeletionIndex
+
+MAGIC = b"PWADICT\0"
+FORMAT_VERSION = 1
+DEFAULT_BLOCK_SIZE = 16
+RUN_SIZE = 1_000_000
+
+_SORTED = "sorted"
+
+_HEADER = struct.Struct("<8sHHQQQ32s")
+_OFFSET = struct.Struct("<Q")
+
+
+class DictionaryFormatError(ValueError):
+    """Raised when a file is not a compiled dictionary this version can read."""
+
+
+@dataclasses.dataclass
+class DictionaryInfo:
+    """Summary of a compiled dictionary artifact."""
+
+    path: str
+    word_count: int
+    content_hash: str
+    size: int
+    skipped: int = 0
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _shared_prefix(a: bytes, b: bytes) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def read_source(
+    path: str | os.PathLike[str], directory: str, run_size: int = RUN_SIZE,
+) -> tuple[list[IO[bytes]], str, int]:
+    """Read a text word list into sorted runs of normalized entries.
+
+    Returns ``(runs, sha256_hex, skipped)``. Lines are stripped and
+    lowercased; lines that are not valid UTF-8 are skipped and counted. At
+    most ``run_size`` entries are held in memory: each full batch is
+    sorted, de-duplicated and spilled to an anonymous temporary file in
+    ``directory``. The caller merges the runs (``merge_runs``) and closes them.
+    """
+    digest = hashlib.sha256()
+    runs: list[IO[bytes]] = []
+    words: set[bytes] = set()
+    skipped = 0
+    try:
+        with open(path, "rb") as f:
+            for raw in f:
+                digest.update(raw)
+                try:
+                    word = raw.decode("utf-8").strip().lower()
+                except UnicodeDecodeError:
+                    skipped += 1
+                    continue
+                if word:
+                    words.add(word.encode("utf-8"))
+                    if len(words) >= run_size:
+                        runs.append(_spill(words, directory))
+                        words = set()
+        if words or not runs:
+            runs.append(_spill(words, directory))
+    except BaseException:
+        for run in runs:
+            run.close()
+        raise
+    return runs, digest.hexdigest(), skipped
+
+
+def _spill(words: set[bytes], directory: str) -> IO[bytes]:
+    """Write ``words`` sorted to an anonymous temporary file."""
+    run = tempfile.TemporaryFile(dir=directory)
+    for word in sorted(words):
+        run.write(word + b"\n")
+    run.seek(0)
+    return run
+
+
+def merge_runs(runs: list[IO[bytes]]) -> Iterator[bytes]:
+    """Yield the unique entries of sorted runs in order."""
+    merged = heapq.merge(*[(line[:-1] for line in run) for run in runs])
+    for entry, _ in itertools.groupby(merged):
+        yield entry
+
+
+def write_compiled(
+    entries: Iterable[bytes],
+    path: str | os.PathLike[str],
+    content_hash: str,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[int, int]:
+    """Stream sorted, unique entries to ``path`` as a compiled dictionary.
+
+    Returns the number of entries and the size of the file in bytes.
+    """
+    offsets = array.array("Q")
+    previous = b""
+    count = 0
+    with open(path, "wb") as f:
+        f.write(bytes(_HEADER.size))
+        pos = _HEADER.size
+        for entry in entries:
+            if count % block_size == 0:
+                offsets.append(pos)
+                chunk = _encode_varint(len(entry)) + entry
+            else:
+                shared = _shared_prefix(previous, entry)
+                chunk = (_encode_varint(shared) + _encode_varint(len(entry) - shared)
+                         + entry[shared:])
+            f.write(chunk)
+            pos += len(chunk)
+            previous = entry
+            count += 1
+
+        for offset in offsets:
+            f.write(_OFFSET.pack(offset))
+        f.seek(0)
+        f.write(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, block_size, count, len(offsets),
+            pos, bytes.fromhex(content_hash),
+        ))
+    return count, pos + _OFFSET.size * len(offsets)
+
+
+def compile_wordlist(
+    source: str | os.PathLike[str],
+    dest: str | os.PathLike[str],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    run_size: int = RUN_SIZE,
+) -> DictionaryInfo:
+    """Compile a text word list into a binary dictionary at ``dest``.
+
+    Sorting goes through temporary files next to ``dest``, so memory use
+    is bounded by ``run_size`` entries however large the source is.
+    """
+    directory = os.path.dirname(os.fspath(dest)) or "."
+    runs, content_hash, skipped = read_source(source, directory, run_size)
+    try:
+        count, size = write_compiled(merge_runs(runs), dest, content_hash, block_size)
+    finally:
+        for run in runs:
+            run.close()
+    return DictionaryInfo(os.fspath(dest), count, content_hash, size, skipped)
+
+
+def cache_dir() -> str:
+    """Return the directory holding cached compiled dictionaries.
+
+    ``$PASSWORD_ANALYZER_CACHE`` overrides the default of
+    ``$XDG_CACHE_HOME/password-analyzer`` (``~/.cache/password-analyzer``).
+    """
+    override = os.environ.get("PASSWORD_ANALYZER_CACHE")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache",
+    )
+    return os.path.join(base, "password-analyzer")
+
+
+def source_hash(path: str | os.PathLike[str]) -> str:
+    """Return the SHA-256 hex digest of a source file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stamp_path(source: str | os.PathLike[str]) -> str:
+    """Return the cache entry recording what is known about ``source``.
+
+    It is keyed by the source's resolved path, size and modification time,
+    which is enough to skip re-reading a large list that has not changed.
+    """
+    st = os.stat(source)
+    key = f"{os.path.realpath(source)}:{st.st_size}:{st.st_mtime_ns}"
+    name = hashlib.sha256(key.encode("utf-8", errors="surrogatepass")).hexdigest()
+    return os.path.join(cache_dir(), f"{name}.v{FORMAT_VERSION}.stamp")
+
+
+def _read_stamp(path: str) -> str | None:
+    try:
+        with open(path, encoding="ascii") as f:
+            return f.read().strip() or None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_stamp(path: str, value: str) -> None:
+    """Record ``value`` at ``path``; the stamp is only a shortcut, so failures pass."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(value)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def cached_compile(source: str | os.PathLike[str]) -> DictionaryInfo:
+    """Return the cached compiled artifact for ``source``, building it if needed.
+
+    Artifacts are keyed by the SHA-256 of the source contents and the
+    format version, so editing the list or upgrading the format triggers a
+    rebuild while renaming or copying the source does not. The digest of a
+    source whose path, size and modification time are unchanged is taken
+    from the cache rather than computed again.
+    """
+    stamp = _stamp_path(source)
+    known = _read_stamp(stamp)
+    content_hash = known if known not in (None, _SORTED) else source_hash(source)
+    directory = cache_dir()
+    path = os.path.join(directory, f"{content_hash}.v{FORMAT_VERSION}.padict")
+    if os.path.exists(path):
+        with CompiledWordList(path) as existing:
+            info = existing.info()
+        if info.content_hash == content_hash:
+            if known != content_hash:
+                _write_stamp(stamp, content_hash)
+            return info
+
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        info = compile_wordlist(source, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    info.path = path
+    _write_stamp(stamp, content_hash)
+    return info
+
+
+def is_compiled(path: str | os.PathLike[str]) -> bool:
+    """Return True if ``path`` starts with the compiled dictionary magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CompiledWordList(SortedWordList):
+    """A compiled dictionary served through ``mmap``.
+
+    Opening only validates the header; entries are decoded on demand by
+    binary searching the block index and scanning a single block.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._data = map_file(self.path)
+        self._deletion_indexes: dict[int, DeletionIndex | None] = {}
+        try:
+            if len(self._data) < _HEADER.size:
+                raise DictionaryFormatError(f"{self.path}: file too short")
+            (magic, version, self.block_size, self.word_count, self._block_count,
+             self._index_offset, digest) = _HEADER.unpack_from(self._data, 0)
+            if magic != MAGIC:
+                raise DictionaryFormatError(f"{self.path}: not a compiled dictionary")
+            if version != FORMAT_VERSION:
+                raise DictionaryFormatError(
+                    f"{self.path}: unsupported format version {version}"
+                )
+        except DictionaryFormatError:
+            self.close()
+            raise
+        self.content_hash = digest.hex()
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every entry in sorted order."""
+        data = self._data
+        for block in range(self._block_count):
+            pos = self._block_offset(block)
+            length, pos = _decode_varint(data, pos)
+            entry = data[pos:pos + length]
+            pos += length
+            yield entry.decode("utf-8")
+            count = min(self.block_size, self.word_count - block * self.block_size)
+            for _ in range(count - 1):
+                shared, pos = _decode_varint(data, pos)
+                length, pos = _decode_varint(data, pos)
+                entry = entry[:shared] + data[pos:pos + length]
+                pos += length
+                yield entry.decode("utf-8")
+
+    def __enter__(self) -> CompiledWordList:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def info(self) -> DictionaryInfo:
+        """Describe this artifact."""
+        return DictionaryInfo(
+            self.path, self.word_count, self.content_hash, len(self._data),
+        )
+
+    def _block_offset(self, block: int) -> int:
+        return _OFFSET.unpack_from(self._data, self._index_offset + 8 * block)[0]
+
+    def _block_first(self, block: int) -> bytes:
+        pos = self._block_offset(block)
+        length, pos = _decode_varint(self._data, pos)
+        return self._data[pos:pos + length]
+
+    def _lower_bound(self, key: bytes) -> bytes | None:
+        # Find the last block whose first entry is <= key.
+        lo, hi = 0, self._block_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._block_first(mid) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        block = lo - 1
+        if block < 0:
+            return self._block_first(0) if self._block_count else None
+
+        data = self._data
+        pos = self._block_offset(block)
+        length, pos = _decode_varint(data, pos)
+        entry = data[pos:pos + length]
+        pos += length
+        count = min(self.block_size, self.word_count - block * self.block_size)
+        for _ in range(count - 1):
+            if entry >= key:
+                return entry
+            shared, pos = _decode_varint(data, pos)
+            length, pos = _decode_varint(data, pos)
+            entry = entry[:shared] + data[pos:pos + length]
+            pos += length
+        if entry >= key:
+            return entry
+        if block + 1 < self._block_count:
+            return self._block_first(block + 1)
+        return None
+
+    def deletion_index(self, max_distance: int) -> DeletionIndex | None:
+        """Return the deletion index saved next to the artifact, or None if not built."""
+        if max_distance not in self._deletion_indexes:
+            from .fuzzy import open_index
+
+            self._deletion_indexes[max_distance] = open_index(
+                self.path, max_distance, self.content_hash,
+            )
+        return self._deletion_indexes[max_distance]
+
+    def build_deletion_index(self, max_distance: int) -> DeletionIndex:
+        """Build and save the deletion index next to the artifact; see ``fuzzy.build_index``."""
+        from .fuzzy import build_index
+
+        old = self._deletion_indexes.get(max_distance)
+        index = build_index(self.path, self, max_distance, self.content_hash)
+        if old is not None:
+            old.close()
+        self._deletion_indexes[max_distance] = index
+        return index
+
+    def close(self) -> None:
+        for index in self._deletion_indexes.values():
+            if index is not None:
+                index.close()
+        close = getattr(self._data, "close", None)
+        if close is not None:
+            close()
+
+
+def load_wordlist(path: str | os.PathLike[str]) -> WordList:
+    """Open an on-disk word list.
+
+    Compiled dictionaries are mapped directly, and so are text lists that
+    are already sorted and normalized (see ``wordlist.is_sorted_wordlist``).
+    Other text lists are compiled on first use and served from the artifact
+    cache afterwards.
+    """
+    if is_compiled(path):
+        return CompiledWordList(path)
+    stamp = _stamp_path(path)
+    known = _read_stamp(stamp)
+    if known is None and is_sorted_wordlist(path):
+        _write_stamp(stamp, known := _SORTED)
+    if known == _SORTED:
+        return SortedFileWordList(path)
+    return CompiledWordList(cached_compile(path).path)
@@ -0,0 +1,320 @@
+"""Long-lived analysis daemon and its thin client.
+
+The daemon keeps warm ``PasswordAnalyzer`` instances, one per dictionary
+configuration, behind a Unix domain socket so repeated CLI invocations
+skip loading dictionaries. The protocol is one JSON object per line in
+each direction:
+
+    {"version": V, "password": "...", "wordlist": PATH, "filter": PATH,
+     "breach_index": PATH}
+        -> {"version": V, "result": <AnalysisResult.to_dict()>}
+           or {"version": V, "error": "..."}
+    {"shutdown": true}
+        -> {"version": V, "status": "stopping"}
+
+``V`` is the package version. Both sides refuse to talk across versions,
+so a daemon left running through an upgrade is not trusted to score with
+old logic; the client falls back to analyzing in-process instead.
+
+Dictionary paths must be absolute, since the daemon's working directory
+is not the client's. Passwords are only sent to a socket owned by the
+current user and closed to everyone else. The client half imports only
+``socket``, ``json`` and the result types; asyncio and the checks are
+loaded by the daemon alone.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from . import __version__
+from .results import AnalysisResult
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .analyzer import PasswordAnalyzer
+
+# Seconds the client waits for the daemon before falling back.
+DEFAULT_TIMEOUT = 2.0
+
+# (wordlist, filter, breach_index) paths describing an analyzer.
+Config = tuple[str | None, str | None, str | None]
+
+
+def socket_path() -> str:
+    """Return the default daemon socket path.
+
+    ``$PASSWORD_ANALYZER_SOCKET`` overrides the default of
+    ``$XDG_RUNTIME_DIR/password-analyzer.sock``, or a per-user socket in
+    the temporary directory when no runtime directory is set.
+    """
+    override = os.environ.get("PASSWORD_ANALYZER_SOCKET")
+    if override:
+        return override
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "password-analyzer.sock")
+    import tempfile
+
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"password-analyzer-{uid}.sock")
+
+
+def absolute_config(
+    wordlist: str | None, filter: str | None, breach_index: str | None,
+) -> Config:
+    """Resolve relative dictionary paths against the current directory."""
+    return tuple(
+        os.path.abspath(p) if p is not None else None
+        for p in (wordlist, filter, breach_index)
+    )
+
+
+class Daemon:
+    """Serves analysis requests from warm analyzers.
+
+    Args:
+        opener: Builds an analyzer from ``(wordlist, filter, breach_index)``
+            paths; it may raise ``OSError`` or ``ValueError``.
+    """
+
+    def __init__(self, opener: Callable[..., PasswordAnalyzer]) -> None:
+        self.opener = opener
+        self.analyzers: dict[Config, tuple[tuple, PasswordAnalyzer]] = {}
+        self.requests = 0
+        self._server: asyncio.AbstractServer | None = None
+
+    def analyzer(self, config: Config) -> PasswordAnalyzer:
+        """Return the warm analyzer for ``config``, loading it on first use.
+
+        Each analyzer is kept with the modification times of its files. A
+        dictionary rewritten on disk is reloaded on its next request, and the
+        analyzer it replaces is closed.
+        """
+        mtimes = tuple(_mtime(p) for p in config)
+        entry = self.analyzers.get(config)
+        if entry is not None and entry[0] == mtimes:
+            return entry[1]
+        analyzer = self.opener(*config)
+        self.analyzers[config] = (mtimes, analyzer)
+        if entry is not None:
+            _close(entry[1])
+        return analyzer
+
+    async def start(self, path: str) -> asyncio.AbstractServer:
+        """Listen on ``path``, readable and writable by the current user only.
+
+        Raises:
+            OSError: If another daemon is already listening on ``path``.
+        """
+        if os.path.exists(path):
+            if _connect(path, DEFAULT_TIMEOUT) is not None:
+                raise OSError(f"a daemon is already listening on {path}")
+            os.unlink(path)
+        import asyncio
+
+        old_umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self.handle, path=path)
+        finally:
+            os.umask(old_umask)
+        return self._server
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer requests on one connection until the client hangs up."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                response = self.respond(line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+                if response.get("status") == "stopping" and self._server is not None:
+                    self._server.close()
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def respond(self, line: bytes) -> dict:
+        """Return the response object for one request line."""
+        return {"version": __version__, **self._respond(line)}
+
+    def _respond(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+            if request.get("shutdown"):
+                return {"status": "stopping"}
+            if request.get("version") != __version__:
+                return {"error": f"client version differs from daemon version {__version__}"}
+            password = request["password"]
+            if not isinstance(password, str):
+                raise TypeError
+            config = (
+                request.get("wordlist"), request.get("filter"), request.get("breach_index"),
+            )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return {"error": "malformed request"}
+        try:
+            analyzer = self.analyzer(config)
+        except (OSError, ValueError) as e:
+            return {"error": f"cannot load analyzer data: {e}"}
+        self.requests += 1
+        return {"result": analyzer.analyze(password).to_dict()}
+
+
+def run_daemon(
+    opener: Callable[..., PasswordAnalyzer],
+    path: str | None = None,
+    preload: Config | None = None,
+) -> Daemon:
+    """Run a daemon until it is told to shut down or interrupted."""
+    import asyncio
+
+    if path is None:
+        path = socket_path()
+    daemon = Daemon(opener)
+    if preload is not None:
+        daemon.analyzer(preload)
+
+    async def main() -> None:
+        server = await daemon.start(path)
+        print(f"Analysis daemon listening on {path}", file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    return daemon
+
+
+def _close(analyzer: PasswordAnalyzer) -> None:
+    """Release the files mapped by an analyzer's word list and breach index."""
+    if analyzer.wordlist is not None:
+        analyzer.wordlist.close()
+    if analyzer.breach_index is not None:
+        analyzer.breach_index.close()
+
+
+def _mtime(path: str | None) -> int | None:
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_private_socket(path: str) -> bool:
+    """Return whether ``path`` is a socket of the current user that no one else can use.
+
+    Guards against another local user binding the (predictable) socket
+    path first to collect the passwords sent to it.
+    """
+    if not hasattr(os, "getuid"):
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def _connect(path: str, timeout: float) -> socket.socket | None:
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _call(request: dict, path: str | None, timeout: float) -> dict | None:
+    """Send one request; None if no daemon on a private socket answers."""
+    if path is None:
+        path = socket_path()
+    if not _is_private_socket(path):
+        return None
+    sock = _connect(path, timeout)
+    if sock is None:
+        return None
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps({"version": __version__, **request}).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+        response = json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+    return response if isinstance(response, dict) else None
+
+
+def remote_analyze(
+    password: str,
+    config: Config = (None, None, None),
+    path: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> AnalysisResult | None:
+    """Analyze ``password`` through a running daemon.
+
+    Returns None when no daemon answers, the socket is not private to the
+    current user, the daemon runs another version or it reports an error,
+    so callers can fall back to analyzing in-process.
+    """
+    wordlist, filter, breach_index = config
+    response = _call(
+        {
+            "password": password,
+            "wordlist": wordlist,
+            "filter": filter,
+            "breach_index": breach_index,
+        },
+        path, timeout,
+    )
+    if response is None or response.get("version") != __version__ or "result" not in response:
+        return None
+    try:
+        return AnalysisResult.from_dict(response["result"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def stop_daemon(path: str | None = None, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """Ask a running daemon to shut down; returns False if none answered.
+
+    Daemons of any version are stopped, so an outdated one can be replaced.
+    """
+    response = _call({"shutdown": True}, path, timeout)
+    return response is not None and response.get("status") == "stopping"
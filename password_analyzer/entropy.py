@@ -1,9 +1,13 @@
 """Password entropy estimation."""
 
+from __future__ import annotations
+
 import math
 
+from .profile import PasswordProfile, build_profile
+
 
-def calculate_entropy(password: str) -> float:
+def calculate_entropy(password: str, profile: PasswordProfile | None = None) -> float:
     """Estimate password entropy in bits.
 
     Uses the formula: entropy = length * log2(pool_size)
@@ -12,23 +16,22 @@ def calculate_entropy(password: str) -> float:
     This assumes characters are chosen uniformly at random from the pool,
     so it overestimates entropy for non-random passwords. Other checks
     (common password, sequential characters) compensate for this.
+
+    Pass a precomputed ``profile`` to avoid re-scanning the password.
     """
     if not password:
         return 0.0
+    if profile is None:
+        profile = build_profile(password)
 
     pool_size = 0
-    has_lower = any(c.islower() for c in password)
-    has_upper = any(c.isupper() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_symbol = any(not c.isalnum() for c in password)
-
-    if has_lower:
+    if profile.has_lower:
         pool_size += 26
-    if has_upper:
+    if profile.has_upper:
         pool_size += 26
-    if has_digit:
+    if profile.has_digit:
         pool_size += 10
-    if has_symbol:
+    if profile.has_symbol:
         pool_size += 32
 
     if pool_size == 0:
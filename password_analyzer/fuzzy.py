@@ -0,0 +1,331 @@
+"""Near-miss dictionary lookups with a deletion index.
+
+A password a typo or two away from a dictionary entry ("passwprd",
+"sunshone") is nearly as weak as the entry itself. Following SymSpell,
+each entry is indexed under every string left after deleting up to
+``max_distance`` of its characters. Two strings within that many edits
+share such a deletion, so a lookup only generates the deletions of the
+password and verifies the few entries they lead to, instead of comparing
+the password against the whole dictionary.
+
+Indexes over file-backed dictionaries are built ahead of time (see
+``build_index`` and ``password-analyzer build-dict``) and saved next to
+the dictionary; checks only open an index that already exists.
+
+File layout (all integers little-endian)::
+
+    header  magic "PWFUZZY\\0", format version (u16), max distance (u16),
+            key count (u64), shortest and longest entry in characters
+            (u32 each), SHA-256 of the source word list (32 bytes)
+    keys    sorted UTF-8 lines of "deletion\\0entry[\\0entry...]\\n"
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import itertools
+import os
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+from .options import MAX_NEAR_MISS_DISTANCE
+from .wordlist import map_file
+
+MAGIC = b"PWFUZZY\0"
+FORMAT_VERSION = 1
+DEFAULT_MAX_DISTANCE = 1
+MAX_DISTANCE = MAX_NEAR_MISS_DISTANCE
+# (deletion, entry) pairs sorted in memory at once while writing an index.
+RUN_SIZE = 1_000_000
+
+_HEADER = struct.Struct("<8sHHQII32s")
+
+
+@dataclasses.dataclass(frozen=True)
+class NearMatch:
+    """A dictionary entry ``distance`` edits away from the query."""
+
+    word: str
+    distance: int
+
+
+def deletions(word: str, max_distance: int) -> set[str]:
+    """Return ``word`` and every string made by deleting up to ``max_distance`` chars."""
+    found = {word}
+    layer = found
+    for _ in range(max_distance):
+        layer = {w[:i] + w[i + 1:] for w in layer for i in range(len(w))}
+        found = found | layer
+    return found
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Return the edit distance of ``a`` and ``b``, or ``limit + 1`` if above ``limit``.
+
+    Insertions, deletions, substitutions and swaps of neighbouring
+    characters each count as one edit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, previous2[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class DeletionIndex:
+    """Maps deletions of dictionary entries back to the entries.
+
+    Subclasses provide ``_entries``; ``lookup`` is built on top of it.
+    """
+
+    max_distance: int
+    # Length range of the entries; queries outside it cannot match.
+    shortest: int = 0
+    longest: int = 0
+
+    def _entries(self, key: str) -> Iterable[str]:
+        """Return the entries indexed under the deletion ``key``."""
+        raise NotImplementedError
+
+    def lookup(self, text: str, max_distance: int | None = None) -> list[NearMatch]:
+        """Return the entries within ``max_distance`` edits of ``text``, closest first.
+
+        ``max_distance`` defaults to, and may not exceed, the distance the
+        index was built for. ``text`` itself is never reported.
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"Index supports up to {self.max_distance} edits, not {max_distance}."
+            )
+        if not self.shortest - max_distance <= len(text) <= self.longest + max_distance:
+            return []
+        entries = self._entries
+        candidates = {word for key in deletions(text, max_distance) for word in entries(key)}
+        candidates.discard(text)
+        found = []
+        for word in candidates:
+            distance = edit_distance(text, word, max_distance)
+            if distance <= max_distance:
+                found.append(NearMatch(word, distance))
+        found.sort(key=lambda match: (match.distance, match.word))
+        return found
+
+    def close(self) -> None:
+        """Release any resources held by the index."""
+
+
+class MemoryDeletionIndex(DeletionIndex):
+    """A deletion index held in a dict."""
+
+    def __init__(self, words: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE) -> None:
+        _check_distance(max_distance)
+        self.max_distance = max_distance
+        self._keys: dict[str, list[str]] = {}
+        lengths = []
+        for word in words:
+            lengths.append(len(word))
+            for key in deletions(word, max_distance):
+                self._keys.setdefault(key, []).append(word)
+        if lengths:
+            self.shortest, self.longest = min(lengths), max(lengths)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _entries(self, key: str) -> Iterable[str]:
+        return self._keys.get(key, ())
+
+
+class FileDeletionIndex(DeletionIndex):
+    """A saved deletion index served through ``mmap``.
+
+    Lookups binary search the sorted key lines directly, like
+    ``wordlist.SortedFileWordList``.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._data = map_file(self.path)
+        try:
+            if len(self._data) < _HEADER.size:
+                raise ValueError(f"{self.path}: file too short")
+            (magic, version, self.max_distance, self.key_count, self.shortest, self.longest,
+             digest) = _HEADER.unpack_from(self._data, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path}: not a deletion index")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{self.path}: unsupported format version {version}")
+        except ValueError:
+            self.close()
+            raise
+        self.content_hash = digest.hex() if any(digest) else ""
+
+    def __len__(self) -> int:
+        return self.key_count
+
+    def _entries(self, key: str) -> Iterable[str]:
+        data = self._data
+        prefix = key.encode("utf-8", errors="surrogatepass") + b"\0"
+        lo, hi = _HEADER.size, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = max(data.rfind(b"\n", lo, mid) + 1, lo)
+            end = data.find(b"\n", start)
+            if data[start:end] < prefix:
+                lo = end + 1
+            else:
+                hi = start
+        end = data.find(b"\n", lo)
+        if lo >= len(data) or data[lo:lo + len(prefix)] != prefix:
+            return ()
+        return data[lo + len(prefix):end].decode("utf-8", errors="surrogatepass").split("\0")
+
+    def close(self) -> None:
+        close = getattr(self._data, "close", None)
+        if close is not None:
+            close()
+
+
+def _check_distance(max_distance: int) -> None:
+    if not 0 <= max_distance <= MAX_DISTANCE:
+        raise ValueError(f"Edit distance must be between 0 and {MAX_DISTANCE}.")
+
+
+def write_deletion_index(
+    words: Iterable[str],
+    path: str | os.PathLike[str],
+    max_distance: int = DEFAULT_MAX_DISTANCE,
+    content_hash: str = "",
+    run_size: int = RUN_SIZE,
+) -> int:
+    """Stream a deletion index over ``words`` to ``path``.
+
+    At most ``run_size`` (deletion, entry) pairs are held in memory: full
+    runs are sorted and spilled to temporary files next to ``path``, then
+    merged while the index is written. Entries containing NUL or newline
+    characters are left out. Returns the number of deletion keys written.
+    """
+    _check_distance(max_distance)
+    directory = os.path.dirname(os.fspath(path)) or "."
+    runs: list[IO[bytes]] = []
+    try:
+        pairs: list[bytes] = []
+        shortest = longest = -1
+        for word in words:
+            if "\0" in word or "\n" in word:
+                continue
+            if shortest < 0 or len(word) < shortest:
+                shortest = len(word)
+            longest = max(longest, len(word))
+            entry = word.encode("utf-8", errors="surrogatepass")
+            pairs.extend(
+                key.encode("utf-8", errors="surrogatepass") + b"\0" + entry
+                for key in deletions(word, max_distance)
+            )
+            if len(pairs) >= run_size:
+                runs.append(_spill(pairs, directory))
+                pairs = []
+        pairs.sort()
+        merged = heapq.merge(pairs, *(_read_run(run) for run in runs))
+
+        keys = 0
+        with open(path, "wb") as f:
+            f.write(bytes(_HEADER.size))
+            for key, group in itertools.groupby(merged, key=lambda pair: pair.split(b"\0", 1)[0]):
+                entries = dict.fromkeys(pair[len(key) + 1:] for pair in group)
+                f.write(b"\0".join(itertools.chain((key,), entries)) + b"\n")
+                keys += 1
+            f.seek(0)
+            f.write(_HEADER.pack(
+                MAGIC, FORMAT_VERSION, max_distance, keys, max(shortest, 0), max(longest, 0),
+                bytes.fromhex(content_hash) if content_hash else bytes(32),
+            ))
+    finally:
+        for run in runs:
+            run.close()
+    return keys
+
+
+def _spill(pairs: list[bytes], directory: str) -> IO[bytes]:
+    """Write ``pairs`` sorted to an anonymous temporary file."""
+    run = tempfile.TemporaryFile(dir=directory)
+    pairs.sort()
+    for pair in pairs:
+        run.write(pair + b"\n")
+    run.seek(0)
+    return run
+
+
+def _read_run(run: IO[bytes]) -> Iterator[bytes]:
+    for line in run:
+        yield line[:-1]
+
+
+def index_path(dictionary: str | os.PathLike[str], max_distance: int) -> str:
+    """Return where the deletion index of a dictionary file is saved."""
+    return f"{os.fspath(dictionary)}.d{max_distance}.pafuzzy"
+
+
+def open_index(
+    dictionary: str | os.PathLike[str], max_distance: int, content_hash: str,
+) -> FileDeletionIndex | None:
+    """Open the saved index of a dictionary file, or return None if there is none.
+
+    An index built for more edits also serves ``max_distance``. Indexes
+    saved for different contents are ignored. Nothing is ever built here:
+    indexes over large dictionaries take a while and a lot of disk, so they
+    are only made on request, see ``build_index``.
+    """
+    _check_distance(max_distance)
+    for distance in range(max_distance, MAX_DISTANCE + 1):
+        try:
+            index = FileDeletionIndex(index_path(dictionary, distance))
+        except (OSError, ValueError):
+            continue
+        if index.content_hash == content_hash and index.max_distance == distance:
+            return index
+        index.close()
+    return None
+
+
+def build_index(
+    dictionary: str | os.PathLike[str],
+    words: Iterable[str],
+    max_distance: int,
+    content_hash: str,
+) -> FileDeletionIndex:
+    """Build and save the deletion index of a dictionary file, then open it.
+
+    The index is written to a temporary file in the same directory and
+    renamed into place, so readers never see a partial index.
+
+    Raises:
+        OSError: If the index cannot be written next to the dictionary.
+    """
+    _check_distance(max_distance)
+    path = index_path(dictionary, max_distance)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write_deletion_index(words, tmp_path, max_distance, content_hash)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return FileDeletionIndex(path)
@@ -1,6 +1,5 @@
 """Secure random password generator."""
 
-import secrets
 import string
 
 
@@ -37,6 +36,9 @@ def generate_password(
     Raises:
         ValueError: If length is less than the number of required character classes.
     """
+    # secrets pulls in random and hashlib; only pay for it when generating.
+    import secrets
+
     # Always include lowercase
     required: list[str] = [secrets.choice(CHARSETS["lowercase"])]
     pool = CHARSETS["lowercase"]
@@ -0,0 +1,349 @@
+"""Guess-count estimation from the patterns a password is built from.
+
+``calculate_entropy`` assumes every character is drawn at random from the
+pool, so "Password2024!" looks as strong as random noise of the same
+length. This estimator instead finds every known pattern in the password
+(dictionary words, also when spelled with leetspeak, keyboard walks,
+repeats, sequences and dates), prices each one as the number of guesses
+an attacker needs to hit it, and picks the cheapest way to cover the
+whole password with a dynamic program.
+Characters no pattern explains are brute-forced.
+
+The dynamic program runs in O(n + matches). Only the first
+``MAX_ESTIMATE_LENGTH`` characters are searched for patterns; the rest are
+priced as brute force, so the cost per password stays bounded.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import functools
+import math
+import re
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+from .keyboard import LAYOUTS, adjacency_tables, find_walks
+from .leet import leet_matches
+
+if TYPE_CHECKING:
+    from .wordlist import WordList
+
+MAX_ESTIMATE_LENGTH = 128
+# Guesses per brute-forced character.
+BRUTEFORCE_CARDINALITY = 10
+# Every token after the first multiplies the guesses by this much, since
+# an attacker must also guess how the tokens are put together.
+TOKEN_PENALTY = 10
+# Floors for the guesses of a single matched token.
+MIN_GUESSES_SHORT = 10
+MIN_GUESSES_LONG = 50
+# Dictionary words at least this long are matched as substrings.
+DICTIONARY_MIN_LENGTH = 3
+# Assumed size of word lists that cannot report their length.
+DEFAULT_DICTIONARY_SIZE = 10_000
+REFERENCE_YEAR = datetime.date.today().year
+# Years closer than this to the reference year are all about as likely.
+MIN_YEAR_SPACE = 20
+
+_YEAR = re.compile(r"19\d\d|20\d\d")
+_DATE_WITH_SEPARATOR = re.compile(r"(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})")
+_DIGITS = re.compile(r"\d{4,}")
+# Repeated units are at most this long, which bounds the regex's work.
+MAX_REPEAT_UNIT = 16
+_REPEAT = re.compile(r"(.{1,%d}?)\1+" % MAX_REPEAT_UNIT, re.DOTALL)
+_SEQUENCE_STARTS = frozenset("aAzZ019")
+
+
+@dataclasses.dataclass
+class Match:
+    """A pattern covering ``password[start:end]`` and its guess count."""
+
+    start: int
+    end: int
+    pattern: str
+    guesses: float
+
+
+@dataclasses.dataclass
+class GuessEstimate:
+    """The cheapest decomposition of a password into patterns.
+
+    Attributes:
+        log10: Base-10 logarithm of the estimated number of guesses.
+        sequence: The matches making up the decomposition, in order;
+            brute-forced stretches have the pattern ``"bruteforce"``.
+    """
+
+    log10: float
+    sequence: list[Match]
+
+    @property
+    def guesses(self) -> float:
+        """Estimated number of guesses; infinite if too large for a float."""
+        return _power_of_ten(self.log10)
+
+
+def _power_of_ten(exponent: float) -> float:
+    return 10.0 ** exponent if exponent < 308 else math.inf
+
+
+def _floor(guesses: float, length: int) -> float:
+    return max(guesses, MIN_GUESSES_SHORT if length == 1 else MIN_GUESSES_LONG)
+
+
+def _case_variations(word: str) -> int:
+    """Return how many capitalizations an attacker tries to reach ``word``."""
+    if word.lower() == word:
+        return 1
+    upper = sum(map(str.isupper, word))
+    lower = sum(map(str.islower, word))
+    if not lower or (upper == 1 and (word[0].isupper() or word[-1].isupper())):
+        return 2
+    return sum(math.comb(upper + lower, i) for i in range(1, min(upper, lower) + 1))
+
+
+def dictionary_matches(password: str, wordlist: WordList) -> Iterator[Match]:
+    """Yield a match for every dictionary word in ``password``."""
+    try:
+        size = len(wordlist)  # type: ignore[arg-type]
+    except TypeError:
+        size = DEFAULT_DICTIONARY_SIZE
+    # Without frequency ranks, a word is on average halfway down the list.
+    rank = max(1, (size + 1) // 2)
+    lower = password.lower()
+    if len(lower) != len(password):
+        return  # lowercasing changed the length, so spans would not line up
+    spans = set(wordlist.matches(lower, DICTIONARY_MIN_LENGTH))
+    if len(lower) < DICTIONARY_MIN_LENGTH and lower in wordlist:
+        spans.add((0, len(lower)))
+    for start, end in spans:
+        guesses = rank * _case_variations(password[start:end])
+        yield Match(start, end, "dictionary", _floor(guesses, end - start))
+    for leet in leet_matches(lower, wordlist, DICTIONARY_MIN_LENGTH):
+        # Each distinct substitution may or may not have been applied.
+        guesses = rank * _case_variations(password[leet.start:leet.end])
+        guesses *= 2 ** len(leet.substitutions)
+        yield Match(leet.start, leet.end, "leet", _floor(guesses, leet.end - leet.start))
+
+
+def walk_matches(password: str) -> Iterator[Match]:
+    """Yield a match for every keyboard walk in ``password``."""
+    tables = adjacency_tables()
+    names = [layout.name for layout in LAYOUTS]
+    for walk in find_walks(password):
+        layout = names.index(walk.layout)
+        keys, degree = tables.keys[layout], tables.degrees[layout]
+        # Walks of up to ``length`` keys with up to ``turns`` straight
+        # segments: sum over j segments of (C(length, j) - 1) * keys * degree**j.
+        length, turns = walk.length, walk.turns + 1
+        guesses = keys * sum(
+            (math.comb(length, j) - 1) * degree ** j for j in range(1, min(turns, length - 1) + 1)
+        )
+        shifted, unshifted = walk.shifted, walk.length - walk.shifted
+        if shifted and unshifted:
+            guesses *= sum(
+                math.comb(walk.length, i) for i in range(1, min(shifted, unshifted) + 1)
+            )
+        elif shifted:
+            guesses *= 2
+        yield Match(walk.start, walk.end, "walk", _floor(guesses, walk.length))
+
+
+def repeat_matches(
+    password: str, estimate: Callable[[str], float],
+) -> Iterator[Match]:
+    """Yield a match for every run of a repeated substring, e.g. "abcabc".
+
+    ``estimate`` prices the repeated unit.
+    """
+    for match in _REPEAT.finditer(password):
+        unit = match.group(1)
+        count = len(match.group(0)) // len(unit)
+        guesses = estimate(unit) * count
+        yield Match(match.start(), match.end(), "repeat", _floor(guesses, len(match.group(0))))
+
+
+def sequence_matches(password: str) -> Iterator[Match]:
+    """Yield a match for every run of 3+ evenly spaced characters, e.g. "2468"."""
+    n = len(password)
+    start = 0
+    while start < n - 2:
+        delta = ord(password[start + 1]) - ord(password[start])
+        end = start + 2
+        while end < n and ord(password[end]) - ord(password[end - 1]) == delta:
+            end += 1
+        if end - start >= 3 and 0 < abs(delta) <= 5:
+            token = password[start:end]
+            first = token[0]
+            if first in _SEQUENCE_STARTS:
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            if delta < 0:
+                base *= 2
+            yield Match(start, end, "sequence", _floor(base * len(token), len(token)))
+        start = end - 1
+
+
+def _year_space(year: int) -> int:
+    return max(abs(REFERENCE_YEAR - year), MIN_YEAR_SPACE)
+
+
+def _two_digit_year(year: int) -> int:
+    return year + (1900 if year > 50 else 2000)
+
+
+def _valid_date(parts: tuple[int, int, int], year_first: bool) -> int | None:
+    """Return the year of a plausible (day, month, year) reading, or None."""
+    if year_first:
+        year, a, b = parts
+    else:
+        a, b, year = parts
+    if year < 100:
+        year = _two_digit_year(year)
+    if not 1000 <= year <= 2050:
+        return None
+    for day, month in ((a, b), (b, a)):
+        if 1 <= day <= 31 and 1 <= month <= 12:
+            return year
+    return None
+
+
+def date_matches(password: str) -> Iterator[Match]:
+    """Yield a match for every year and plausible date in ``password``."""
+    for match in _YEAR.finditer(password):
+        guesses = _year_space(int(match.group()))
+        yield Match(match.start(), match.end(), "date", _floor(guesses, 4))
+
+    for match in _DATE_WITH_SEPARATOR.finditer(password):
+        first, _, middle, last = match.groups()
+        parts = (int(first), int(middle), int(last))
+        year = _valid_date(parts, len(first) > 2) or _valid_date(parts, False)
+        if year is not None:
+            guesses = 365 * _year_space(year) * 4
+            yield Match(match.start(), match.end(), "date", guesses)
+
+    # Digit runs without separators, such as "13051990" or "0511".
+    for run in _DIGITS.finditer(password):
+        digits, offset = run.group(), run.start()
+        for start in range(len(digits) - 3):
+            for end in range(start + 4, min(len(digits), start + 8) + 1):
+                space = _digit_year(digits[start:end])
+                if space:
+                    yield Match(offset + start, offset + end, "date", 365 * space)
+
+
+@functools.lru_cache(maxsize=4096)
+def _digit_year(token: str) -> int:
+    """Return the year space of ``token`` read as a date, or 0."""
+    best = 0
+    for year_length in (2, 4):
+        rest = len(token) - year_length
+        if not 2 <= rest <= 4:
+            continue
+        for year_first in (True, False):
+            year = token[:year_length] if year_first else token[rest:]
+            body = token[year_length:] if year_first else token[:rest]
+            for split in range(1, len(body)):
+                a, b = body[:split], body[split:]
+                if len(a) > 2 or len(b) > 2:
+                    continue
+                found = _valid_date((int(a), int(b), int(year)), False)
+                if found is not None:
+                    space = _year_space(found)
+                    best = space if not best else min(best, space)
+    return best
+
+
+def all_matches(password: str, wordlist: WordList) -> list[Match]:
+    """Return every pattern match in ``password``."""
+    matches: list[Match] = list(dictionary_matches(password, wordlist))
+    matches.extend(walk_matches(password))
+    matches.extend(sequence_matches(password))
+    matches.extend(date_matches(password))
+    matches.extend(repeat_matches(password, lambda unit: _estimate(unit, wordlist).guesses))
+    return matches
+
+
+def estimate_guesses(password: str, wordlist: WordList | None = None) -> GuessEstimate:
+    """Estimate how many guesses it takes to find ``password``.
+
+    Dictionary words come from the bundled top-100 list unless another
+    ``wordlist`` is given.
+    """
+    if wordlist is None:
+        from .checks import default_wordlist
+
+        wordlist = default_wordlist()
+    head = password[:MAX_ESTIMATE_LENGTH]
+    estimate = _estimate(head, wordlist)
+    if len(password) > len(head):
+        estimate.log10 += (len(password) - len(head)) * math.log10(BRUTEFORCE_CARDINALITY)
+        estimate.sequence.append(_bruteforce(len(head), len(password)))
+    return estimate
+
+
+def _estimate(password: str, wordlist: WordList) -> GuessEstimate:
+    n = len(password)
+    if not n:
+        return GuessEstimate(0.0, [])
+    ending_at: list[list[Match]] = [[] for _ in range(n + 1)]
+    for match in all_matches(password, wordlist):
+        ending_at[match.end].append(match)
+
+    # best[k] is the lowest log10 guesses covering password[:k], split by
+    # whether the last token is a match (0) or brute force (1); back[k]
+    # records how that cost was reached.
+    log_bruteforce = math.log10(BRUTEFORCE_CARDINALITY)
+    log_penalty = math.log10(TOKEN_PENALTY)
+    inf = math.inf
+    best = [[inf, inf] for _ in range(n + 1)]
+    back: list[list[tuple[int, Match | None]]] = [[(0, None), (0, None)] for _ in range(n + 1)]
+    best[0] = [0.0, inf]
+    for k in range(1, n + 1):
+        # Extend a brute-force run, or start one after a match.
+        extend = best[k - 1][1] + log_bruteforce
+        start = best[k - 1][0] + log_bruteforce + (log_penalty if k > 1 else 0.0)
+        if extend <= start:
+            best[k][1], back[k][1] = extend, (1, None)
+        else:
+            best[k][1], back[k][1] = start, (0, None)
+        for match in ending_at[k]:
+            i = match.start
+            previous = min(best[i])
+            cost = previous + math.log10(match.guesses) + (log_penalty if i else 0.0)
+            if cost < best[k][0]:
+                best[k][0], back[k][0] = cost, (0 if best[i][0] <= best[i][1] else 1, match)
+
+    # Walk back through the cheapest decomposition.
+    sequence: list[Match] = []
+    state = 0 if best[n][0] <= best[n][1] else 1
+    total = best[n][state]
+    k = n
+    run_end = None
+    while k > 0:
+        previous, match = back[k][state]
+        if match is not None:
+            if run_end is not None:
+                sequence.append(_bruteforce(k, run_end))
+                run_end = None
+            sequence.append(match)
+            k = match.start
+        else:
+            if run_end is None:
+                run_end = k
+            k -= 1
+        state = previous
+    if run_end is not None:
+        sequence.append(_bruteforce(0, run_end))
+    sequence.reverse()
+    return GuessEstimate(total, sequence)
+
+
+def _bruteforce(start: int, end: int) -> Match:
+    guesses = _power_of_ten((end - start) * math.log10(BRUTEFORCE_CARDINALITY))
+    return Match(start, end, "bruteforce", guesses)
@@ -0,0 +1,117 @@
+"""Import-time measurement harness.
+
+Runs a fresh interpreter with ``python -X importtime`` and reports the cost
+of every module the import pulled in::
+
+    python -m password_analyzer.importtime password_analyzer.cli --top 15
+
+Times are in microseconds, as printed by the interpreter: ``self_us`` is
+the time spent executing the module itself and ``cumulative_us`` includes
+everything it imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import subprocess
+import sys
+
+
+@dataclasses.dataclass
+class ImportCost:
+    """Import cost of one module."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportCost]:
+    """Parse ``-X importtime`` output, skipping lines that are not timings."""
+    costs = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        costs.append(ImportCost(module, int(fields[0]), int(fields[1]), depth))
+    return costs
+
+
+def measure(module: str, python: str = sys.executable) -> list[ImportCost]:
+    """Import ``module`` in a fresh interpreter and return per-module costs.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr}")
+    return parse_importtime(proc.stderr)
+
+
+def cold_start(module: str, runs: int = 3, python: str = sys.executable) -> float:
+    """Return the best cumulative import time of ``module`` over ``runs``, in ms."""
+    best = None
+    for _ in range(runs):
+        costs = {c.module: c.cumulative_us for c in measure(module, python)}
+        total = costs.get(module, 0)
+        best = total if best is None else min(best, total)
+    return (best or 0) / 1000
+
+
+def format_report(costs: list[ImportCost], top: int | None = None) -> str:
+    """Render costs as a table, most expensive cumulative first."""
+    ordered = sorted(costs, key=lambda c: c.cumulative_us, reverse=True)
+    if top is not None:
+        ordered = ordered[:top]
+    lines = [f"{'cumulative ms':>13}  {'self ms':>8}  module"]
+    for cost in ordered:
+        lines.append(
+            f"{cost.cumulative_us / 1000:>13.2f}  {cost.self_us / 1000:>8.2f}  {cost.module}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m password_analyzer.importtime",
+        description="Report per-module import costs of a fresh import.",
+    )
+    parser.add_argument(
+        "module",
+        nargs="?",
+        default="password_analyzer.cli",
+        help="Module to import (default: password_analyzer.cli).",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        metavar="N",
+        help="Show the N most expensive modules (default: 20; 0 for all).",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        costs = measure(args.module)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(format_report(costs, args.top or None))
+    own = sum(c.self_us for c in costs if c.module.split(".")[0] == "password_analyzer")
+    print(f"\n{len(costs)} modules imported; password_analyzer's own modules: "
+          f"{own / 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Opt-in per-check timing instrumentation and hooks.
+
+An ``Instrumentation`` passed to ``PasswordAnalyzer`` times every check
+with ``time.perf_counter_ns`` and records the times in log-linear
+histograms. These use constant memory and are accurate to within 1/8
+of a value. Callers can also register hooks that run before and after
+each check. Analyzers without instrumentation never reach this module,
+so they pay nothing for it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .checks import CheckResult
+
+# Each power of two is split into 2**SUB_BITS equal buckets.
+SUB_BITS = 3
+_SUB = 1 << SUB_BITS
+_BUCKETS = _SUB * 64
+
+# Name under which the per-password profile build is recorded.
+PROFILE_STEP = "Character profile"
+
+BeforeHook = Callable[[str], None]
+AfterHook = Callable[[str, "CheckResult | float", int], None]
+
+
+def _bucket(ns: int) -> int:
+    if ns < 2 * _SUB:
+        return ns
+    shift = ns.bit_length() - SUB_BITS - 1
+    return shift * _SUB + (ns >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Return the smallest and largest value recorded in bucket ``index``."""
+    if index < 2 * _SUB:
+        return index, index
+    shift = index // _SUB - 1
+    mantissa = index % _SUB + _SUB
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Histogram:
+    """Log-linear histogram of durations in nanoseconds."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int) -> None:
+        self.counts[_bucket(ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other: Histogram) -> None:
+        """Add the samples of ``other`` to this histogram."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Return an upper bound on the ``q``-th percentile (0-100), in ns."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1], self.max_ns)
+        return self.max_ns
+
+
+@dataclasses.dataclass
+class CheckTiming:
+    """Summary of one check's recorded times."""
+
+    name: str
+    calls: int
+    total_ms: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+
+class Instrumentation:
+    """Per-check timing histograms and before/after hooks.
+
+    Hooks receive the check name; after-hooks also get the ``CheckResult``
+    and the check's wall time in nanoseconds. In score-only evaluation
+    (``PasswordAnalyzer.strength`` and ``meets``) they get the bare score
+    instead of a ``CheckResult``. Hooks run outside the timed region, so
+    their cost does not count towards the check.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+        self.before_hooks: list[BeforeHook] = []
+        self.after_hooks: list[AfterHook] = []
+
+    def add_hook(
+        self, before: BeforeHook | None = None, after: AfterHook | None = None,
+    ) -> None:
+        """Register callbacks to run before and/or after each check."""
+        if before is not None:
+            self.before_hooks.append(before)
+        if after is not None:
+            self.after_hooks.append(after)
+
+    def histogram(self, name: str) -> Histogram:
+        """Return the histogram for ``name``, creating it on first use."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def before(self, name: str) -> None:
+        """Run the before-hooks for check ``name``."""
+        for hook in self.before_hooks:
+            hook(name)
+
+    def after(self, name: str, result: CheckResult | float, elapsed_ns: int) -> None:
+        """Record a timed check and run the after-hooks."""
+        self.histogram(name).record(elapsed_ns)
+        for hook in self.after_hooks:
+            hook(name, result, elapsed_ns)
+
+    def wrap(self, name: str, check: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``check`` with timing and hooks around every call."""
+        before = self.before
+        after = self.after
+        clock = time.perf_counter_ns
+
+        def timed(*args):
+            before(name)
+            start = clock()
+            result = check(*args)
+            after(name, result, clock() - start)
+            return result
+
+        return timed
+
+    def reset(self) -> None:
+        """Drop every recorded time; hooks are kept."""
+        for histogram in self.histograms.values():
+            histogram.clear()
+
+    def report(self) -> list[CheckTiming]:
+        """Summarize each check's timings, in the order checks first ran."""
+        return [
+            CheckTiming(
+                name=name,
+                calls=h.count,
+                total_ms=round(h.total_ns / 1e6, 3),
+                mean_us=round(h.mean_ns / 1e3, 3),
+                p50_us=round(h.percentile(50) / 1e3, 3),
+                p99_us=round(h.percentile(99) / 1e3, 3),
+                max_us=round(h.max_ns / 1e3, 3),
+            )
+            for name, h in self.histograms.items()
+            if h.count
+        ]
@@ -0,0 +1,220 @@
+"""Keyboard adjacency walks on common layouts.
+
+A walk is a run of keys where each key sits next to the previous one on
+the same layout, such as "xsw2", "poiuy" or "7896" on a keypad. Walks may
+turn and may mix shifted and unshifted keys ("1qAZ"). ``find_walks``
+reports every maximal walk of at least ``MIN_WALK_LENGTH`` keys in one
+pass over the password.
+
+Layouts are modelled as rows of keys with a horizontal offset per row in
+half-key units, which captures the stagger of a typewriter keyboard. Two
+keys are adjacent when they are neighbours in the same row, or in
+neighbouring rows at most one key apart horizontally.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import itertools
+
+# Walks shorter than this are too common in ordinary text to count.
+MIN_WALK_LENGTH = 4
+
+
+@dataclasses.dataclass(frozen=True)
+class Layout:
+    """A keyboard layout.
+
+    Attributes:
+        name: Name used in reports.
+        rows: Unshifted characters of each row; spaces mark missing keys.
+        shifted: Shifted characters of each row, aligned with ``rows``.
+        offsets: Horizontal offset of each row's first key, in half keys.
+    """
+
+    name: str
+    rows: tuple[str, ...]
+    shifted: tuple[str, ...]
+    offsets: tuple[int, ...]
+
+
+LAYOUTS: tuple[Layout, ...] = (
+    Layout(
+        "QWERTY",
+        ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./"),
+        ("~!@#$%^&*()_+", "QWERTYUIOP{}|", 'ASDFGHJKL:"', "ZXCVBNM<>?"),
+        (0, 3, 4, 5),
+    ),
+    Layout(
+        "QWERTZ",
+        ("^1234567890ß´", "qwertzuiopü+", "asdfghjklöä#", "<yxcvbnm,.-"),
+        ("°!\"§$%&/()=?`", "QWERTZUIOPÜ*", "ASDFGHJKLÖÄ'", ">YXCVBNM;:_"),
+        (0, 3, 4, 3),
+    ),
+    Layout(
+        "AZERTY",
+        ("²&é\"'(-è_çà)=", "azertyuiop^$", "qsdfghjklmù*", "<wxcvbn,;:!"),
+        (" 1234567890°+", "AZERTYUIOP¨£", "QSDFGHJKLM%µ", ">WXCVBN?./§"),
+        (0, 3, 4, 3),
+    ),
+    Layout(
+        "keypad",
+        (" /*-", "789+", "456", "123", "0 ."),
+        ("", "", "", "", ""),
+        (0, 0, 0, 0, 0),
+    ),
+)
+
+
+@dataclasses.dataclass
+class KeyboardWalk:
+    """A walk found in a password, spanning ``password[start:end]``.
+
+    Attributes:
+        layout: Name of the layout the walk follows.
+        turns: How many times the walk changes direction.
+        shifted: How many of its keys were typed with shift.
+    """
+
+    start: int
+    end: int
+    layout: str
+    turns: int
+    shifted: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+    @property
+    def deliberate(self) -> bool:
+        """Whether the walk mostly keeps its direction.
+
+        Random strings often contain short walks that turn at almost every
+        key; typed patterns such as "qwedsa" mostly go straight.
+        """
+        return self.turns * 2 < self.length
+
+
+# Position offsets (rows, half keys) of the keys next to a key. Keys in
+# neighbouring rows are at odd offsets on staggered layouts and at even
+# ones on the keypad grid, where diagonals count.
+_NEIGHBOURS = ((0, -2), (0, 2)) + tuple(
+    (dr, dx) for dr in (-1, 1) for dx in (-2, -1, 0, 1, 2)
+)
+
+
+@dataclasses.dataclass
+class AdjacencyTables:
+    """Adjacency lookups built from ``LAYOUTS``."""
+
+    # (a, b) -> bit mask of the layouts where b is next to a.
+    pair_masks: dict[tuple[str, str], int]
+    # Per layout: (a, b) -> direction of the step from a to b.
+    directions: list[dict[tuple[str, str], tuple[int, int]]]
+    # Per layout: the characters typed with shift.
+    shifted: list[frozenset[str]]
+    # Per layout: the number of keys and their mean number of neighbours.
+    keys: list[int]
+    degrees: list[float]
+
+
+def _keys(layout: Layout) -> dict[tuple[int, int], str]:
+    """Map each key position (row, x in half keys) to the characters on it."""
+    keys = {}
+    for row, (plain, shifted) in enumerate(zip(layout.rows, layout.shifted)):
+        for col, char in enumerate(plain):
+            chars = (char + (shifted[col] if col < len(shifted) else "")).replace(" ", "")
+            if chars:
+                keys[row, layout.offsets[row] + 2 * col] = chars
+    return keys
+
+
+@functools.lru_cache(maxsize=None)
+def adjacency_tables() -> AdjacencyTables:
+    """Return the adjacency tables, built on first use."""
+    pair_masks: dict[tuple[str, str], int] = {}
+    directions = []
+    shifted = []
+    key_counts = []
+    degrees = []
+    for bit, layout in enumerate(LAYOUTS):
+        keys = _keys(layout)
+        steps = {}
+        edges = 0
+        for (row, x), chars in keys.items():
+            for dr, dx in _NEIGHBOURS:
+                neighbour = keys.get((row + dr, x + dx))
+                if neighbour is None:
+                    continue
+                edges += 1
+                for a in chars:
+                    for b in neighbour:
+                        steps[a, b] = (dr, dx)
+                        pair_masks[a, b] = pair_masks.get((a, b), 0) | 1 << bit
+        directions.append(steps)
+        shifted.append(frozenset("".join(layout.shifted).replace(" ", "")))
+        key_counts.append(len(keys))
+        degrees.append(edges / len(keys))
+    return AdjacencyTables(pair_masks, directions, shifted, key_counts, degrees)
+
+
+# Per layout: a bytes.translate table mapping each pair mask to 1 if it
+# includes the layout, else 0.
+_LAYOUT_BITS = tuple(
+    bytes(m >> bit & 1 for m in range(256)) for bit in range(len(LAYOUTS))
+)
+_ANY_LAYOUT = bytes(min(m, 1) for m in range(256))
+
+
+def find_walks(password: str, min_length: int = MIN_WALK_LENGTH) -> list[KeyboardWalk]:
+    """Return the maximal keyboard walks of at least ``min_length`` keys.
+
+    Each neighbouring pair of characters is looked up once, giving a byte
+    string of layout masks that is then searched for runs with bytes
+    methods. Walks are reported in order of position. When the same keys
+    form a walk on several layouts, the first layout in ``LAYOUTS`` is
+    reported, and walks lying inside a longer one are dropped.
+    """
+    if len(password) < min_length:
+        return []
+    t = adjacency_tables()
+    masks = bytes(map(t.pair_masks.get, zip(password, password[1:]), itertools.repeat(0)))
+    run = b"\1" * (min_length - 1)
+    # Most passwords have no run of adjacent pairs long enough to matter.
+    if run not in masks.translate(_ANY_LAYOUT):
+        return []
+
+    spans = []
+    for bit, table in enumerate(_LAYOUT_BITS):
+        flags = masks.translate(table)
+        start = flags.find(run)
+        while start >= 0:
+            end = flags.find(b"\0", start)
+            if end < 0:
+                end = len(flags)
+            spans.append((start, -end - 1, bit))
+            start = flags.find(run, end)
+    spans.sort()
+
+    walks: list[KeyboardWalk] = []
+    end = 0
+    for start, negative_end, bit in spans:
+        if -negative_end > end:
+            end = -negative_end
+            walks.append(_walk(password, start, end, bit, t))
+    return walks
+
+
+def _walk(password: str, start: int, end: int, bit: int, t: AdjacencyTables) -> KeyboardWalk:
+    steps = t.directions[bit]
+    turns = 0
+    previous = None
+    for pair in zip(password[start:end], password[start + 1:end]):
+        direction = steps[pair]
+        if previous is not None and direction != previous:
+            turns += 1
+        previous = direction
+    shifted = sum(map(t.shifted[bit].__contains__, password[start:end]))
+    return KeyboardWalk(start, end, LAYOUTS[bit].name, turns, shifted)
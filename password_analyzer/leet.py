@@ -0,0 +1,197 @@
+"""Dictionary matching through leetspeak substitutions.
+
+"P@ssw0rd" and "$unsh1ne" are dictionary words with a few letters swapped
+for look-alike symbols. Rather than generating every variant of the
+password (2^k for k ambiguous characters), the matcher walks the word
+list's trie from every start position at once and, at every character,
+follows both the character itself and each letter it may stand for.
+Branches die as soon as no entry has the spelled-out prefix, and at most
+``MAX_BRANCHES`` trie nodes stay live at a time, so the work per password
+is linear in its length. The live nodes after each character form the
+state of a lazily built DFA, so repeated work is cached.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import weakref
+from collections.abc import Hashable, Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .wordlist import WordList
+
+# Each character and the letters it commonly stands for.
+SUBSTITUTIONS: Mapping[str, str] = {
+    "4": "a", "@": "a", "8": "b", "(": "c", "{": "c", "[": "c", "<": "c",
+    "3": "e", "6": "g", "9": "g", "#": "h", "1": "il", "!": "i", "|": "il",
+    "0": "o", "5": "s", "$": "s", "7": "lt", "+": "t", "2": "z", "%": "x",
+}
+# Only this many leading characters are searched.
+MAX_LEET_LENGTH = 64
+# Trie nodes kept live at once; the walks that started earliest are kept.
+# Backends that cannot rule out prefixes keep every walk live, so with
+# them only the first few start positions are searched.
+MAX_BRANCHES = 16
+MAX_TRANSITIONS = 65_536
+
+
+@dataclasses.dataclass(frozen=True)
+class LeetMatch:
+    """A dictionary word spelled with substitutions at ``text[start:end]``.
+
+    Attributes:
+        word: The dictionary entry with the substitutions undone.
+        substitutions: Distinct ``(character, letter)`` pairs used, in
+            order of first use.
+    """
+
+    start: int
+    end: int
+    word: str
+    substitutions: tuple[tuple[str, str], ...]
+
+    def describe(self) -> str:
+        """Describe the substitutions, e.g. "'@' for 'a', '0' for 'o'"."""
+        return ", ".join(f"'{char}' for '{letter}'" for char, letter in self.substitutions)
+
+
+class LeetMatcher:
+    """Finds a word list's entries spelled with substitutions.
+
+    The set of live trie nodes after each character is the state of a DFA
+    over the password. Transitions are computed from the trie on first use
+    and cached, so passwords mostly cost one dict lookup per character.
+    At most ``MAX_TRANSITIONS`` transitions are cached.
+    """
+
+    def __init__(
+        self, wordlist: WordList, substitutions: Mapping[str, str] = SUBSTITUTIONS,
+    ) -> None:
+        self.wordlist = wordlist
+        self.table = substitutions
+        self.substitutions = dict(substitutions)
+        self._root: _State = ((wordlist.trie_root(), ""),)
+        self._transitions: dict[tuple[_State, str, bool], tuple[_State, tuple[str, ...]]] = {}
+
+    def matches(self, text: str, min_length: int = 1) -> list[LeetMatch]:
+        """Return every entry of ``min_length``+ chars spelled with substitutions.
+
+        ``text`` should already be lowercased. Entries found verbatim, with
+        no substitution, are left to ``WordList.matches``.
+        """
+        text = text[:MAX_LEET_LENGTH]
+        if self.substitutions.keys().isdisjoint(text):
+            return []
+        return self._run(text, min_length, anchored=False)
+
+    def entry(self, text: str) -> LeetMatch | None:
+        """Return the match if all of ``text`` is an entry spelled with substitutions."""
+        if len(text) > MAX_LEET_LENGTH or self.substitutions.keys().isdisjoint(text):
+            return None
+        found = self._run(text, len(text), anchored=True)
+        return found[0] if found else None
+
+    def _run(self, text: str, min_length: int, anchored: bool) -> list[LeetMatch]:
+        transitions = self._transitions
+        state: _State = self._root if anchored else ()
+        found = []
+        for end, char in enumerate(text, 1):
+            key = (state, char, anchored)
+            transition = transitions.get(key)
+            if transition is None:
+                transition = self._transition(state, char, anchored)
+                if len(transitions) >= MAX_TRANSITIONS:
+                    transitions.clear()
+                transitions[key] = transition
+            state, words = transition
+            for word in words:
+                start = end - len(word)
+                written = text[start:end]
+                if len(word) >= min_length and written != word:
+                    found.append(LeetMatch(start, end, word, _substitutions(written, word)))
+            if anchored and not state:
+                break
+        return found
+
+    def _transition(
+        self, state: _State, char: str, anchored: bool,
+    ) -> tuple[_State, tuple[str, ...]]:
+        """Step every live node by each spelling of ``char``.
+
+        Unanchored walks also start afresh at every character. A trie node
+        fixes the length of its prefix, so walks that reach the same node
+        at the same position started at the same position and are merged.
+        """
+        step = self.wordlist.trie_step
+        spellings = char + self.substitutions.get(char, "")
+        following: dict[Hashable, str] = {}
+        words = []
+        for node, prefix in state if anchored else state + self._root:
+            for letter in spellings:
+                extended = step(node, letter)
+                if extended is None:
+                    continue
+                child, is_entry = extended
+                if child in following:
+                    continue
+                word = prefix + letter
+                if is_entry:
+                    words.append(word)
+                if len(following) < MAX_BRANCHES:
+                    following[child] = word
+        return tuple(following.items()), tuple(words)
+
+
+_State = tuple[tuple[Hashable, str], ...]
+_MATCHERS: weakref.WeakKeyDictionary[WordList, dict[int, LeetMatcher]] = (
+    weakref.WeakKeyDictionary()
+)
+# The most recently used matcher; checks reuse one word list and table.
+_last: LeetMatcher | None = None
+
+
+def leet_matcher(
+    wordlist: WordList, substitutions: Mapping[str, str] = SUBSTITUTIONS,
+) -> LeetMatcher:
+    """Return the shared matcher for a word list and substitution table.
+
+    Matchers are kept per table object, so tables must not be changed
+    after use; pass a new mapping instead.
+    """
+    global _last
+    last = _last
+    if last is not None and last.wordlist is wordlist and last.table is substitutions:
+        return last
+    by_table = _MATCHERS.get(wordlist)
+    if by_table is None:
+        by_table = _MATCHERS[wordlist] = {}
+    matcher = by_table.get(id(substitutions))
+    if matcher is None or matcher.table is not substitutions:
+        matcher = by_table[id(substitutions)] = LeetMatcher(wordlist, substitutions)
+    _last = matcher
+    return matcher
+
+
+def leet_matches(
+    text: str,
+    wordlist: WordList,
+    min_length: int = 1,
+    substitutions: Mapping[str, str] = SUBSTITUTIONS,
+) -> list[LeetMatch]:
+    """Return every entry of ``min_length``+ chars in ``text`` spelled with substitutions."""
+    return leet_matcher(wordlist, substitutions).matches(text, min_length)
+
+
+def leet_entry(
+    text: str,
+    wordlist: WordList,
+    substitutions: Mapping[str, str] = SUBSTITUTIONS,
+) -> LeetMatch | None:
+    """Return the match if all of ``text`` is an entry spelled with substitutions."""
+    return leet_matcher(wordlist, substitutions).entry(text)
+
+
+def _substitutions(found: str, word: str) -> tuple[tuple[str, str], ...]:
+    pairs = dict.fromkeys((a, b) for a, b in zip(found, word) if a != b)
+    return tuple(pairs)
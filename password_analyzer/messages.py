@@ -0,0 +1,111 @@
+"""Feedback message codes, rendered to text only when needed.
+
+Checks report feedback as ``Message`` values: a ``MessageCode`` plus the
+parameters its template needs. Results stay small because messages
+without parameters are shared, and text is only formatted when someone
+reads it. Each code also says whether it is a suggestion or a strength,
+so callers can sort feedback without parsing the text.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+
+
+class MessageCode(enum.Enum):
+    """Kinds of feedback; the value is ``(template, is_suggestion)``.
+
+    Templates are ``str.format`` strings filled from ``Message.args``.
+    """
+
+    LENGTH_TOO_SHORT = ("Too short — use at least 8 characters.", True)
+    LENGTH_DECENT = ("Decent length (8-11 characters).", False)
+    LENGTH_GOOD = ("Good length (12-15 characters).", False)
+    LENGTH_GREAT = ("Great length (16+ characters).", False)
+    HAS_CLASS = ("Contains {0}.", False)
+    MISSING_CLASS = ("Add {0}.", True)
+    COMMON_PASSWORD = ("This is an extremely common password — choose something unique.", True)
+    COMMON_WORD = ("Contains the common word '{0}' — avoid dictionary words.", True)
+    LEET_PASSWORD = (
+        "This is the common password '{0}' with predictable substitutions ({1}).",
+        True,
+    )
+    LEET_WORD = (
+        "Contains the common word '{0}' despite substitutions ({1}) — avoid dictionary words.",
+        True,
+    )
+    AFFIXED_PASSWORD = (
+        "This is the common password '{0}' with predictable additions ({1}).",
+        True,
+    )
+    NEAR_PASSWORD = (
+        "Close to the common password '{0}' (edit distance {1}) — attackers try typos too.",
+        True,
+    )
+    BREACHED = ("Found in breach data {0:,} times — never use a breached password.", True)
+    REPEATED = ("Contains repeated characters (e.g., 'aaa').", True)
+    SEQUENTIAL = ("Contains sequential characters (e.g., 'abc', '123').", True)
+    REVERSE_SEQUENTIAL = ("Contains reverse sequential characters (e.g., 'cba', '321').", True)
+    KEYBOARD_PATTERN = ("Contains keyboard pattern '{0}'.", True)
+    KEYBOARD_WALK = ("Contains keyboard walk '{0}' ({1} adjacent keys on {2}).", True)
+    NO_PATTERNS = ("No common patterns detected.", False)
+    ENTROPY_GOOD = ("Good entropy ({0:.1f} bits).", False)
+    ENTROPY_MODERATE = ("Moderate entropy ({0:.1f} bits).", False)
+    ENTROPY_LOW = ("Low entropy ({0:.1f} bits) — use a longer, more varied password.", True)
+    GUESSES_LOW = (
+        "Easy to guess (about 10^{0:.0f} guesses) — avoid words, dates and keyboard patterns.",
+        True,
+    )
+    GUESSES_MODERATE = ("Moderately hard to guess (about 10^{0:.0f} guesses).", False)
+    GUESSES_HIGH = ("Hard to guess (about 10^{0:.0f} guesses).", False)
+    # Free text from custom checks.
+    TEXT = ("{0}", False)
+    TEXT_SUGGESTION = ("{0}", True)
+
+    def __init__(self, template: str, is_suggestion: bool) -> None:
+        self.template = template
+        self.is_suggestion = is_suggestion
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Message:
+    """One piece of feedback: a code and the parameters of its template."""
+
+    code: MessageCode
+    args: tuple = ()
+
+    @property
+    def is_suggestion(self) -> bool:
+        return self.code.is_suggestion
+
+    def __str__(self) -> str:
+        return self.code.template.format(*self.args)
+
+    @classmethod
+    def text(cls, text: str, suggestion: bool | None = None) -> Message:
+        """Wrap free text from a custom check.
+
+        Unless ``suggestion`` says otherwise, the text counts as a suggestion
+        if it reads like one (see ``looks_like_suggestion``).
+        """
+        if suggestion is None:
+            suggestion = looks_like_suggestion(text)
+        return cls(MessageCode.TEXT_SUGGESTION if suggestion else MessageCode.TEXT, (text,))
+
+
+# Phrases that mark plain-text feedback as advice rather than a strength.
+_SUGGESTION_HINTS = (
+    "add ", "too ", "low entropy", "extremely common", "common word", "breach data",
+    "contains repeated", "contains sequential", "contains reverse", "contains keyboard",
+)
+
+
+def looks_like_suggestion(text: str) -> bool:
+    """Guess whether plain-text feedback is a suggestion from its wording.
+
+    Feedback from earlier versions, and custom checks that return strings,
+    carry no code; this keeps them sorted the way they always were.
+    """
+    lowered = text.lower()
+    return any(hint in lowered for hint in _SUGGESTION_HINTS)
@@ -0,0 +1,13 @@
+"""Choices shared by the command line, the analyzer and the modules behind them.
+
+Kept free of imports so they can be checked without loading those modules.
+"""
+
+# Record formats for bulk audits (see ``audit``).
+FORMATS = ("jsonl", "csv", "tsv")
+
+# Orders in which multi-process audits write records (see ``parallel``).
+ORDERS = ("input", "completion")
+
+# Most typos a near-miss lookup allows (see ``fuzzy``).
+MAX_NEAR_MISS_DISTANCE = 2
@@ -0,0 +1,186 @@
+"""Multi-process bulk audits over memory-mapped input files.
+
+The input file is split at newline boundaries into byte ranges. Workers
+receive only ``(start, end)`` offsets, map the file themselves and build
+their own analyzer once at start-up, so no password data crosses process
+boundaries on the way in.
+"""
+
+from __future__ import annotations
+
+import collections
+import io
+import itertools
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, TextIO
+
+from .analyzer import PasswordAnalyzer
+from .audit import check_format, format_header, iter_records
+from .options import ORDERS
+from .wordlist import map_file
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+# Target size of each work unit; small enough to balance load across
+# workers, large enough to amortize task overhead.
+DEFAULT_CHUNK_BYTES = 4 << 20
+
+_worker_analyzer: PasswordAnalyzer | None = None
+
+
+def split_ranges(data: bytes | mmap.mmap, chunks: int) -> list[tuple[int, int]]:
+    """Split a buffer into at most ``chunks`` byte ranges on line boundaries.
+
+    Every range starts at the beginning of a line and ends just after a
+    newline (or at the end of the buffer); empty ranges are dropped.
+    """
+    size = len(data)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for i in range(1, chunks + 1):
+        if i == chunks:
+            end = size
+        else:
+            newline = data.find(b"\n", max(size * i // chunks - 1, start))
+            end = size if newline < 0 else newline + 1
+        if end > start:
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _init_worker(make_analyzer: Callable[[], PasswordAnalyzer]) -> None:
+    global _worker_analyzer
+    _worker_analyzer = make_analyzer()
+
+
+def _read_range(path: str, start: int, end: int) -> bytes:
+    data = map_file(path)
+    try:
+        return data[start:end]
+    finally:
+        close = getattr(data, "close", None)
+        if close is not None:
+            close()
+
+
+def _count_lines(path: str, start: int, end: int) -> int:
+    chunk = _read_range(path, start, end)
+    return chunk.count(b"\n") + (not chunk.endswith(b"\n"))
+
+
+def _audit_range(
+    path: str, start: int, end: int, first_line: int, fmt: str,
+) -> tuple[str, int]:
+    assert _worker_analyzer is not None
+    chunk = _read_range(path, start, end)
+    records = list(iter_records(io.BytesIO(chunk), fmt, _worker_analyzer, first_line))
+    return "".join(records), len(records)
+
+
+def parallel_audit(
+    path: str | os.PathLike[str],
+    out: TextIO,
+    fmt: str = "jsonl",
+    make_analyzer: Callable[[], PasswordAnalyzer] = PasswordAnalyzer,
+    jobs: int | None = None,
+    order: str = "input",
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> int:
+    """Audit a file across ``jobs`` worker processes.
+
+    Args:
+        path: Newline-delimited password file.
+        out: Text stream receiving the records.
+        fmt: Record format (see ``audit.FORMATS``).
+        make_analyzer: Picklable factory run once in every worker.
+        jobs: Worker count; defaults to the number of CPUs.
+        order: ``"input"`` writes records in file order; ``"completion"``
+            writes each chunk as soon as it is done.
+        chunk_bytes: Approximate size of each work unit.
+
+    Returns:
+        The number of passwords analyzed.
+    """
+    check_format(fmt)
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order {order!r}; expected one of {', '.join(ORDERS)}.")
+    path = os.fspath(path)
+    jobs = jobs or os.cpu_count() or 1
+
+    data = map_file(path)
+    try:
+        chunks = max(jobs, -(-len(data) // chunk_bytes))
+        ranges = split_ranges(data, chunks)
+    finally:
+        close = getattr(data, "close", None)
+        if close is not None:
+            close()
+
+    header = format_header(fmt)
+    if header is not None:
+        out.write(header)
+
+    # Imported here so the CLI can offer --jobs without paying for the
+    # executor machinery on every start.
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(make_analyzer,),
+    ) as pool:
+        # Line numbers of each chunk come from a cheap parallel newline count.
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        counts = pool.map(_count_lines, itertools.repeat(path), starts, ends)
+        first_lines = []
+        line = 1
+        for count in counts:
+            first_lines.append(line)
+            line += count
+
+        tasks = (
+            (path, start, end, first, fmt)
+            for (start, end), first in zip(ranges, first_lines)
+        )
+        total = 0
+        for records, count in _run_bounded(pool, tasks, 2 * jobs, order):
+            out.write(records)
+            total += count
+    return total
+
+
+def _run_bounded(
+    pool: concurrent.futures.Executor,
+    tasks: Iterator[tuple[str, int, int, int, str]],
+    window: int,
+    order: str,
+) -> Iterator[tuple[str, int]]:
+    """Run ``_audit_range`` tasks keeping at most ``window`` in flight."""
+    import concurrent.futures
+
+    pending: collections.deque[concurrent.futures.Future[tuple[str, int]]] = (
+        collections.deque()
+    )
+    for task in tasks:
+        pending.append(pool.submit(_audit_range, *task))
+        if len(pending) < window:
+            continue
+        if order == "input":
+            yield pending.popleft().result()
+        else:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                pending.remove(future)
+                yield future.result()
+
+    if order == "input":
+        while pending:
+            yield pending.popleft().result()
+    else:
+        for future in concurrent.futures.as_completed(pending):
+            yield future.result()
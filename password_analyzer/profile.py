@@ -0,0 +1,133 @@
+"""Single-pass character profile shared by the checks.
+
+Several checks need the same facts about a password: which character
+classes it contains, its lowercase form and its codepoints. Building them
+once here means each password is walked once instead of once per check.
+Passwords may also be given as raw bytes, as read from files and sockets.
+"""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+
+UPPER = 1
+LOWER = 2
+DIGIT = 4
+SYMBOL = 8
+
+
+def classify(char: str) -> int:
+    """Return the class bit mask of a single character.
+
+    The classes follow ``str.isupper``/``islower``/``isdigit`` and treat any
+    non-alphanumeric character as a symbol, so non-ASCII characters may
+    carry several bits or none.
+    """
+    mask = 0
+    if char.isupper():
+        mask |= UPPER
+    if char.islower():
+        mask |= LOWER
+    if char.isdigit():
+        mask |= DIGIT
+    if not char.isalnum():
+        mask |= SYMBOL
+    return mask
+
+
+# Class masks for the ASCII range, indexed by codepoint.
+ASCII_CLASSES: tuple[int, ...] = tuple(classify(chr(i)) for i in range(128))
+# ``bytes.translate`` table from ASCII bytes to their class masks. Every
+# ASCII character is in exactly one class, so each class can be counted.
+_ASCII_MASKS = bytes(ASCII_CLASSES) + bytes(128)
+
+# Anything ``build_profile`` and the analyzer accept as a password.
+PasswordInput = str | bytes | bytearray | memoryview
+
+
+@dataclasses.dataclass
+class PasswordProfile:
+    """Precomputed facts about a password, consumed by the checks."""
+
+    password: str
+    lower: str
+    codepoints: list[int]
+    upper_count: int
+    lower_count: int
+    digit_count: int
+    symbol_count: int
+    _entropy_bits: float | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    @property
+    def has_upper(self) -> bool:
+        return self.upper_count > 0
+
+    @property
+    def has_lower(self) -> bool:
+        return self.lower_count > 0
+
+    @property
+    def has_digit(self) -> bool:
+        return self.digit_count > 0
+
+    @property
+    def has_symbol(self) -> bool:
+        return self.symbol_count > 0
+
+    @property
+    def entropy_bits(self) -> float:
+        """Entropy estimate of the password, computed on first access."""
+        bits = self._entropy_bits
+        if bits is None:
+            from .entropy import calculate_entropy  # entropy imports this module
+
+            bits = self._entropy_bits = calculate_entropy(self.password, self)
+        return bits
+
+
+def build_profile(password: PasswordInput) -> PasswordProfile:
+    """Profile a password in one pass over its characters.
+
+    ASCII passwords take a fast path: their bytes are mapped to class masks
+    with one ``bytes.translate`` call and each class is counted. Bytes and
+    memoryviews are profiled as they are when ASCII, and otherwise decoded
+    as UTF-8 with undecodable bytes replaced. Anything else falls back to
+    the ``str`` predicates per character.
+    """
+    if isinstance(password, str):
+        if password.isascii():
+            return _ascii_profile(password.encode("ascii"), password)
+    else:
+        data = bytes(password)
+        if data.isascii():
+            return _ascii_profile(data, data.decode("ascii"))
+        password = data.decode("utf-8", errors="replace")
+
+    codepoints = [ord(c) for c in password]
+    masks = collections.Counter(
+        ASCII_CLASSES[cp] if cp < 128 else classify(chr(cp)) for cp in codepoints
+    )
+    counts = [0, 0, 0, 0]
+    for mask, n in masks.items():
+        if mask & UPPER:
+            counts[0] += n
+        if mask & LOWER:
+            counts[1] += n
+        if mask & DIGIT:
+            counts[2] += n
+        if mask & SYMBOL:
+            counts[3] += n
+
+    return PasswordProfile(password, password.lower(), codepoints, *counts)
+
+
+def _ascii_profile(data: bytes, password: str) -> PasswordProfile:
+    classes = data.translate(_ASCII_MASKS)
+    return PasswordProfile(
+        password, password.lower(), list(data),
+        classes.count(UPPER), classes.count(LOWER),
+        classes.count(DIGIT), classes.count(SYMBOL),
+    )
@@ -0,0 +1,217 @@
+"""Registry of the checks a ``PasswordAnalyzer`` runs.
+
+Each check is described by a ``CheckSpec``. The spec gives the check's
+relative cost and the range of scores it can contribute. It also holds a
+``build`` function that binds the check to an analyzer's configuration,
+such as its word list, and returns None when the check does not apply.
+Results are always reported in registration order. The costs let
+score-only evaluation (``PasswordAnalyzer.strength`` and ``meets``) run
+cheap checks first and stop as soon as the remaining checks can no longer
+change the answer.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .checks import (
+    CheckResult,
+    check_breached_password,
+    check_character_variety,
+    check_common_password,
+    check_entropy,
+    check_guesses,
+    check_length,
+    check_sequential_characters,
+    default_wordlist,
+    score_breached_password,
+    score_character_variety,
+    score_common_password,
+    score_entropy,
+    score_guesses,
+    score_length,
+    score_sequential_characters,
+)
+from .profile import PasswordProfile
+
+if TYPE_CHECKING:
+    from .analyzer import PasswordAnalyzer
+
+Check = Callable[[PasswordProfile], CheckResult]
+Score = Callable[[PasswordProfile], float]
+
+
+@dataclasses.dataclass(frozen=True)
+class CheckSpec:
+    """Describes a check and how to bind it to an analyzer.
+
+    Attributes:
+        name: The ``CheckResult.name`` the check reports.
+        build: Returns the check bound to an analyzer's configuration, or
+            None to skip it for that analyzer.
+        cost: Relative cost of running the check; cheaper checks run first
+            in score-only evaluation.
+        min_score: Lowest score the check can return.
+        max_score: The check's ``max_score``, which is also the highest
+            score it can return.
+        build_score: Optional counterpart of ``build`` returning a function
+            that computes only the score, skipping feedback. Score-only
+            evaluation uses it when given and falls back to ``build``.
+    """
+
+    name: str
+    build: Callable[[PasswordAnalyzer], Check | None]
+    cost: float
+    min_score: float
+    max_score: float
+    build_score: Callable[[PasswordAnalyzer], Score | None] | None = None
+
+
+class CheckRegistry:
+    """An ordered collection of ``CheckSpec`` entries with unique names."""
+
+    def __init__(self, specs: Iterable[CheckSpec] = ()) -> None:
+        self._specs: list[CheckSpec] = []
+        for spec in specs:
+            self.register(spec)
+
+    def __iter__(self) -> Iterator[CheckSpec]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __contains__(self, name: object) -> bool:
+        return any(spec.name == name for spec in self._specs)
+
+    def names(self) -> list[str]:
+        return [spec.name for spec in self._specs]
+
+    def register(self, spec: CheckSpec, before: str | None = None) -> None:
+        """Add a check, last or just before the check named ``before``.
+
+        Raises:
+            ValueError: If a check with the same name is already registered,
+                ``before`` is not registered, or the score range is empty.
+        """
+        if spec.name in self:
+            raise ValueError(f"A check named {spec.name!r} is already registered.")
+        if spec.min_score > spec.max_score:
+            raise ValueError(f"Check {spec.name!r} has min_score above max_score.")
+        if before is None:
+            self._specs.append(spec)
+        else:
+            self._specs.insert(self._index(before), spec)
+
+    def unregister(self, name: str) -> CheckSpec:
+        """Remove and return the check named ``name``.
+
+        Raises:
+            ValueError: If no such check is registered.
+        """
+        return self._specs.pop(self._index(name))
+
+    def copy(self) -> CheckRegistry:
+        return CheckRegistry(self._specs)
+
+    def _index(self, name: str) -> int:
+        for i, spec in enumerate(self._specs):
+            if spec.name == name:
+                return i
+        raise ValueError(f"No check named {name!r} is registered.")
+
+
+def _length(analyzer: PasswordAnalyzer) -> Check:
+    return lambda p: check_length(p.password)
+
+
+def _length_score(analyzer: PasswordAnalyzer) -> Score:
+    return lambda p: score_length(p.password)
+
+
+def _variety(analyzer: PasswordAnalyzer) -> Check:
+    return lambda p: check_character_variety(p.password, p)
+
+
+def _variety_score(analyzer: PasswordAnalyzer) -> Score:
+    return lambda p: score_character_variety(p.password, p)
+
+
+def _common(analyzer: PasswordAnalyzer) -> Check:
+    wordlist = analyzer.wordlist if analyzer.wordlist is not None else default_wordlist()
+    substitutions, distance = analyzer.substitutions, analyzer.near_miss_distance
+    return lambda p: check_common_password(p.password, wordlist, p, substitutions, distance)
+
+
+def _common_score(analyzer: PasswordAnalyzer) -> Score:
+    wordlist = analyzer.wordlist if analyzer.wordlist is not None else default_wordlist()
+    substitutions, distance = analyzer.substitutions, analyzer.near_miss_distance
+    return lambda p: score_common_password(p.password, wordlist, p, substitutions, distance)
+
+
+def _breached(analyzer: PasswordAnalyzer) -> Check | None:
+    index = analyzer.breach_index
+    if index is None:
+        return None
+    return lambda p: check_breached_password(p.password, index)
+
+
+def _breached_score(analyzer: PasswordAnalyzer) -> Score | None:
+    index = analyzer.breach_index
+    if index is None:
+        return None
+    return lambda p: score_breached_password(p.password, index)
+
+
+def _patterns(analyzer: PasswordAnalyzer) -> Check:
+    return lambda p: check_sequential_characters(p.password, p)
+
+
+def _patterns_score(analyzer: PasswordAnalyzer) -> Score:
+    return lambda p: score_sequential_characters(p.password, p)
+
+
+def _entropy(analyzer: PasswordAnalyzer) -> Check:
+    return lambda p: check_entropy(p.entropy_bits)
+
+
+def _entropy_score(analyzer: PasswordAnalyzer) -> Score:
+    return lambda p: score_entropy(p.entropy_bits)
+
+
+# The built-in checks in result order. Costs are relative, measured with
+# ``password-analyzer bench``; the breach lookup may touch the disk.
+DEFAULT_CHECKS: tuple[CheckSpec, ...] = (
+    CheckSpec("Length", _length, 1, 0, 3, _length_score),
+    CheckSpec("Character variety", _variety, 2, 0, 4, _variety_score),
+    CheckSpec("Common password", _common, 5, -3, 0, _common_score),
+    CheckSpec("Breached password", _breached, 20, -3, 0, _breached_score),
+    CheckSpec("Patterns", _patterns, 4, 0, 1, _patterns_score),
+    CheckSpec("Entropy", _entropy, 2, 0, 2, _entropy_score),
+)
+
+
+def _guesses(analyzer: PasswordAnalyzer) -> Check:
+    from .guesses import estimate_guesses
+
+    wordlist = analyzer.wordlist if analyzer.wordlist is not None else default_wordlist()
+    return lambda p: check_guesses(estimate_guesses(p.password, wordlist))
+
+
+def _guesses_score(analyzer: PasswordAnalyzer) -> Score:
+    from .guesses import estimate_guesses
+
+    wordlist = analyzer.wordlist if analyzer.wordlist is not None else default_wordlist()
+    return lambda p: score_guesses(estimate_guesses(p.password, wordlist))
+
+
+# Opt-in pattern-aware guess estimate; register it to score with it too:
+# ``registry.register(GUESSES_CHECK)``.
+GUESSES_CHECK = CheckSpec("Guesses", _guesses, 40, 0, 4, _guesses_score)
+
+
+def default_registry() -> CheckRegistry:
+    """Return a new registry holding the built-in checks."""
+    return CheckRegistry(DEFAULT_CHECKS)
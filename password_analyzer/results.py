@@ -0,0 +1,169 @@
+"""Result types shared by the analyzer and its clients.
+
+Kept apart from ``analyzer`` and ``checks`` so that code which only reads
+results, such as the daemon client, does not import the checks.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import warnings
+from collections.abc import Iterable
+
+from .messages import Message, MessageCode
+
+
+@dataclasses.dataclass(slots=True, init=False)
+class CheckResult:
+    """Result from a single password check.
+
+    Feedback is kept as ``Message`` codes and rendered by ``feedback`` on
+    access. Plain strings are accepted for custom checks and wrapped with
+    ``Message.text``, which files them as suggestions or strengths by their
+    wording; pass ``Message.text(..., suggestion=...)`` to decide explicitly.
+    The ``feedback=`` keyword of earlier versions is a
+    deprecated alias of ``messages``.
+    """
+
+    name: str
+    score: float
+    max_score: float
+    messages: tuple[Message, ...]
+
+    def __init__(
+        self,
+        name: str,
+        score: float,
+        max_score: float,
+        messages: Iterable[Message | str] = (),
+        *,
+        feedback: Iterable[str] | None = None,
+    ) -> None:
+        if feedback is not None:
+            warnings.warn(
+                "CheckResult(feedback=...) is deprecated; pass messages instead.",
+                DeprecationWarning, stacklevel=2,
+            )
+            if messages:
+                raise TypeError("CheckResult takes messages or feedback, not both.")
+            messages = feedback
+        self.name = name
+        self.score = score
+        self.max_score = max_score
+        if type(messages) is not tuple or str in map(type, messages):
+            messages = tuple(
+                m if isinstance(m, Message) else Message.text(m) for m in messages
+            )
+        self.messages = messages  # type: ignore[assignment]
+
+    @property
+    def feedback(self) -> list[str]:
+        """The feedback rendered as text."""
+        return [str(m) for m in self.messages]
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable representation, with rendered feedback."""
+        return {
+            "name": self.name,
+            "score": self.score,
+            "max_score": self.max_score,
+            "feedback": self.feedback,
+            "messages": [[m.code.name, *m.args] for m in self.messages],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CheckResult:
+        """Rebuild a result from ``to_dict`` output.
+
+        Raises:
+            ValueError: If a message code is unknown.
+        """
+        if "messages" in data:
+            try:
+                messages: Iterable[Message | str] = tuple(
+                    Message(MessageCode[code], tuple(args)) for code, *args in data["messages"]
+                )
+            except KeyError as e:
+                raise ValueError(f"Unknown message code {e.args[0]!r}") from None
+        else:
+            messages = data.get("feedback", ())
+        return cls(data["name"], data["score"], data["max_score"], messages)
+
+
+@dataclasses.dataclass(slots=True, init=False)
+class AnalysisResult:
+    """Complete result of a password analysis.
+
+    Feedback lives in each check's ``messages`` and is only rendered to
+    text when ``feedback`` is read. The ``feedback`` argument of earlier
+    versions is still accepted but deprecated and ignored, since the
+    feedback is always that of ``checks``.
+    """
+
+    password_length: int
+    score: int
+    strength: str
+    strength_color: str
+    entropy_bits: float
+    checks: list[CheckResult]
+
+    def __init__(
+        self,
+        password_length: int,
+        score: int,
+        strength: str,
+        strength_color: str,
+        entropy_bits: float,
+        checks: list[CheckResult],
+        feedback: list[str] | None = None,
+    ) -> None:
+        if feedback is not None:
+            warnings.warn(
+                "AnalysisResult(feedback=...) is deprecated and ignored; "
+                "feedback comes from checks.",
+                DeprecationWarning, stacklevel=2,
+            )
+        self.password_length = password_length
+        self.score = score
+        self.strength = strength
+        self.strength_color = strength_color
+        self.entropy_bits = entropy_bits
+        self.checks = checks
+
+    @property
+    def messages(self) -> list[Message]:
+        """Every check's feedback messages, in check order."""
+        return [m for check in self.checks for m in check.messages]
+
+    @property
+    def feedback(self) -> list[str]:
+        """Every check's feedback rendered as text, in check order."""
+        return [str(m) for check in self.checks for m in check.messages]
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable representation of the result."""
+        return {
+            "password_length": self.password_length,
+            "score": self.score,
+            "strength": self.strength,
+            "strength_color": self.strength_color,
+            "entropy_bits": self.entropy_bits,
+            "checks": [check.to_dict() for check in self.checks],
+            "feedback": self.feedback,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AnalysisResult:
+        """Rebuild a result from ``to_dict`` output.
+
+        Raises:
+            ValueError: If a message code is unknown.
+        """
+        return cls(
+            password_length=data["password_length"],
+            score=data["score"],
+            strength=data["strength"],
+            strength_color=data["strength_color"],
+            entropy_bits=data["entropy_bits"],
+            checks=[CheckResult.from_dict(c) for c in data["checks"]],
+        )
@@ -1,5 +1,8 @@
 """Score normalization and strength labeling."""
 
+# Lowest score that earns each label, e.g. for ``PasswordAnalyzer.meets``.
+STRENGTH_THRESHOLDS = {"Very Strong": 76, "Strong": 51, "Fair": 26, "Weak": 0}
+
 
 def normalize_score(raw_score: float, max_raw_score: float) -> int:
     """Map a raw score to a 0-100 scale, clamped."""
@@ -13,11 +16,11 @@ def get_strength_label(score: int) -> tuple[str, str]:
 
     Color names are symbolic — the CLI module maps them to ANSI codes.
     """
-    if score >= 76:
+    if score >= STRENGTH_THRESHOLDS["Very Strong"]:
         return ("Very Strong", "bright_green")
-    elif score >= 51:
+    elif score >= STRENGTH_THRESHOLDS["Strong"]:
         return ("Strong", "green")
-    elif score >= 26:
+    elif score >= STRENGTH_THRESHOLDS["Fair"]:
         return ("Fair", "yellow")
     else:
         return ("Weak", "red")
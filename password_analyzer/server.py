@@ -0,0 +1,325 @@
+"""Local HTTP scoring service with request micro-batching.
+
+A small asyncio HTTP/1.1 server (stdlib only) that listens on a TCP port or
+a Unix socket. Concurrent ``POST /score`` requests are coalesced into
+batches for ``PasswordAnalyzer.analyze_many``: a batch is flushed once it
+reaches ``max_batch`` passwords or ``max_wait`` seconds after its first
+request arrived.
+
+Endpoints:
+
+    POST /score   ``{"password": "..."}`` -> the analysis result as JSON
+    GET  /stats   request count, batching and p50/p99 latency
+    GET  /health  ``{"status": "ok"}``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import json
+import math
+import sys
+import time
+
+from .analyzer import AnalysisResult, PasswordAnalyzer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.002
+
+# Largest request body accepted, in bytes.
+MAX_BODY = 64 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+class LatencyRecorder:
+    """Keeps a sliding window of latencies for percentile reporting."""
+
+    def __init__(self, window: int = 10_000) -> None:
+        self._samples: collections.deque[float] = collections.deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, q: float) -> float:
+        """Return the ``q``-th percentile (0-100) of the window, in seconds."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "requests": self.count,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+        }
+
+
+class MicroBatcher:
+    """Coalesces concurrent analysis requests into batches."""
+
+    def __init__(
+        self,
+        analyzer: PasswordAnalyzer,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+        self.analyzer = analyzer
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.batched = 0
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[AnalysisResult]]] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the batching loop on the running event loop."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, password: str) -> AnalysisResult:
+        """Queue a password and wait for its result."""
+        future: asyncio.Future[AnalysisResult] = asyncio.get_running_loop().create_future()
+        await self._queue.put((password, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[str, asyncio.Future[AnalysisResult]]]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            self.batches += 1
+            self.batched += len(batch)
+            try:
+                results = list(self.analyzer.analyze_many(p for p, _ in batch))
+            except Exception:
+                self._run_each(batch)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _run_each(self, batch: list[tuple[str, asyncio.Future[AnalysisResult]]]) -> None:
+        """Analyze a failed batch one password at a time.
+
+        Only the passwords that fail on their own get the exception, so one
+        bad input does not fail the requests batched with it.
+        """
+        for password, future in batch:
+            if future.done():
+                continue
+            try:
+                future.set_result(self.analyzer.analyze(password))
+            except Exception as e:
+                future.set_exception(e)
+
+
+class ScoringServer:
+    """HTTP front end for a ``MicroBatcher``."""
+
+    def __init__(
+        self,
+        analyzer: PasswordAnalyzer,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+    ) -> None:
+        self.batcher = MicroBatcher(analyzer, max_batch, max_wait)
+        self.latency = LatencyRecorder()
+
+    async def start(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_path: str | None = None,
+    ) -> asyncio.AbstractServer:
+        """Start batching and listening; returns the asyncio server."""
+        self.batcher.start()
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self.handle, path=unix_path)
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def stop(self) -> None:
+        await self.batcher.stop()
+
+    def stats(self) -> dict:
+        batches = self.batcher.batches
+        return {
+            **self.latency.summary(),
+            "batches": batches,
+            "mean_batch_size": round(self.batcher.batched / batches, 2) if batches else 0.0,
+        }
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve HTTP requests on one (possibly keep-alive) connection."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, {"error": "headers too large"}, False)
+                    break
+
+                try:
+                    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                    method, target, version = request_line.split(" ", 2)
+                    headers = {}
+                    for line in header_lines:
+                        if line:
+                            name, _, value = line.partition(":")
+                            headers[name.strip().lower()] = value.strip()
+                    length = int(headers.get("content-length", "0"))
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "malformed request"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "body too large"}, False)
+                    break
+                try:
+                    body = await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                connection = headers.get("connection", "").lower()
+                if version.strip() == "HTTP/1.0":
+                    keep_alive = connection == "keep-alive"
+                else:
+                    keep_alive = connection != "close"
+
+                status, payload = await self._route(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _route(self, method: str, target: str, body: bytes) -> tuple[int, dict]:
+        path = target.split("?", 1)[0]
+        if path == "/score":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            started = time.perf_counter()
+            try:
+                password = json.loads(body)["password"]
+                if not isinstance(password, str):
+                    raise TypeError
+            except (ValueError, KeyError, TypeError):
+                return 400, {"error": 'expected a JSON body like {"password": "..."}'}
+            try:
+                password.encode("utf-8")
+            except UnicodeEncodeError:
+                return 400, {"error": "password is not valid Unicode text"}
+            try:
+                result = await self.batcher.submit(password)
+            except Exception:
+                return 500, {"error": "analysis failed"}
+            payload = result.to_dict()
+            self.latency.record(time.perf_counter() - started)
+            return 200, payload
+        if path == "/stats" and method == "GET":
+            return 200, self.stats()
+        if path == "/health" and method == "GET":
+            return 200, {"status": "ok"}
+        return 404, {"error": "not found"}
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: dict,
+        keep_alive: bool,
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+def serve(
+    analyzer: PasswordAnalyzer,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_path: str | None = None,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_wait: float = DEFAULT_MAX_WAIT,
+) -> None:
+    """Run the scoring service until interrupted, then print latency stats."""
+    server = ScoringServer(analyzer, max_batch, max_wait)
+
+    async def main() -> None:
+        listener = await server.start(host, port, unix_path)
+        where = unix_path if unix_path is not None else f"http://{host}:{port}"
+        print(f"Serving password scores on {where}", file=sys.stderr)
+        try:
+            async with listener:
+                await listener.serve_forever()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    stats = server.stats()
+    print(
+        f"Served {stats['requests']:,} requests in {stats['batches']:,} batches "
+        f"(p50 {stats['p50_ms']} ms, p99 {stats['p99_ms']} ms)",
+        file=sys.stderr,
+    )
@@ -0,0 +1,229 @@
+"""NumPy-backed batch scoring for large offline audits.
+
+``analyze_batch`` packs a batch of passwords into a padded codepoint matrix
+and a length vector, then computes length tiers, character classes,
+entropy, repeat/sequence/keyboard patterns and the final normalized score
+as whole-array operations. Dictionary and breach lookups still run per
+password through the analyzer's word list and breach index.
+
+Scores, strengths, entropy and per-check scores match
+``PasswordAnalyzer.analyze`` exactly. The matrix is as wide as the longest
+password in the batch, so feed very long passwords in their own batches.
+
+Requires NumPy (``pip install password-analyzer[numpy]``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from .analyzer import PasswordAnalyzer
+from .checks import (
+    KEYBOARD_PATTERNS,
+    check_breached_password,
+    check_common_password,
+    default_wordlist,
+)
+from .keyboard import MIN_WALK_LENGTH, adjacency_tables, find_walks
+from .profile import ASCII_CLASSES, DIGIT, LOWER, SYMBOL, UPPER, classify
+from .registry import DEFAULT_CHECKS
+from .scoring import STRENGTH_THRESHOLDS
+
+_ASCII_CLASSES = np.array(ASCII_CLASSES, dtype=np.int8)
+_POPCOUNT = np.array([bin(mask).count("1") for mask in range(16)], dtype=np.int64)
+
+
+def _pool_size(mask: int) -> int:
+    return (
+        26 * bool(mask & LOWER) + 26 * bool(mask & UPPER)
+        + 10 * bool(mask & DIGIT) + 32 * bool(mask & SYMBOL)
+    )
+
+
+# log2 of the character pool for every combination of classes, computed
+# with math.log2 so entropy matches the scalar path bit for bit.
+_LOG2_POOL = np.array(
+    [math.log2(_pool_size(mask)) if _pool_size(mask) else 0.0 for mask in range(16)],
+)
+
+_KEYBOARD_PATTERNS = [np.array([ord(c) for c in p], dtype=np.int32) for p in KEYBOARD_PATTERNS]
+
+
+def _pair_mask_matrix() -> tuple[np.ndarray, np.ndarray]:
+    """Return the sorted keyboard codepoints and their pair-mask matrix.
+
+    The matrix has an extra last row and column, all zero, for characters
+    on no layout.
+    """
+    pair_masks = adjacency_tables().pair_masks
+    keys = np.array(sorted({ord(c) for pair in pair_masks for c in pair}), dtype=np.int32)
+    index = {chr(code): i for i, code in enumerate(keys)}
+    matrix = np.zeros((len(keys) + 1, len(keys) + 1), dtype=np.uint8)
+    for (a, b), mask in pair_masks.items():
+        matrix[index[a], index[b]] = mask
+    return keys, matrix
+
+
+_KEY_CODES, _PAIR_MASKS = _pair_mask_matrix()
+
+# Strength labels from weakest up, and the lowest score of each but the first.
+_TIERS = sorted(STRENGTH_THRESHOLDS.items(), key=lambda item: item[1])
+_STRENGTHS = tuple(label for label, _ in _TIERS)
+_CUTOFFS = np.array([threshold for _, threshold in _TIERS[1:]], dtype=np.int64)
+
+_MAX_SCORE = sum(spec.max_score for spec in DEFAULT_CHECKS)
+
+
+@dataclasses.dataclass
+class ScoreTable:
+    """Columnar scores for a batch of passwords.
+
+    ``check_scores`` maps each check name to its per-password score column,
+    in the same order the scalar analyzer runs the checks.
+    """
+
+    lengths: np.ndarray
+    scores: np.ndarray
+    entropy_bits: np.ndarray
+    check_scores: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @property
+    def strengths(self) -> list[str]:
+        """Strength label of each password."""
+        tiers = np.searchsorted(_CUTOFFS, self.scores, side="right")
+        return [_STRENGTHS[t] for t in tiers]
+
+
+def pack(passwords: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack passwords into a zero-padded codepoint matrix and a length vector."""
+    lengths = np.fromiter(map(len, passwords), dtype=np.int64, count=len(passwords))
+    width = int(lengths.max()) if len(passwords) else 0
+    flat = np.frombuffer(
+        "".join(passwords).encode("utf-32-le", errors="surrogatepass"), dtype="<u4",
+    ).astype(np.int32)
+    codes = np.zeros((len(passwords), width), dtype=np.int32)
+    codes[np.arange(width) < lengths[:, None]] = flat
+    return codes, lengths
+
+
+def _class_masks(codes: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Return the class bit mask of every cell (0 for padding)."""
+    masks = np.zeros(codes.shape, dtype=np.int8)
+    ascii_cells = codes < 128
+    masks[ascii_cells] = _ASCII_CLASSES[codes[ascii_cells]]
+    other = ~ascii_cells
+    if other.any():
+        unique, inverse = np.unique(codes[other], return_inverse=True)
+        table = np.array([classify(chr(c)) for c in unique], dtype=np.int8)
+        masks[other] = table[inverse.reshape(-1)]
+    masks[~valid] = 0
+    return masks
+
+
+def _pattern_flags(
+    passwords: Sequence[str], codes: np.ndarray, lengths: np.ndarray,
+) -> np.ndarray:
+    """Return True for every password the patterns check would flag."""
+    n, width = codes.shape
+    flagged = np.zeros(n, dtype=bool)
+
+    if width >= 3:
+        a, b, c = codes[:, :-2], codes[:, 1:-1], codes[:, 2:]
+        triple = np.arange(width - 2) + 2 < lengths[:, None]
+        repeated = (a == b) & (b == c)
+        ascending = (b - a == 1) & (c - b == 1)
+        descending = (a - b == 1) & (b - c == 1)
+        flagged |= ((repeated | ascending | descending) & triple).any(axis=1)
+
+    # Keyboard patterns are ASCII, so ASCII rows are lowercased in place and
+    # searched with sliding windows; other rows use str.lower like the scalar
+    # check (which may change their length).
+    ascii_rows = (codes < 128).all(axis=1)
+    upper = (codes >= 65) & (codes <= 90)
+    lower = codes + 32 * upper.astype(np.int32)
+    for pattern in _KEYBOARD_PATTERNS:
+        size = len(pattern)
+        if width < size:
+            continue
+        windows = np.lib.stride_tricks.sliding_window_view(lower, size, axis=1)
+        hits = (windows == pattern).all(axis=2)
+        hits &= np.arange(width - size + 1) + size <= lengths[:, None]
+        flagged |= hits.any(axis=1) & ascii_rows
+
+    for i in np.flatnonzero(~ascii_rows & ~flagged):
+        lowered = passwords[i].lower()
+        flagged[i] = any(p in lowered for p in KEYBOARD_PATTERNS)
+
+    # Keyboard walks: rows with MIN_WALK_LENGTH keys in a row adjacent on one
+    # layout are candidates; whether a walk is deliberate depends on its
+    # turns, so candidates are confirmed with the scalar finder.
+    steps = MIN_WALK_LENGTH - 1
+    if width > steps:
+        ids = np.searchsorted(_KEY_CODES, codes)
+        ids[_KEY_CODES[np.minimum(ids, len(_KEY_CODES) - 1)] != codes] = len(_KEY_CODES)
+        pairs = _PAIR_MASKS[ids[:, :-1], ids[:, 1:]]
+        pairs[np.arange(width - 1) + 1 >= lengths[:, None]] = 0
+        windows = np.lib.stride_tricks.sliding_window_view(pairs, steps, axis=1)
+        candidates = (np.bitwise_and.reduce(windows, axis=2) != 0).any(axis=1)
+        for i in np.flatnonzero(candidates & ~flagged):
+            flagged[i] = any(w.deliberate for w in find_walks(passwords[i]))
+    return flagged
+
+
+def analyze_batch(
+    passwords: Sequence[str], analyzer: PasswordAnalyzer | None = None,
+) -> ScoreTable:
+    """Score a batch of passwords with whole-array operations.
+
+    Uses the word list and breach index configured on ``analyzer``.
+
+    Raises:
+        ValueError: If ``analyzer`` uses a custom check registry, which the
+            vectorized engine cannot reproduce.
+    """
+    if analyzer is None:
+        analyzer = PasswordAnalyzer()
+    if tuple(analyzer.registry) != DEFAULT_CHECKS:
+        raise ValueError("analyze_batch only supports the built-in checks.")
+    wordlist = analyzer.wordlist if analyzer.wordlist is not None else default_wordlist()
+    substitutions, distance = analyzer.substitutions, analyzer.near_miss_distance
+
+    codes, lengths = pack(passwords)
+    valid = np.arange(codes.shape[1]) < lengths[:, None]
+    present = np.bitwise_or.reduce(_class_masks(codes, valid), axis=1).astype(np.int64)
+
+    entropy_bits = lengths * _LOG2_POOL[present]
+    columns: dict[str, np.ndarray] = {
+        "Length": np.select([lengths >= 16, lengths >= 12, lengths >= 8], [3, 2, 1], 0),
+        "Character variety": _POPCOUNT[present],
+        "Common password": np.fromiter(
+            (
+                check_common_password(p, wordlist, None, substitutions, distance).score
+                for p in passwords
+            ),
+            dtype=np.float64, count=len(passwords),
+        ),
+    }
+    if analyzer.breach_index is not None:
+        columns["Breached password"] = np.fromiter(
+            (check_breached_password(p, analyzer.breach_index).score for p in passwords),
+            dtype=np.float64, count=len(passwords),
+        )
+    columns["Patterns"] = (~_pattern_flags(passwords, codes, lengths)).astype(np.int64)
+    columns["Entropy"] = np.select([entropy_bits >= 50, entropy_bits >= 28], [2, 1], 0)
+
+    # Add columns in check order so float sums round exactly like the
+    # scalar path's sum().
+    raw = np.zeros(len(passwords), dtype=np.float64)
+    for column in columns.values():
+        raw = raw + column
+    scores = np.clip(np.round(raw / _MAX_SCORE * 100), 0, 100).astype(np.int64)
+
+    return ScoreTable(lengths, scores, entropy_bits, columns)
@@ -0,0 +1,327 @@
+"""Dictionary backends for the common-password check.
+
+A word list answers two questions: is a (lowercased) password an exact
+dictionary entry, and what is the longest dictionary word contained in it.
+``MemoryWordList`` keeps a small set in memory; ``SortedFileWordList`` and
+``compiled.CompiledWordList`` serve arbitrarily large lists straight from a
+memory-mapped file on disk.
+
+Word lists can also be walked one character at a time as a trie, which
+lets ``leet`` try several spellings of each character without building
+every variant of the password, and can provide a ``fuzzy`` deletion
+index for near-miss lookups.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from .automaton import AhoCorasick
+
+if TYPE_CHECKING:
+    from .fuzzy import DeletionIndex
+
+
+class WordList:
+    """Interface shared by all dictionary backends.
+
+    Entries are stored lowercased; callers lowercase the query.
+    """
+
+    def __contains__(self, word: object) -> bool:
+        raise NotImplementedError
+
+    def longest_substring(self, text: str, min_length: int) -> str | None:
+        """Return the longest entry of at least ``min_length`` chars in ``text``.
+
+        Ties are broken in favour of the earliest occurrence. This generic
+        version probes every substring; backends override it with something
+        smarter.
+        """
+        for length in range(len(text), min_length - 1, -1):
+            for start in range(len(text) - length + 1):
+                candidate = text[start:start + length]
+                if candidate in self:
+                    return candidate
+        return None
+
+    def matches(self, text: str, min_length: int) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, end)`` spans of every entry of ``min_length``+ chars in ``text``.
+
+        This generic version probes every substring; backends override it.
+        """
+        for start in range(len(text) - min_length + 1):
+            for end in range(start + min_length, len(text) + 1):
+                if text[start:end] in self:
+                    yield start, end
+
+    def trie_root(self) -> Hashable:
+        """Return the trie node for the empty prefix; see ``trie_step``."""
+        return ""
+
+    def trie_step(self, node: Hashable, char: str) -> tuple[Hashable, bool] | None:
+        """Extend the prefix at ``node`` by ``char``.
+
+        Returns the new node and whether the extended prefix is itself an
+        entry, or None when no entry starts with it. Nodes are opaque and
+        only valid for the word list that made them. This generic version
+        cannot rule out prefixes, so it never returns None; backends
+        override it to prune.
+        """
+        prefix = node + char  # type: ignore[operator]
+        return prefix, prefix in self
+
+    def deletion_index(self, max_distance: int) -> DeletionIndex | None:
+        """Return a ``fuzzy.DeletionIndex`` over the entries, or None.
+
+        None means near misses are not looked up. The generic version
+        returns None, since it cannot list its entries; file-backed lists
+        only return an index built ahead of time.
+        """
+        return None
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class MemoryWordList(WordList):
+    """An in-memory word set with an Aho-Corasick substring automaton.
+
+    The automaton is built lazily on the first substring query and reused
+    for every query after that.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = frozenset(words)
+        self._automata: dict[int, AhoCorasick] = {}
+        self._deletion_indexes: dict[int, DeletionIndex] = {}
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def automaton(self, min_length: int) -> AhoCorasick:
+        """Return the automaton over entries of at least ``min_length`` chars."""
+        automaton = self._automata.get(min_length)
+        if automaton is None:
+            automaton = AhoCorasick(w for w in self.words if len(w) >= min_length)
+            self._automata[min_length] = automaton
+        return automaton
+
+    def longest_substring(self, text: str, min_length: int) -> str | None:
+        return self.automaton(min_length).longest_match(text)
+
+    def matches(self, text: str, min_length: int) -> Iterator[tuple[int, int]]:
+        return self.automaton(min_length).iter_matches(text)
+
+    def trie_root(self) -> Hashable:
+        return 0
+
+    def trie_step(self, node: Hashable, char: str) -> tuple[Hashable, bool] | None:
+        return self.automaton(1).trie_step(node, char)  # type: ignore[arg-type]
+
+    def deletion_index(self, max_distance: int) -> DeletionIndex:
+        index = self._deletion_indexes.get(max_distance)
+        if index is None:
+            from .fuzzy import MemoryDeletionIndex
+
+            index = MemoryDeletionIndex(self.words, max_distance)
+            self._deletion_indexes[max_distance] = index
+        return index
+
+
+class SortedWordList(WordList):
+    """Base for backends that store their entries as sorted UTF-8 keys.
+
+    Subclasses provide ``_lower_bound``; exact lookups and the substring
+    pass are built on top of it. Queries are encoded with ``surrogatepass``,
+    so text holding lone surrogates (from JSON, or undecodable command-line
+    arguments) cannot match a valid UTF-8 entry and simply misses.
+    """
+
+    def _lower_bound(self, key: bytes) -> bytes | None:
+        """Return the first entry that sorts at or after ``key``."""
+        raise NotImplementedError
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = word.encode("utf-8", errors="surrogatepass")
+        return self._lower_bound(key) == key
+
+    def longest_substring(self, text: str, min_length: int) -> str | None:
+        # Extend each start position only while some entry still has the
+        # current substring as a prefix, so most probes stop after a few chars.
+        best_start, best_length = 0, 0
+        for start in range(len(text) - min_length + 1):
+            for end in range(start + 1, len(text) + 1):
+                key = text[start:end].encode("utf-8", errors="surrogatepass")
+                entry = self._lower_bound(key)
+                if entry is None or not entry.startswith(key):
+                    break
+                length = end - start
+                if entry == key and length >= min_length and length > best_length:
+                    best_start, best_length = start, length
+        if not best_length:
+            return None
+        return text[best_start:best_start + best_length]
+
+    def matches(self, text: str, min_length: int) -> Iterator[tuple[int, int]]:
+        for start in range(len(text) - min_length + 1):
+            for end in range(start + 1, len(text) + 1):
+                key = text[start:end].encode("utf-8", errors="surrogatepass")
+                entry = self._lower_bound(key)
+                if entry is None or not entry.startswith(key):
+                    break
+                if entry == key and end - start >= min_length:
+                    yield start, end
+
+    def trie_step(self, node: Hashable, char: str) -> tuple[Hashable, bool] | None:
+        prefix = node + char  # type: ignore[operator]
+        key = prefix.encode("utf-8", errors="surrogatepass")
+        entry = self._lower_bound(key)
+        if entry is None or not entry.startswith(key):
+            return None
+        return prefix, entry == key
+
+
+class SortedFileWordList(SortedWordList):
+    """A sorted, newline-delimited UTF-8 word file served through ``mmap``.
+
+    The file must hold one lowercased entry per line, sorted by byte value
+    (``LC_ALL=C sort -u``; see ``write_sorted_wordlist``). Lookups binary
+    search the mapping directly, so resident memory stays near zero no matter
+    how large the list is.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._data = map_file(self.path)
+        self._deletion_indexes: dict[int, DeletionIndex | None] = {}
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every entry in file order."""
+        pos = 0
+        while pos < len(self._data):
+            line, pos = self._line_at(pos)
+            if line:
+                yield line.decode("utf-8")
+
+    def _line_at(self, start: int) -> tuple[bytes, int]:
+        """Return the line beginning at ``start`` and the offset after it."""
+        end = self._data.find(b"\n", start)
+        if end < 0:
+            end = len(self._data)
+        return self._data[start:end], end + 1
+
+    def _lower_bound(self, key: bytes) -> bytes | None:
+        data = self._data
+        lo, hi = 0, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", lo, mid) + 1
+            if start < lo:
+                start = lo
+            line, after = self._line_at(start)
+            if line < key:
+                lo = after
+            else:
+                hi = start
+        if lo >= len(data):
+            return None
+        return self._line_at(lo)[0]
+
+    def deletion_index(self, max_distance: int) -> DeletionIndex | None:
+        """Return the deletion index saved next to the file, or None if not built.
+
+        Indexes are keyed on the file's size and modification time, so
+        opening one does not read the whole list.
+        """
+        if max_distance not in self._deletion_indexes:
+            from .fuzzy import open_index
+
+            self._deletion_indexes[max_distance] = open_index(
+                self.path, max_distance, file_stamp(self.path),
+            )
+        return self._deletion_indexes[max_distance]
+
+    def build_deletion_index(self, max_distance: int) -> DeletionIndex:
+        """Build and save the deletion index next to the file; see ``fuzzy.build_index``."""
+        from .fuzzy import build_index
+
+        old = self._deletion_indexes.get(max_distance)
+        index = build_index(self.path, self, max_distance, file_stamp(self.path))
+        if old is not None:
+            old.close()
+        self._deletion_indexes[max_distance] = index
+        return index
+
+    def close(self) -> None:
+        for index in self._deletion_indexes.values():
+            if index is not None:
+                index.close()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+def file_stamp(path: str | os.PathLike[str]) -> str:
+    """Return a SHA-256 hex digest of a file's size and modification time.
+
+    A cheap stand-in for hashing the contents when checking whether data
+    derived from a file is still current.
+    """
+    import hashlib
+
+    st = os.stat(path)
+    return hashlib.sha256(f"{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()
+
+
+def map_file(path: str | os.PathLike[str]) -> mmap.mmap | bytes:
+    """Memory-map a file read-only (empty files map to ``b""``)."""
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def write_sorted_wordlist(
+    words: Iterable[str], path: str | os.PathLike[str],
+) -> int:
+    """Write words in the layout ``SortedFileWordList`` expects.
+
+    Entries are stripped, lowercased, de-duplicated and sorted by their
+    UTF-8 bytes. Returns the number of entries written.
+    """
+    entries = sorted({
+        w.strip().lower().encode("utf-8") for w in words if w.strip()
+    })
+    with open(path, "wb") as f:
+        for entry in entries:
+            f.write(entry + b"\n")
+    return len(entries)
+
+
+def is_sorted_wordlist(path: str | os.PathLike[str]) -> bool:
+    """Return True if ``path`` is already laid out as ``SortedFileWordList`` expects.
+
+    Every line must be a non-empty, stripped, lowercased UTF-8 entry, and
+    the lines strictly increasing by byte value. The file is streamed and
+    the scan stops at the first line out of place.
+    """
+    previous = b""
+    with open(path, "rb") as f:
+        for raw in f:
+            line = raw[:-1] if raw.endswith(b"\n") else raw
+            try:
+                normalized = line.decode("utf-8").strip().lower().encode("utf-8")
+            except UnicodeDecodeError:
+                return False
+            if not line or line != normalized or line <= previous:
+                return False
+            previous = line
+    return True
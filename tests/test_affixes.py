@@ -0,0 +1,57 @@
+from password_analyzer.affixes import (
+    MAX_DIGITS,
+    MAX_SYMBOLS,
+    AffixMatch,
+    _boundaries,
+    strip_affixes,
+)
+from password_analyzer.wordlist import MemoryWordList
+
+WORDS = MemoryWordList(["summer", "dragon", "password", "password1", "abc"])
+
+
+class TestBoundaries:
+    def test_digit_and_symbol_runs(self):
+        assert _boundaries("2024!summer") == [1, 2, 3, 4, 5]
+        assert _boundaries("!!1x") == [1, 2, 3]
+
+    def test_stops_at_first_letter(self):
+        assert _boundaries("summer2024") == []
+
+    def test_run_lengths_are_capped(self):
+        assert _boundaries("1" * (MAX_DIGITS + 2)) == list(range(1, MAX_DIGITS + 1))
+        assert _boundaries("!" * (MAX_SYMBOLS + 2)) == list(range(1, MAX_SYMBOLS + 1))
+
+    def test_at_most_two_runs(self):
+        assert _boundaries("1!2x") == [1, 2]
+
+
+class TestStripAffixes:
+    def test_suffix(self):
+        assert strip_affixes("summer2024!", WORDS) == AffixMatch(
+            0, 6, "summer", "", "2024!",
+        )
+
+    def test_prefix_and_suffix(self):
+        match = strip_affixes("#1dragon99", WORDS)
+        assert (match.word, match.prefix, match.suffix) == ("dragon", "#1", "99")
+        assert match.describe() == "'#1' at the start and '99' at the end"
+
+    def test_prefers_least_stripped(self):
+        assert strip_affixes("password12!", WORDS).word == "password1"
+
+    def test_whole_text_not_reported(self):
+        assert strip_affixes("summer", WORDS) is None
+
+    def test_needs_only_affixes_around_entry(self):
+        assert strip_affixes("mysummer1", WORDS) is None
+        assert strip_affixes("summer1x", WORDS) is None
+        assert strip_affixes("summer12345", WORDS) is None
+
+    def test_min_length(self):
+        assert strip_affixes("abc!", WORDS).word == "abc"
+        assert strip_affixes("abc!", WORDS, min_length=4) is None
+
+    def test_digits_only(self):
+        assert strip_affixes("2024", WORDS) is None
+        assert strip_affixes("", WORDS) is None
@@ -1,3 +1,5 @@
+import pytest
+
 from password_analyzer.analyzer import AnalysisResult, PasswordAnalyzer
 
 
@@ -50,7 +52,94 @@ class TestPasswordAnalyzer:
         assert result.strength == "Weak"
         assert result.score < 26
 
+    def test_leet_substitutions_configurable(self):
+        assert self.analyzer.analyze("$unsh1ne").checks[2].score == -2
+        plain = PasswordAnalyzer(substitutions={})
+        assert plain.analyze("$unsh1ne").checks[2].score == 0
+        assert plain.strength("$unsh1ne") == plain.analyze("$unsh1ne").strength
+
+    def test_near_miss_distance_configurable(self):
+        assert self.analyzer.analyze("pasxwprd").checks[2].score == 0
+        assert PasswordAnalyzer(near_miss_distance=2).analyze("pasxwprd").checks[2].score == -2
+
+    @pytest.mark.parametrize("distance", [-1, 3, 5])
+    def test_near_miss_distance_out_of_range(self, distance):
+        with pytest.raises(ValueError):
+            PasswordAnalyzer(near_miss_distance=distance)
+
     def test_common_password_with_extras(self):
         # "password" is common — substring penalty + sequential "123" should drag it down
         result = self.analyzer.analyze("password123!")
         assert result.score < 70
+
+
+class TestSharedProfile:
+    def test_checks_agree_with_standalone_calls(self):
+        from password_analyzer.checks import (
+            check_character_variety,
+            check_common_password,
+            check_sequential_characters,
+        )
+
+        analyzer = PasswordAnalyzer()
+        for password in ["", "aaa", "xcba99", "Пароль123!", "ǅ9qwerty", "mypassword99"]:
+            checks = {c.name: c for c in analyzer.analyze(password).checks}
+            assert checks["Character variety"] == check_character_variety(password)
+            assert checks["Common password"] == check_common_password(password)
+            assert checks["Patterns"] == check_sequential_characters(password)
+
+
+class TestAnalyzeMany:
+    def setup_method(self):
+        self.analyzer = PasswordAnalyzer()
+
+    def test_matches_analyze(self):
+        passwords = ["", "a", "password", "Hello123!", "j8$Kp2!mX@nQ9vL#"]
+        results = list(self.analyzer.analyze_many(passwords))
+        assert results == [self.analyzer.analyze(p) for p in passwords]
+
+    def test_is_lazy(self):
+        import itertools
+
+        endless = itertools.cycle(["password", "Hello123!"])
+        results = self.analyzer.analyze_many(endless)
+        first = list(itertools.islice(results, 3))
+        assert [r.password_length for r in first] == [8, 9, 8]
+
+    def test_empty_input(self):
+        assert list(self.analyzer.analyze_many([])) == []
+
+    def test_uses_configured_wordlist(self):
+        from password_analyzer.wordlist import MemoryWordList
+
+        analyzer = PasswordAnalyzer(wordlist=MemoryWordList(["correcthorse"]))
+        (result,) = analyzer.analyze_many(["CorrectHorse"])
+        common = next(c for c in result.checks if c.name == "Common password")
+        assert common.score == -3
+
+
+class TestBytesInput:
+    PASSWORDS = ["password", "Hello123!", "Summer2024!", "пароль2024", "🔒secure🔑", ""]
+
+    def test_matches_str(self):
+        analyzer = PasswordAnalyzer()
+        for password in self.PASSWORDS:
+            expected = analyzer.analyze(password)
+            data = password.encode("utf-8")
+            for given in (data, memoryview(data)):
+                assert analyzer.analyze(given) == expected
+                assert analyzer.strength(given) == expected.strength
+                assert analyzer.meets(given, expected.score)
+                assert not analyzer.meets(given, expected.score + 1)
+
+    def test_analyze_many_mixes_inputs(self):
+        analyzer = PasswordAnalyzer()
+        results = list(analyzer.analyze_many([b"Hello123!", "Hello123!"]))
+        assert results[0] == results[1]
+
+    def test_shares_cache_with_str(self):
+        from password_analyzer.cache import ResultCache
+
+        analyzer = PasswordAnalyzer(cache=ResultCache())
+        result = analyzer.analyze("Hello123!")
+        assert analyzer.analyze(b"Hello123!") is result
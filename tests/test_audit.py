@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+import pytest
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.audit import (
+    FIELDS,
+    audit,
+    format_header,
+    format_record,
+    read_passwords,
+)
+
+INPUT = [b"password\n", b"\n", b"Hello123!\r\n", b"j8$Kp2!mX@nQ9vL#"]
+
+
+class TestReadPasswords:
+    def test_strips_line_endings_and_skips_blank_lines(self):
+        assert list(read_passwords(INPUT)) == [
+            (1, "password"), (3, "Hello123!"), (4, "j8$Kp2!mX@nQ9vL#"),
+        ]
+
+    def test_invalid_utf8_replaced(self):
+        assert list(read_passwords([b"abc\xff\n"])) == [(1, "abc�")]
+
+
+class TestFormatRecord:
+    def test_jsonl(self):
+        result = PasswordAnalyzer().analyze("Hello123!")
+        record = json.loads(format_record(7, result, "jsonl"))
+        assert list(record) == list(FIELDS)
+        assert record["line"] == 7
+        assert record["score"] == result.score
+        assert record["entropy_bits"] == round(result.entropy_bits, 2)
+
+    def test_tsv(self):
+        result = PasswordAnalyzer().analyze("password")
+        fields = format_record(1, result, "tsv").rstrip("\n").split("\t")
+        assert fields[:4] == ["1", "8", str(result.score), "Weak"]
+
+    def test_headers(self):
+        assert format_header("jsonl") is None
+        assert format_header("csv") == ",".join(FIELDS) + "\n"
+
+
+class TestAudit:
+    def test_jsonl(self):
+        out = io.StringIO()
+        assert audit(INPUT, out) == 3
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r["line"] for r in records] == [1, 3, 4]
+        assert records[0]["strength"] == "Weak"
+        assert records[2]["strength"] == "Very Strong"
+
+    def test_csv_round_trips(self):
+        out = io.StringIO()
+        audit(INPUT, out, "csv")
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        analyzer = PasswordAnalyzer()
+        assert [int(r["score"]) for r in rows] == [
+            analyzer.analyze(p).score for p in ["password", "Hello123!", "j8$Kp2!mX@nQ9vL#"]
+        ]
+
+    def test_non_ascii_lines_scored_as_decoded(self):
+        out = io.StringIO()
+        audit(["пароль2024\n".encode(), b"abc\xff\n"], out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        analyzer = PasswordAnalyzer()
+        expected = [analyzer.analyze(p) for p in ["пароль2024", "abc\ufffd"]]
+        assert [(r["length"], r["score"]) for r in records] == [
+            (e.password_length, e.score) for e in expected
+        ]
+
+    def test_writes_in_batches(self, monkeypatch):
+        monkeypatch.setattr("password_analyzer.audit.WRITE_BATCH", 2)
+        out = io.StringIO()
+        audit([b"a\n"] * 5, out, "tsv")
+        assert len(out.getvalue().splitlines()) == 6
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            audit(INPUT, io.StringIO(), "xml")
@@ -0,0 +1,58 @@
+from password_analyzer.automaton import AhoCorasick
+
+
+class TestAhoCorasick:
+    def test_finds_single_word(self):
+        automaton = AhoCorasick(["pass"])
+        assert automaton.longest_match("mypass99") == "pass"
+
+    def test_no_match(self):
+        automaton = AhoCorasick(["pass", "word"])
+        assert automaton.longest_match("j8Kp2mXnQ9") is None
+
+    def test_prefers_longest_match(self):
+        automaton = AhoCorasick(["pass", "password", "word"])
+        assert automaton.longest_match("xpassword1") == "password"
+
+    def test_longest_tie_prefers_earliest(self):
+        automaton = AhoCorasick(["abcd", "wxyz"])
+        assert automaton.longest_match("wxyzabcd") == "wxyz"
+
+    def test_overlapping_words_via_failure_links(self):
+        automaton = AhoCorasick(["she", "hers", "his"])
+        spans = sorted(automaton.iter_matches("ushers"))
+        assert spans == [(1, 4), (2, 6)]
+
+    def test_trie_step_ignores_failure_links(self):
+        automaton = AhoCorasick(["she", "he"])
+        state, is_word = automaton.trie_step(0, "s")
+        assert not is_word
+        assert automaton.trie_step(state, "e") is None
+        state, _ = automaton.trie_step(state, "h")
+        assert automaton.trie_step(state, "e")[1]
+
+    def test_iter_matches_reports_nested_words(self):
+        automaton = AhoCorasick(["pass", "password", "word"])
+        spans = sorted(automaton.iter_matches("password"))
+        assert spans == [(0, 4), (0, 8), (4, 8)]
+
+    def test_empty_text(self):
+        automaton = AhoCorasick(["pass"])
+        assert automaton.longest_match("") is None
+        assert list(automaton.iter_matches("")) == []
+
+    def test_empty_dictionary(self):
+        automaton = AhoCorasick([])
+        assert automaton.longest_match("password") is None
+
+    def test_matches_brute_force(self):
+        words = ["ab", "abc", "bca", "cab", "aa", "bcab"]
+        automaton = AhoCorasick(words)
+        text = "aabcabcaab"
+        expected = sorted(
+            (i, i + len(w))
+            for w in words
+            for i in range(len(text) - len(w) + 1)
+            if text.startswith(w, i)
+        )
+        assert sorted(automaton.iter_matches(text)) == expected
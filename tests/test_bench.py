@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+from password_analyzer.bench import (
+    CORPORA,
+    GENERATOR_CORPUS,
+    BenchResult,
+    compare,
+    load_baseline,
+    make_corpus,
+    percentile,
+    run_benchmarks,
+    save_baseline,
+)
+from password_analyzer.cli import main
+
+
+class TestCorpora:
+    @pytest.mark.parametrize("kind", list(CORPORA))
+    def test_deterministic(self, kind):
+        assert make_corpus(kind, 50, seed=1) == make_corpus(kind, 50, seed=1)
+        assert make_corpus(kind, 50, seed=1) != make_corpus(kind, 50, seed=2)
+
+    def test_shapes(self):
+        assert all(4 <= len(p) <= 8 for p in make_corpus("short-ascii", 100))
+        assert all(len(p) >= 24 for p in make_corpus("long-ascii", 100))
+        assert any(not p.isascii() for p in make_corpus("unicode", 100))
+
+    def test_unknown_corpus(self):
+        with pytest.raises(ValueError):
+            make_corpus("nope")
+
+
+class TestRun:
+    def test_run_benchmarks(self):
+        results = run_benchmarks(
+            targets=["check_length", "check_entropy", "generate_password"],
+            corpora=["common", "patterns"],
+            size=20, repeat=2,
+        )
+        assert [(r.target, r.corpus) for r in results] == [
+            ("check_length", "common"),
+            ("check_entropy", "common"),
+            ("check_length", "patterns"),
+            ("check_entropy", "patterns"),
+            ("generate_password", GENERATOR_CORPUS),
+        ]
+        assert all(r.calls == 40 for r in results)
+        assert all(r.ops_per_sec > 0 and r.p99_us >= r.p50_us for r in results)
+
+    def test_unknown_target(self):
+        with pytest.raises(ValueError):
+            run_benchmarks(targets=["nope"], size=1)
+
+    def test_percentile(self):
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+
+class TestBaseline:
+    def test_round_trip(self, tmp_path):
+        results = [BenchResult("analyze", "common", 10, 1000.0, 1.0, 2.0)]
+        path = tmp_path / "baseline.json"
+        save_baseline(results, path)
+        assert load_baseline(path) == results
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"version": 99}))
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    def test_compare_flags_regressions(self):
+        baseline = [
+            BenchResult("analyze", "common", 10, 1000.0, 1.0, 2.0),
+            BenchResult("analyze", "random", 10, 1000.0, 1.0, 2.0),
+        ]
+        current = [
+            BenchResult("analyze", "common", 10, 950.0, 1.0, 2.0),
+            BenchResult("analyze", "random", 10, 800.0, 1.0, 2.0),
+            BenchResult("analyze", "unicode", 10, 800.0, 1.0, 2.0),
+        ]
+        comparisons = compare(current, baseline, threshold=0.10)
+        assert [(c.corpus, c.regressed) for c in comparisons] == [
+            ("common", False), ("random", True),
+        ]
+        assert comparisons[1].change == pytest.approx(-0.2)
+
+
+class TestCLIBench:
+    def test_bench_save_and_compare(self, capsys, tmp_path):
+        path = tmp_path / "baseline.json"
+        args = ["bench", "--target", "check_length", "--corpus", "common", "--size", "20"]
+        main([*args, "--save", str(path)])
+        assert "check_length" in capsys.readouterr().out
+        main([*args, "--compare", str(path), "--threshold", "100"])
+        assert "vs baseline" in capsys.readouterr().out
+
+    def test_bench_regression_exits(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_baseline([BenchResult("check_length", "common", 1, 1e12, 0.0, 0.0)], path)
+        with pytest.raises(SystemExit) as e:
+            main(["bench", "--target", "check_length", "--corpus", "common",
+                  "--size", "20", "--compare", str(path)])
+        assert e.value.code == 1
@@ -0,0 +1,126 @@
+import pytest
+
+from password_analyzer.bloom import (
+    BloomFilter,
+    FilteredWordList,
+    build_filter,
+    optimal_parameters,
+)
+from password_analyzer.checks import check_common_password
+from password_analyzer.common_passwords import COMMON_PASSWORDS
+from password_analyzer.compiled import CompiledWordList, compile_wordlist
+from password_analyzer.wordlist import MemoryWordList, map_file
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(sorted(COMMON_PASSWORDS)) + "\n")
+    return path
+
+
+class TestOptimalParameters:
+    def test_about_one_byte_per_entry_at_two_percent(self):
+        bits, hashes = optimal_parameters(1_000_000, 0.02)
+        assert 7.5 < bits / 1_000_000 < 8.5
+        assert hashes == 6
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            optimal_parameters(100, 0)
+        with pytest.raises(ValueError):
+            optimal_parameters(100, 1.5)
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter.for_capacity(len(COMMON_PASSWORDS))
+        for word in COMMON_PASSWORDS:
+            bloom.add(word)
+        assert all(word in bloom for word in COMMON_PASSWORDS)
+        assert bloom.max_length == max(len(w) for w in COMMON_PASSWORDS)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter.for_capacity(5000, 0.02)
+        for i in range(5000):
+            bloom.add(f"word{i}")
+        false_positives = sum(f"other{i}" in bloom for i in range(20000))
+        assert false_positives / 20000 < 0.04
+
+    def test_lone_surrogates(self):
+        bloom = BloomFilter.for_capacity(10)
+        assert "pass\ud800" not in bloom
+        bloom.add("pass\ud800")
+        assert "pass\ud800" in bloom
+
+    def test_save_and_load(self, tmp_path):
+        bloom = BloomFilter.for_capacity(10)
+        bloom.add("dragon")
+        path = tmp_path / "words.bloom"
+        bloom.save(path)
+
+        loaded = BloomFilter.load(path)
+        assert "dragon" in loaded
+        assert loaded.entry_count == 1
+        assert loaded.bit_count == bloom.bit_count
+        loaded.close()
+
+    def test_load_rejects_other_files(self, source, monkeypatch):
+        mapped = []
+        monkeypatch.setattr(
+            "password_analyzer.bloom.map_file",
+            lambda p: mapped.append(map_file(p)) or mapped[-1],
+        )
+        with pytest.raises(ValueError):
+            BloomFilter.load(source)
+        assert mapped[0].closed
+
+    def test_build_filter(self, source, tmp_path):
+        bloom = build_filter(source, tmp_path / "words.bloom")
+        loaded = BloomFilter.load(tmp_path / "words.bloom")
+        assert loaded.entry_count == bloom.entry_count == len(COMMON_PASSWORDS)
+        assert loaded.content_hash == bloom.content_hash
+        assert all(word in loaded for word in COMMON_PASSWORDS)
+        loaded.close()
+
+
+class TestFilteredWordList:
+    def test_matches_unfiltered_results(self, source, tmp_path):
+        build_filter(source, tmp_path / "words.bloom")
+        compile_wordlist(source, tmp_path / "words.padict")
+        filtered = FilteredWordList(
+            BloomFilter.load(tmp_path / "words.bloom"),
+            CompiledWordList(tmp_path / "words.padict"),
+        )
+        memory = MemoryWordList(COMMON_PASSWORDS)
+        for password in ["password", "Dragon", "mypassword99", "j8Kp2mXnQ9", ""]:
+            assert check_common_password(password, filtered) == \
+                check_common_password(password, memory)
+        filtered.close()
+
+    def test_rejects_mismatched_wordlist(self, source, tmp_path):
+        build_filter(source, tmp_path / "words.bloom")
+        other = tmp_path / "other.txt"
+        other.write_text("something\n")
+        compile_wordlist(other, tmp_path / "other.padict")
+        with pytest.raises(ValueError):
+            FilteredWordList(
+                BloomFilter.load(tmp_path / "words.bloom"),
+                CompiledWordList(tmp_path / "other.padict"),
+            )
+
+    def test_negative_skips_exact_lookup(self):
+        class CountingWordList(MemoryWordList):
+            lookups = 0
+
+            def __contains__(self, word):
+                CountingWordList.lookups += 1
+                return super().__contains__(word)
+
+        bloom = BloomFilter.for_capacity(1, 0.0001)
+        bloom.add("dragon")
+        filtered = FilteredWordList(bloom, CountingWordList(["dragon"]))
+        assert "j8kp2mxnq9" not in filtered
+        assert CountingWordList.lookups == 0
+        assert "dragon" in filtered
+        assert CountingWordList.lookups == 1
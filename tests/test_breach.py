@@ -0,0 +1,125 @@
+import hashlib
+
+import pytest
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.breach import BreachIndex, convert_dump, convert_dump_file
+from password_analyzer.checks import check_breached_password
+from password_analyzer.wordlist import map_file
+
+
+def sha1_hex(password):
+    return hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+
+
+BREACHED = {
+    "password": 9_545_824,
+    "hunter2": 45,
+    "correcthorse": 1,
+    "Tr0ub4dor&3": 120,
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    lines = sorted(f"{sha1_hex(p)}:{n}" for p, n in BREACHED.items())
+    path = tmp_path / "breach.idx"
+    convert_dump(lines, path)
+    index = BreachIndex(path)
+    yield index
+    index.close()
+
+
+class TestConvertDump:
+    def test_record_count(self, index):
+        assert len(index) == len(BREACHED)
+
+    def test_rejects_unsorted_dump(self, tmp_path):
+        lines = sorted(f"{sha1_hex(p)}:1" for p in BREACHED)
+        with pytest.raises(ValueError):
+            convert_dump(reversed(lines), tmp_path / "breach.idx")
+
+    def test_rejects_malformed_hash(self, tmp_path):
+        with pytest.raises(ValueError):
+            convert_dump(["ABCDEF:3"], tmp_path / "breach.idx")
+
+    def test_count_defaults_to_one(self, tmp_path):
+        path = tmp_path / "breach.idx"
+        convert_dump([sha1_hex("hunter2")], path)
+        assert BreachIndex(path).count("hunter2") == 1
+
+    def test_convert_dump_file_skips_blank_lines(self, tmp_path):
+        source = tmp_path / "dump.txt"
+        source.write_text(f"{sha1_hex('hunter2')}:7\n\n")
+        assert convert_dump_file(source, tmp_path / "breach.idx") == 1
+        assert BreachIndex(tmp_path / "breach.idx").count("hunter2") == 7
+
+
+class TestBreachIndex:
+    def test_counts(self, index):
+        for password, count in BREACHED.items():
+            assert index.count(password) == count
+
+    def test_case_sensitive(self, index):
+        assert index.count("Password") == 0
+
+    def test_missing(self, index):
+        assert index.count("j8$Kp2!mX@nQ9vL#") == 0
+
+    def test_lone_surrogates(self, index):
+        assert index.count("pass\ud800word") == 0
+
+    def test_shared_bucket(self, tmp_path):
+        digest = hashlib.sha1(b"hunter2").digest()
+        neighbours = sorted([
+            digest.hex(),
+            (digest[:2] + bytes([digest[2] ^ 0x01]) + digest[3:]).hex(),
+            (digest[:19] + bytes([digest[19] ^ 0xFF])).hex(),
+        ])
+        path = tmp_path / "breach.idx"
+        convert_dump([f"{h}:{i + 2}" for i, h in enumerate(neighbours)], path)
+        index = BreachIndex(path)
+        assert index.count("hunter2") == neighbours.index(digest.hex()) + 2
+
+    def test_rejects_other_files(self, tmp_path, monkeypatch):
+        mapped = []
+        monkeypatch.setattr(
+            "password_analyzer.breach.map_file",
+            lambda p: mapped.append(map_file(p)) or mapped[-1],
+        )
+        path = tmp_path / "words.txt"
+        path.write_text("not an index\n")
+        with pytest.raises(ValueError):
+            BreachIndex(path)
+        assert mapped[0].closed
+
+
+class TestCheckBreachedPassword:
+    def test_not_breached(self, index):
+        result = check_breached_password("j8$Kp2!mX@nQ9vL#", index)
+        assert result.score == 0
+        assert result.feedback == []
+
+    def test_single_sighting(self, index):
+        assert check_breached_password("correcthorse", index).score == -1
+
+    def test_penalty_grows_with_prevalence(self, index):
+        rare = check_breached_password("hunter2", index).score
+        common = check_breached_password("Tr0ub4dor&3", index).score
+        assert -3 < common < rare < -1
+
+    def test_penalty_capped(self, index):
+        assert check_breached_password("password", index).score == -3
+
+
+class TestAnalyzerWithBreachIndex:
+    def test_adds_breach_check(self, index):
+        result = PasswordAnalyzer(breach_index=index).analyze("Tr0ub4dor&3")
+        names = [c.name for c in result.checks]
+        assert names.index("Breached password") == names.index("Common password") + 1
+        assert any("breach data" in f for f in result.feedback)
+
+    def test_breached_password_scores_lower(self, index):
+        plain = PasswordAnalyzer().analyze("Tr0ub4dor&3")
+        breached = PasswordAnalyzer(breach_index=index).analyze("Tr0ub4dor&3")
+        assert breached.score < plain.score
@@ -0,0 +1,89 @@
+import pytest
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.cache import ResultCache, estimate_size
+
+
+class TestResultCache:
+    def test_keys_are_keyed_hashes(self):
+        cache = ResultCache(secret=b"k" * 32)
+        key = cache.key("password")
+        assert b"password" not in key
+        assert key == ResultCache(secret=b"k" * 32).key("password")
+        assert key != ResultCache(secret=b"j" * 32).key("password")
+
+    def test_utf8_bytes_share_key(self):
+        cache = ResultCache()
+        assert cache.key("pässword".encode()) == cache.key("pässword")
+        assert cache.key(memoryview(b"password")) == cache.key("password")
+
+    def test_random_secret_per_instance(self):
+        assert ResultCache().key("password") != ResultCache().key("password")
+
+    def test_hit_and_miss_counters(self):
+        cache = ResultCache()
+        result = PasswordAnalyzer().analyze("abc")
+        key = cache.key("abc")
+        assert cache.get(key) is None
+        cache.put(key, result)
+        assert cache.get(key) is result
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction_by_entries(self):
+        cache = ResultCache(max_entries=2)
+        analyzer = PasswordAnalyzer()
+        keys = [cache.key(p) for p in ("a", "b", "c")]
+        cache.put(keys[0], analyzer.analyze("a"))
+        cache.put(keys[1], analyzer.analyze("b"))
+        cache.get(keys[0])
+        cache.put(keys[2], analyzer.analyze("c"))
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget(self):
+        result = PasswordAnalyzer().analyze("abc")
+        size = estimate_size(result)
+        cache = ResultCache(max_bytes=size * 2 + 1)
+        for password in ("a", "b", "c"):
+            cache.put(cache.key(password), result)
+        assert len(cache) == 2
+        assert cache.stats().bytes <= size * 2 + 1
+
+    def test_oversized_result_not_cached(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put(cache.key("a"), PasswordAnalyzer().analyze("a"))
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = ResultCache()
+        cache.put(cache.key("a"), PasswordAnalyzer().analyze("a"))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().bytes == 0
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=0)
+
+
+class TestAnalyzerCache:
+    def test_disabled_by_default(self):
+        assert PasswordAnalyzer().cache is None
+
+    def test_repeated_password_hits_cache(self):
+        cache = ResultCache()
+        analyzer = PasswordAnalyzer(cache=cache)
+        first = analyzer.analyze("Hello123!")
+        second = analyzer.analyze("Hello123!")
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_results_match_uncached(self):
+        cached = PasswordAnalyzer(cache=ResultCache(max_entries=2))
+        plain = PasswordAnalyzer()
+        passwords = ["password", "Hello123!", "password", "abc", "x", "Hello123!"]
+        assert list(cached.analyze_many(passwords)) == [plain.analyze(p) for p in passwords]
+        assert cached.cache.hits == 1
@@ -5,7 +5,13 @@ from password_analyzer.checks import (
     check_entropy,
     check_length,
     check_sequential_characters,
+    score_character_variety,
+    score_common_password,
+    score_entropy,
+    score_length,
+    score_sequential_characters,
 )
+from password_analyzer.messages import MessageCode
 
 
 class TestCheckLength:
@@ -106,6 +112,88 @@ class TestCheckCommonPassword:
         result = check_common_password("admin")
         assert result.score == -3
 
+    def test_substring_reports_longest_word(self):
+        result = check_common_password("xpassword!")
+        assert result.score == -1
+        assert "'password'" in result.feedback[0]
+
+    def test_substring_matches_brute_force_on_bundled_list(self):
+        from password_analyzer.common_passwords import COMMON_PASSWORDS
+
+        for candidate in ["mypassword99", "xdragonx", "iloveyou2", "zzzz", "sunshine!"]:
+            lower = candidate.lower()
+            expected = lower not in COMMON_PASSWORDS and any(
+                len(w) >= 4 and w in lower for w in COMMON_PASSWORDS
+            )
+            # Entries with only affixes around them score -2, see below.
+            assert (check_common_password(candidate).score in (-1, -2)) == expected
+
+    def test_leet_spelling_of_entry(self):
+        result = check_common_password("$unsh1ne")
+        assert result.score == -2
+        assert result.messages[0].code is MessageCode.LEET_PASSWORD
+        assert result.feedback == [
+            "This is the common password 'sunshine' with predictable substitutions "
+            "('$' for 's', '1' for 'i')."
+        ]
+
+    def test_leet_spelling_is_case_insensitive(self):
+        assert check_common_password("DR4G0N").score == -2
+
+    def test_leet_word_inside_password(self):
+        result = check_common_password("xM0nk3y!")
+        assert result.score == -1
+        assert result.messages[0].code is MessageCode.LEET_WORD
+        assert result.messages[0].args[0] == "monkey"
+
+    def test_plain_substring_preferred_over_leet(self):
+        result = check_common_password("mypassword4dm1n")
+        assert result.messages[0].code is MessageCode.COMMON_WORD
+
+    def test_leet_entry_beats_leet_substring(self):
+        # "p4ss" spells out "pass", but the whole password spells "password".
+        assert check_common_password("p4ssw0rd").score == -2
+
+    def test_near_miss(self):
+        result = check_common_password("Sunshone")
+        assert result.score == -2
+        assert result.messages[0].code is MessageCode.NEAR_PASSWORD
+        assert result.messages[0].args == ("sunshine", 1)
+
+    def test_near_miss_distance(self):
+        assert check_common_password("sunshxne!").score == 0
+        assert check_common_password("sunshxne!", max_distance=2).score == -2
+        assert check_common_password("sunshone", max_distance=0).score == 0
+
+    def test_short_passwords_not_near_misses(self):
+        # One edit per four characters: "abc1" is not a typo of "abc123".
+        assert check_common_password("dragn").score == -2
+        assert check_common_password("abc").score == 0
+
+    def test_word_with_suffix_is_not_a_near_miss(self):
+        result = check_common_password("iloveyou2")
+        assert result.messages[0].code is MessageCode.AFFIXED_PASSWORD
+
+    def test_entry_with_affixes(self):
+        result = check_common_password("Summer2024!")
+        assert result.score == -2
+        assert result.messages[0].code is MessageCode.AFFIXED_PASSWORD
+        assert result.feedback == [
+            "This is the common password 'summer' with predictable additions "
+            "('2024!' at the end)."
+        ]
+        assert check_common_password("#1Dragon").messages[0].args == (
+            "dragon", "'#1' at the start",
+        )
+
+    def test_letters_around_entry_are_not_affixes(self):
+        assert check_common_password("mypassword99").score == -1
+        assert check_common_password("xdragonx").score == -1
+
+    def test_substitutions_can_be_disabled(self):
+        assert check_common_password("$unsh1ne", substitutions={}).score == 0
+        assert check_common_password("dr*gon", substitutions={"*": "a"}).score == -2
+
 
 class TestCheckSequentialCharacters:
     def test_repeated_characters(self):
@@ -132,6 +220,18 @@ class TestCheckSequentialCharacters:
         assert result.score == 0
         assert any("keyboard" in f.lower() for f in result.feedback)
 
+    def test_keyboard_walk(self):
+        result = check_sequential_characters("Xsw2cdE3")
+        assert result.score == 0
+        assert result.feedback == [
+            "Contains keyboard walk 'Xsw2' (4 adjacent keys on QWERTY).",
+            "Contains keyboard walk 'cdE3' (4 adjacent keys on QWERTY).",
+        ]
+
+    def test_walk_inside_literal_pattern_reported_once(self):
+        result = check_sequential_characters("myqwerty1")
+        assert result.feedback == ["Contains keyboard pattern 'qwerty'."]
+
     def test_no_patterns(self):
         result = check_sequential_characters("j8Kp2mXn")
         assert result.score == 1
@@ -169,3 +269,24 @@ class TestCheckEntropy:
     def test_zero_entropy(self):
         result = check_entropy(0.0)
         assert result.score == 0
+
+
+class TestScoreOnly:
+    PASSWORDS = [
+        "", "abc", "password", "P@ssw0rd!", "qwerty123", "aaaa", "Xk9#mP2$vL5@nQ8!zR4",
+        "$unsh1ne", "xM0nk3y!", "passwprd",
+    ]
+
+    def test_scores_match_checks(self):
+        for password in self.PASSWORDS:
+            assert score_length(password) == check_length(password).score
+            assert score_character_variety(password) == check_character_variety(password).score
+            assert score_common_password(password) == check_common_password(password).score
+            assert (
+                score_sequential_characters(password)
+                == check_sequential_characters(password).score
+            )
+
+    def test_entropy_score_matches_check(self):
+        for bits in (0, 27.9, 28, 59.9, 60, 128):
+            assert score_entropy(bits) == check_entropy(bits).score
@@ -1,7 +1,10 @@
 import subprocess
 import sys
 
-from password_analyzer.cli import main
+import pytest
+
+from password_analyzer.cli import COLORS, build_score_bar, main
+from password_analyzer.scoring import STRENGTH_THRESHOLDS, get_strength_label
 
 
 class TestCLIWithArgs:
@@ -34,6 +37,161 @@ class TestCLIWithArgs:
         output = capsys.readouterr().out
         assert "Score:" in output
 
+    @pytest.mark.parametrize("label", sorted(STRENGTH_THRESHOLDS))
+    def test_score_bar_color_matches_label(self, monkeypatch, label):
+        monkeypatch.setattr("password_analyzer.cli._use_color", True)
+        for score in (STRENGTH_THRESHOLDS[label], max(STRENGTH_THRESHOLDS[label] - 1, 0)):
+            _, color = get_strength_label(score)
+            assert build_score_bar(score).startswith("[" + COLORS[color])
+
+
+class TestCLIWordlist:
+    def test_custom_wordlist(self, capsys, tmp_path, monkeypatch):
+        monkeypatch.setenv("PASSWORD_ANALYZER_CACHE", str(tmp_path / "cache"))
+        path = tmp_path / "words.txt"
+        path.write_text("correcthorse\n")
+        main(["--no-color", "--verbose", "--wordlist", str(path), "CorrectHorse"])
+        output = capsys.readouterr().out
+        assert "extremely common" in output
+
+    def test_missing_wordlist_exits(self, tmp_path):
+        try:
+            main(["--no-color", "--wordlist", str(tmp_path / "nope.txt"), "abc"])
+        except SystemExit as e:
+            assert e.code == 1
+
+
+class TestCLIBuildDict:
+    def test_build_dict_to_output(self, capsys, tmp_path):
+        source = tmp_path / "words.txt"
+        source.write_text("Alpha\nbravo\nalpha\n")
+        output = tmp_path / "words.padict"
+        main(["build-dict", str(source), "-o", str(output)])
+        out = capsys.readouterr().out
+        assert "Compiled 2 entries" in out
+        assert output.exists()
+        assert "Near-miss index" not in out
+
+        main(["--no-color", "--verbose", "--wordlist", str(output), "BRAVO"])
+        assert "extremely common" in capsys.readouterr().out
+
+    def test_build_dict_near_miss_index(self, capsys, tmp_path):
+        source = tmp_path / "words.txt"
+        source.write_text("sunshine\n")
+        output = tmp_path / "words.padict"
+        main(["build-dict", str(source), "-o", str(output), "--near-miss-distance", "1"])
+        assert f"{output}.d1.pafuzzy" in capsys.readouterr().out
+
+        main(["--no-color", "--verbose", "--wordlist", str(output), "sunshone"])
+        assert "Close to the common password 'sunshine'" in capsys.readouterr().out
+
+    def test_build_dict_near_miss_index_unwritable(self, capsys, tmp_path, monkeypatch):
+        from password_analyzer import fuzzy
+
+        def fail(*args, **kwargs):
+            raise OSError("read-only file system")
+
+        monkeypatch.setattr(fuzzy.tempfile, "mkstemp", fail)
+        source = tmp_path / "words.txt"
+        source.write_text("sunshine\n")
+        with pytest.raises(SystemExit) as exc:
+            main(["build-dict", str(source), "-o", str(tmp_path / "w.padict"),
+                  "--near-miss-distance", "1"])
+        assert exc.value.code == 1
+        assert "read-only" in capsys.readouterr().err
+
+    def test_build_dict_into_cache(self, capsys, tmp_path, monkeypatch):
+        monkeypatch.setenv("PASSWORD_ANALYZER_CACHE", str(tmp_path / "cache"))
+        source = tmp_path / "words.txt"
+        source.write_text("alpha\n")
+        main(["build-dict", str(source)])
+        assert str(tmp_path / "cache") in capsys.readouterr().out
+
+    def test_build_dict_missing_source_exits(self, tmp_path):
+        try:
+            main(["build-dict", str(tmp_path / "nope.txt"), "-o", str(tmp_path / "x")])
+        except SystemExit as e:
+            assert e.code == 1
+
+
+class TestCLIFilter:
+    def test_build_and_use_filter(self, capsys, tmp_path):
+        source = tmp_path / "words.txt"
+        source.write_text("correcthorse\n")
+        main(["build-dict", str(source), "-o", str(tmp_path / "words.padict")])
+        main(["build-filter", str(source), "-o", str(tmp_path / "words.bloom")])
+        assert "Built filter over 1 entries" in capsys.readouterr().out
+
+        main([
+            "--no-color", "--verbose",
+            "--wordlist", str(tmp_path / "words.padict"),
+            "--filter", str(tmp_path / "words.bloom"),
+            "CorrectHorse",
+        ])
+        assert "extremely common" in capsys.readouterr().out
+
+
+class TestCLIBreachIndex:
+    def test_build_and_use_breach_index(self, capsys, tmp_path):
+        import hashlib
+
+        digest = hashlib.sha1(b"Hello123!").hexdigest().upper()
+        dump = tmp_path / "dump.txt"
+        dump.write_text(f"{digest}:5000\n")
+        main(["build-breach-index", str(dump), "-o", str(tmp_path / "breach.idx")])
+        assert "Indexed 1 hashes" in capsys.readouterr().out
+
+        main([
+            "--no-color", "--verbose",
+            "--breach-index", str(tmp_path / "breach.idx"),
+            "Hello123!",
+        ])
+        output = capsys.readouterr().out
+        assert "Breached password" in output
+        assert "Found in breach data 5,000 times" in output
+
+
+class TestCLIAudit:
+    def test_audit_file_to_stdout(self, capsys, tmp_path):
+        import json
+
+        source = tmp_path / "passwords.txt"
+        source.write_bytes(b"password\nHello123!\n")
+        main(["--input", str(source)])
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["line"] for r in records] == [1, 2]
+
+    def test_audit_stdin_to_file(self, tmp_path, monkeypatch):
+        import io
+
+        monkeypatch.setattr(
+            "sys.stdin", io.TextIOWrapper(io.BytesIO(b"password\nabc\n")),
+        )
+        output = tmp_path / "audit.csv"
+        main(["--input", "-", "--format", "csv", "--output", str(output)])
+        lines = output.read_text().splitlines()
+        assert lines[0] == "line,length,score,strength,entropy_bits"
+        assert len(lines) == 3
+
+    def test_missing_input_exits(self, tmp_path):
+        try:
+            main(["--input", str(tmp_path / "nope.txt")])
+        except SystemExit as e:
+            assert e.code == 1
+
+    def test_parallel_audit(self, capsys, tmp_path):
+        source = tmp_path / "passwords.txt"
+        source.write_bytes(b"password\nHello123!\nabc\n")
+        main(["--input", str(source), "--format", "tsv", "--jobs", "2"])
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split("\t")[0] for line in lines] == ["line", "1", "2", "3"]
+
+    def test_parallel_audit_rejects_stdin(self):
+        try:
+            main(["--input", "-", "--jobs", "2"])
+        except SystemExit as e:
+            assert e.code == 1
+
 
 class TestCLIVerbose:
     def test_verbose_shows_breakdown(self, capsys):
@@ -92,3 +250,59 @@ class TestCLISubprocess:
         )
         assert result.returncode == 0
         assert "Score:" in result.stdout
+
+
+class TestCLIProfile:
+    def test_profile_audit(self, capsys, tmp_path):
+        source = tmp_path / "passwords.txt"
+        source.write_text("abc\nHello123!\n")
+        main(["--input", str(source), "--profile"])
+        captured = capsys.readouterr()
+        assert captured.out.count("\n") == 2
+        assert "Per-check timings" in captured.err
+        assert "Common password" in captured.err
+
+    def test_profile_single_password(self, capsys):
+        main(["--no-color", "--profile", "abc"])
+        captured = capsys.readouterr()
+        assert "Score:" in captured.out
+        assert "Entropy" in captured.err
+
+    def test_profile_needs_one_job(self, tmp_path):
+        source = tmp_path / "passwords.txt"
+        source.write_text("abc\n")
+        try:
+            main(["--input", str(source), "--profile", "--jobs", "2"])
+        except SystemExit as e:
+            assert e.code == 1
+
+
+class TestCLIFeedbackClassification:
+    def test_custom_suggestion_listed_as_suggestion(self, capsys):
+        from password_analyzer.analyzer import AnalysisResult
+        from password_analyzer.checks import CheckResult
+        from password_analyzer.cli import print_result
+        from password_analyzer.messages import Message
+
+        check = CheckResult("Custom", 0, 0, (
+            Message.text("Contains nothing bad."),
+            Message.text("Rotate it yearly.", suggestion=True),
+        ))
+        result = AnalysisResult(8, 50, "Fair", "yellow", 30.0, [check])
+        print_result(result)
+        output = capsys.readouterr().out
+        strengths, suggestions = output.split("Suggestions:")
+        assert "Contains nothing bad." in strengths
+        assert "Rotate it yearly." in suggestions
+
+    def test_plain_string_advice_listed_as_suggestion(self, capsys):
+        from password_analyzer.analyzer import AnalysisResult
+        from password_analyzer.checks import CheckResult
+        from password_analyzer.cli import print_result
+
+        check = CheckResult("Custom", 0, 0, ["Add a passphrase instead.", "Nice rhythm."])
+        result = AnalysisResult(8, 50, "Fair", "yellow", 30.0, [check])
+        print_result(result)
+        strengths, suggestions = capsys.readouterr().out.split("Suggestions:")
+        assert "Nice rhythm." in strengths
+        assert "Add a passphrase instead." in suggestions
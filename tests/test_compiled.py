@@ -0,0 +1,217 @@
+import os
+
+import pytest
+
+from password_analyzer.checks import check_common_password
+from password_analyzer.common_passwords import COMMON_PASSWORDS
+from password_analyzer.compiled import (
+    FORMAT_VERSION,
+    CompiledWordList,
+    DictionaryFormatError,
+    cached_compile,
+    compile_wordlist,
+    is_compiled,
+    load_wordlist,
+    source_hash,
+)
+from password_analyzer.wordlist import (
+    MemoryWordList,
+    SortedFileWordList,
+    map_file,
+    write_sorted_wordlist,
+)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(sorted(COMMON_PASSWORDS, reverse=True)) + "\n")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("PASSWORD_ANALYZER_CACHE", str(directory))
+    return directory
+
+
+class TestCompileWordlist:
+    def test_round_trip(self, source, tmp_path):
+        dest = tmp_path / "words.padict"
+        info = compile_wordlist(source, dest)
+        assert info.word_count == len(COMMON_PASSWORDS)
+        assert info.size == os.path.getsize(dest)
+        assert info.content_hash == source_hash(source)
+
+        with CompiledWordList(dest) as wordlist:
+            assert len(wordlist) == len(COMMON_PASSWORDS)
+            for word in COMMON_PASSWORDS:
+                assert word in wordlist
+            for word in ["", "0", "zzzz", "passwor", "aaaa", "password1234"]:
+                assert word not in wordlist
+
+    @pytest.mark.parametrize("block_size", [1, 2, 3, 16, 1000])
+    def test_block_sizes(self, source, tmp_path, block_size):
+        dest = tmp_path / "words.padict"
+        compile_wordlist(source, dest, block_size=block_size)
+        memory = MemoryWordList(COMMON_PASSWORDS)
+        with CompiledWordList(dest) as wordlist:
+            for word in COMMON_PASSWORDS:
+                assert word in wordlist
+            for text in ["mypassword99", "xdragonx", "qwerty123abc", "j8kp2mxnq9"]:
+                assert wordlist.longest_substring(text, 4) == \
+                    memory.longest_substring(text, 4)
+
+    def test_front_coding_is_smaller_than_source(self, tmp_path):
+        source = tmp_path / "words.txt"
+        source.write_text("".join(f"password{i:05d}\n" for i in range(2000)))
+        dest = tmp_path / "words.padict"
+        info = compile_wordlist(source, dest)
+        assert info.size < os.path.getsize(source)
+        with CompiledWordList(dest) as wordlist:
+            assert "password01234" in wordlist
+            assert "password1234" not in wordlist
+
+    def test_skips_invalid_utf8(self, tmp_path):
+        source = tmp_path / "words.txt"
+        source.write_bytes(b"good\n\xff\xfebad\n")
+        info = compile_wordlist(source, tmp_path / "words.padict")
+        assert info.word_count == 1
+        assert info.skipped == 1
+
+    def test_empty_source(self, tmp_path):
+        source = tmp_path / "empty.txt"
+        source.write_bytes(b"")
+        dest = tmp_path / "empty.padict"
+        compile_wordlist(source, dest)
+        with CompiledWordList(dest) as wordlist:
+            assert "password" not in wordlist
+            assert check_common_password("password", wordlist).score == 0
+
+
+class TestCompiledWordList:
+    def test_rejects_text_file(self, source, monkeypatch):
+        mapped = []
+        monkeypatch.setattr(
+            "password_analyzer.compiled.map_file",
+            lambda p: mapped.append(map_file(p)) or mapped[-1],
+        )
+        with pytest.raises(DictionaryFormatError):
+            CompiledWordList(source)
+        assert mapped[0].closed
+
+    def test_rejects_other_version(self, source, tmp_path):
+        dest = tmp_path / "words.padict"
+        compile_wordlist(source, dest)
+        data = bytearray(dest.read_bytes())
+        data[8] = FORMAT_VERSION + 1
+        dest.write_bytes(bytes(data))
+        with pytest.raises(DictionaryFormatError):
+            CompiledWordList(dest)
+
+    def test_lone_surrogates_analyzed(self, source, tmp_path):
+        from password_analyzer.analyzer import PasswordAnalyzer
+
+        dest = tmp_path / "words.padict"
+        compile_wordlist(source, dest)
+        with CompiledWordList(dest) as wordlist:
+            result = PasswordAnalyzer(wordlist=wordlist).analyze("ab\ud800cd")
+        assert result.password_length == 5
+
+    def test_spilled_runs_give_same_file(self, source, tmp_path):
+        whole, spilled = tmp_path / "whole.padict", tmp_path / "spilled.padict"
+        compile_wordlist(source, whole)
+        info = compile_wordlist(source, spilled, run_size=7)
+        assert info.word_count == len(COMMON_PASSWORDS)
+        assert spilled.read_bytes() == whole.read_bytes()
+
+    def test_is_compiled(self, source, tmp_path):
+        dest = tmp_path / "words.padict"
+        compile_wordlist(source, dest)
+        assert is_compiled(dest)
+        assert not is_compiled(source)
+
+
+class TestCache:
+    def test_compiles_once(self, source, cache):
+        first = cached_compile(source)
+        assert first.path.startswith(str(cache))
+        mtime = os.path.getmtime(first.path)
+
+        second = cached_compile(source)
+        assert second.path == first.path
+        assert os.path.getmtime(second.path) == mtime
+
+    def test_changed_source_gets_new_artifact(self, source, cache):
+        first = cached_compile(source)
+        source.write_text("different\n")
+        second = cached_compile(source)
+        assert second.path != first.path
+        assert second.word_count == 1
+
+    def test_no_temp_files_left(self, source, cache):
+        cached_compile(source)
+        assert not [p for p in os.listdir(cache) if p.endswith(".tmp")]
+
+    def test_load_wordlist_from_text(self, source, cache):
+        wordlist = load_wordlist(source)
+        assert isinstance(wordlist, CompiledWordList)
+        assert check_common_password("Dragon", wordlist).score == -3
+        assert check_common_password("mydragon!", wordlist).score == -1
+        wordlist.close()
+
+    def test_unchanged_source_not_rehashed(self, source, cache, monkeypatch):
+        first = cached_compile(source)
+
+        def fail(path):
+            raise AssertionError("source hashed again")
+
+        monkeypatch.setattr("password_analyzer.compiled.source_hash", fail)
+        assert cached_compile(source).path == first.path
+
+    def test_sorted_text_served_directly(self, tmp_path, cache, monkeypatch):
+        path = tmp_path / "sorted.txt"
+        write_sorted_wordlist(COMMON_PASSWORDS, path)
+        wordlist = load_wordlist(path)
+        assert isinstance(wordlist, SortedFileWordList)
+        assert wordlist.path == str(path)
+        assert check_common_password("Dragon", wordlist).score == -3
+        wordlist.close()
+
+        def fail(path):
+            raise AssertionError("source scanned again")
+
+        monkeypatch.setattr("password_analyzer.compiled.is_sorted_wordlist", fail)
+        wordlist = load_wordlist(path)
+        assert isinstance(wordlist, SortedFileWordList)
+        wordlist.close()
+        assert not [p for p in os.listdir(cache) if p.endswith(".padict")]
+
+    def test_near_miss_index_only_when_built(self, source, cache):
+        wordlist = load_wordlist(source)
+        assert wordlist.deletion_index(1) is None
+        assert check_common_password("sunshone", wordlist).score == 0
+        index = wordlist.build_deletion_index(1)
+        assert index.path == wordlist.path + ".d1.pafuzzy"
+        assert check_common_password("sunshone", wordlist).score == -2
+        wordlist.close()
+
+        with load_wordlist(source) as reopened:
+            mtime = os.path.getmtime(index.path)
+            assert reopened.deletion_index(1).lookup("sunshone")[0].word == "sunshine"
+            assert os.path.getmtime(index.path) == mtime
+
+    def test_iterates_entries_in_order(self, source, tmp_path):
+        dest = tmp_path / "words.padict"
+        compile_wordlist(source, dest, block_size=3)
+        with CompiledWordList(dest) as wordlist:
+            assert list(wordlist) == sorted(COMMON_PASSWORDS, key=str.encode)
+
+    def test_load_wordlist_from_artifact(self, source, tmp_path, cache):
+        dest = tmp_path / "words.padict"
+        compile_wordlist(source, dest)
+        wordlist = load_wordlist(dest)
+        assert wordlist.path == str(dest)
+        assert not cache.exists()
+        wordlist.close()
@@ -0,0 +1,185 @@
+import json
+import os
+import socket
+import stat
+import threading
+import time
+
+import pytest
+
+from password_analyzer import __version__
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.cache import ResultCache
+from password_analyzer.cli import main, open_analyzer
+from password_analyzer.daemon import (
+    Daemon,
+    absolute_config,
+    remote_analyze,
+    run_daemon,
+    socket_path,
+    stop_daemon,
+)
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv("PASSWORD_ANALYZER_SOCKET", path)
+    monkeypatch.setenv("PASSWORD_ANALYZER_CACHE", str(tmp_path / "cache"))
+    opened = []
+
+    def opener(*config):
+        analyzer = open_analyzer(*config)
+        analyzer.cache = ResultCache()
+        opened.append(analyzer)
+        return analyzer
+
+    thread = threading.Thread(target=run_daemon, args=(opener, path))
+    thread.start()
+    deadline = time.monotonic() + 5
+    while remote_analyze("warmup") is None:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    yield path, opened
+    stop_daemon(path)
+    thread.join(5)
+    assert not os.path.exists(path)
+
+
+class TestSocketPath:
+    def test_override(self, monkeypatch):
+        monkeypatch.setenv("PASSWORD_ANALYZER_SOCKET", "/tmp/custom.sock")
+        assert socket_path() == "/tmp/custom.sock"
+
+    def test_runtime_dir(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("PASSWORD_ANALYZER_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert socket_path() == str(tmp_path / "password-analyzer.sock")
+
+
+class TestDaemon:
+    def test_remote_matches_local(self, daemon):
+        result = remote_analyze("Hello123!")
+        assert result == PasswordAnalyzer().analyze("Hello123!")
+
+    def test_socket_is_private(self, daemon):
+        assert stat.S_IMODE(os.stat(daemon[0]).st_mode) == 0o600
+
+    def test_uses_dictionary_config(self, daemon, tmp_path):
+        words = tmp_path / "words.txt"
+        words.write_text("correcthorse\n")
+        config = absolute_config(str(words), None, None)
+        result = remote_analyze("correcthorse", config)
+        assert result.checks[2].score == -3
+
+    def test_bad_dictionary_returns_none(self, daemon, tmp_path):
+        config = absolute_config(str(tmp_path / "missing.txt"), None, None)
+        assert remote_analyze("abc", config) is None
+
+    def test_no_daemon_returns_none(self, tmp_path):
+        assert remote_analyze("abc", path=str(tmp_path / "none.sock")) is None
+        assert not stop_daemon(str(tmp_path / "none.sock"))
+
+    def test_reloads_changed_dictionary(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PASSWORD_ANALYZER_CACHE", str(tmp_path / "cache"))
+        words = tmp_path / "words.txt"
+        words.write_text("alpha\n")
+        server = Daemon(open_analyzer)
+        config = absolute_config(str(words), None, None)
+        first = server.analyzer(config)
+        assert server.analyzer(config) is first
+        words.write_text("bravo\n")
+        os.utime(words, ns=(0, 1))
+        closed = []
+        monkeypatch.setattr(first.wordlist, "close", lambda: closed.append(True))
+        second = server.analyzer(config)
+        assert second is not first and closed
+        assert list(server.analyzers) == [config]
+        assert server.analyzer(config) is second
+
+    def test_malformed_request(self):
+        server = Daemon(open_analyzer)
+        assert "error" in server.respond(b"not json\n")
+        assert "error" in server.respond(b'{"password": 1}\n')
+
+    def test_rejects_other_versions(self):
+        server = Daemon(open_analyzer)
+        response = server.respond(b'{"version": "0.0", "password": "abc"}\n')
+        assert "error" in response and response["version"] == __version__
+        request = json.dumps({"version": __version__, "password": "abc"}).encode()
+        assert "result" in server.respond(request)
+
+
+def answer_once(path, response):
+    """Serve one connection on a private socket at ``path`` with ``response``."""
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    os.chmod(path, 0o600)
+    listener.listen(1)
+
+    def serve():
+        conn, _ = listener.accept()
+        with conn, conn.makefile("rwb") as stream:
+            stream.readline()
+            stream.write(json.dumps(response).encode() + b"\n")
+        listener.close()
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    return thread
+
+
+class TestClientSafety:
+    def test_refuses_socket_open_to_others(self, daemon):
+        os.chmod(daemon[0], 0o666)
+        assert remote_analyze("Hello123!") is None
+        os.chmod(daemon[0], 0o600)
+        assert remote_analyze("Hello123!") is not None
+
+    def test_refuses_non_socket(self, tmp_path):
+        path = tmp_path / "fake.sock"
+        path.write_text("")
+        os.chmod(path, 0o600)
+        assert remote_analyze("abc", path=str(path)) is None
+
+    def test_falls_back_on_version_mismatch(self, tmp_path):
+        path = str(tmp_path / "old.sock")
+        result = PasswordAnalyzer().analyze("abc").to_dict()
+        thread = answer_once(path, {"result": result})
+        assert remote_analyze("abc", path=path) is None
+        thread.join(5)
+
+    def test_unknown_message_code_falls_back(self, tmp_path):
+        path = str(tmp_path / "new.sock")
+        result = PasswordAnalyzer().analyze("abc").to_dict()
+        result["checks"][0]["messages"] = [["NEW_CODE"]]
+        thread = answer_once(path, {"version": __version__, "result": result})
+        assert remote_analyze("abc", path=path) is None
+        thread.join(5)
+
+    def test_client_skips_analysis_imports(self):
+        from password_analyzer.importtime import measure
+
+        modules = {c.module for c in measure("password_analyzer.daemon")}
+        assert not modules & {"password_analyzer.analyzer", "password_analyzer.checks"}
+
+
+class TestCLIClient:
+    def test_cli_uses_daemon(self, daemon, capsys):
+        _, opened = daemon
+        main(["--no-color", "--verbose", "Hello123!"])
+        assert opened[0].cache.misses == 2
+        remote = capsys.readouterr().out
+        main(["--no-color", "--verbose", "--no-daemon", "Hello123!"])
+        assert remote == capsys.readouterr().out
+
+    def test_cli_falls_back(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("PASSWORD_ANALYZER_SOCKET", str(tmp_path / "none.sock"))
+        main(["--no-color", "abc"])
+        assert "Weak" in capsys.readouterr().out
+
+    def test_stop_without_daemon_exits(self, tmp_path):
+        with pytest.raises(SystemExit) as e:
+            main(["daemon", "--stop", "--socket", str(tmp_path / "none.sock")])
+        assert e.value.code == 1
@@ -0,0 +1,181 @@
+import itertools
+import os
+
+import pytest
+
+from password_analyzer.common_passwords import COMMON_PASSWORDS
+from password_analyzer.fuzzy import (
+    FileDeletionIndex,
+    MemoryDeletionIndex,
+    NearMatch,
+    deletions,
+    edit_distance,
+    build_index,
+    index_path,
+    open_index,
+    write_deletion_index,
+)
+from password_analyzer.wordlist import map_file
+
+WORDS = ["password", "sunshine", "dragon", "monkey", "abc"]
+
+
+def reference_distance(a, b):
+    """Edit distance with adjacent swaps, by plain dynamic programming."""
+    d = [[i + j if not i * j else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i, j in itertools.product(range(1, len(a) + 1), range(1, len(b) + 1)):
+        d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + (a[i - 1] != b[j - 1]))
+        if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+            d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[-1][-1]
+
+
+class TestEditDistance:
+    def test_matches_reference(self):
+        words = ["password", "passwprd", "passowrd", "pasword", "passwordd", "sunshone", "", "a"]
+        for a, b in itertools.product(words, repeat=2):
+            expected = reference_distance(a, b)
+            for limit in (0, 1, 2):
+                assert edit_distance(a, b, limit) == min(expected, limit + 1)
+
+    def test_adjacent_swap_is_one_edit(self):
+        assert edit_distance("passowrd", "password", 2) == 1
+
+
+class TestDeletions:
+    def test_single_deletions(self):
+        assert deletions("abc", 1) == {"abc", "bc", "ac", "ab"}
+
+    def test_two_deletions(self):
+        assert deletions("abc", 2) == {"abc", "bc", "ac", "ab", "a", "b", "c"}
+
+
+class TestMemoryDeletionIndex:
+    def test_typos(self):
+        index = MemoryDeletionIndex(WORDS)
+        assert index.lookup("passwprd") == [NearMatch("password", 1)]
+        assert index.lookup("sunshone") == [NearMatch("sunshine", 1)]
+        assert index.lookup("passowrd") == [NearMatch("password", 1)]
+        assert index.lookup("pasword") == [NearMatch("password", 1)]
+        assert index.lookup("dragonn") == [NearMatch("dragon", 1)]
+
+    def test_exact_entry_not_reported(self):
+        assert MemoryDeletionIndex(WORDS).lookup("password") == []
+
+    def test_two_edits(self):
+        index = MemoryDeletionIndex(WORDS, 2)
+        assert index.lookup("pasxwprd") == [NearMatch("password", 2)]
+        assert index.lookup("pasxwprd", 1) == []
+        assert index.lookup("passwprd", 2) == [NearMatch("password", 1)]
+
+    def test_matches_brute_force(self):
+        index = MemoryDeletionIndex(COMMON_PASSWORDS, 2)
+        for text in ["passwrod", "12345", "qwertz", "letmeon", "abc12", "zzzzzz"]:
+            expected = sorted(
+                (reference_distance(text, w), w) for w in COMMON_PASSWORDS
+                if w != text and reference_distance(text, w) <= 2
+            )
+            assert [(m.distance, m.word) for m in index.lookup(text)] == expected
+
+    def test_distance_above_index_rejected(self):
+        with pytest.raises(ValueError):
+            MemoryDeletionIndex(WORDS).lookup("passwprd", 2)
+
+    def test_distance_out_of_range(self):
+        with pytest.raises(ValueError):
+            MemoryDeletionIndex(WORDS, 3)
+
+    def test_lengths_outside_entries_skip_lookup(self):
+        index = MemoryDeletionIndex(WORDS)
+        assert (index.shortest, index.longest) == (3, 8)
+        assert index.lookup("x" * 20) == []
+
+
+class TestFileDeletionIndex:
+    def test_round_trip_matches_memory(self, tmp_path):
+        path = tmp_path / "words.pafuzzy"
+        keys = write_deletion_index(COMMON_PASSWORDS, path, 2, "ab" * 32)
+        memory = MemoryDeletionIndex(COMMON_PASSWORDS, 2)
+        index = FileDeletionIndex(path)
+        assert len(index) == keys == len(memory)
+        assert (index.max_distance, index.content_hash) == (2, "ab" * 32)
+        for text in ["passwrod", "12345", "sunshone", "letmeon", "zzzzzz", "a"]:
+            assert index.lookup(text) == memory.lookup(text)
+        index.close()
+
+    def test_skips_entries_with_separators(self, tmp_path):
+        path = tmp_path / "words.pafuzzy"
+        write_deletion_index(["pass\0word", "dragon"], path)
+        index = FileDeletionIndex(path)
+        assert index.lookup("dragin") == [NearMatch("dragon", 1)]
+        assert index.lookup("pass\0wort") == []
+        index.close()
+
+    def test_lone_surrogates_miss(self, tmp_path):
+        path = tmp_path / "words.pafuzzy"
+        write_deletion_index(WORDS, path)
+        index = FileDeletionIndex(path)
+        assert index.lookup("drag\ud800n") == [NearMatch("dragon", 1)]
+        assert index.lookup("\ud800\udc00abc") == []
+        index.close()
+
+    def test_rejects_other_files(self, tmp_path, monkeypatch):
+        mapped = []
+        monkeypatch.setattr(
+            "password_analyzer.fuzzy.map_file",
+            lambda p: mapped.append(map_file(p)) or mapped[-1],
+        )
+        path = tmp_path / "words.txt"
+        path.write_bytes(b"password\n" * 10)
+        with pytest.raises(ValueError):
+            FileDeletionIndex(path)
+        assert mapped[0].closed
+
+
+class TestStreamingWrite:
+    def test_runs_merged_like_single_pass(self, tmp_path):
+        whole, runs = tmp_path / "whole.pafuzzy", tmp_path / "runs.pafuzzy"
+        keys = write_deletion_index(COMMON_PASSWORDS, whole, 1)
+        assert write_deletion_index(COMMON_PASSWORDS, runs, 1, run_size=50) == keys
+        assert whole.read_bytes() == runs.read_bytes()
+        assert not [p for p in os.listdir(tmp_path) if p not in ("whole.pafuzzy", "runs.pafuzzy")]
+
+    def test_duplicate_entries_listed_once(self, tmp_path):
+        path = tmp_path / "words.pafuzzy"
+        write_deletion_index(["dragon", "dragon"], path, run_size=3)
+        with_dupes = FileDeletionIndex(path)
+        assert list(with_dupes._entries("dragon")) == ["dragon"]
+        with_dupes.close()
+
+
+class TestOpenIndex:
+    def test_missing_index_is_not_built(self, tmp_path):
+        dictionary = tmp_path / "words.padict"
+        assert open_index(dictionary, 1, "cd" * 32) is None
+        assert os.listdir(tmp_path) == []
+
+    def test_opens_built_index(self, tmp_path):
+        dictionary = tmp_path / "words.padict"
+        build_index(dictionary, WORDS, 1, "cd" * 32).close()
+        index = open_index(dictionary, 1, "cd" * 32)
+        assert index.path == index_path(dictionary, 1)
+        assert index.lookup("dragin") == [NearMatch("dragon", 1)]
+        index.close()
+        assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
+
+    def test_ignores_index_for_other_contents(self, tmp_path):
+        dictionary = tmp_path / "words.padict"
+        build_index(dictionary, ["dragon"], 1, "cd" * 32).close()
+        assert open_index(dictionary, 1, "ef" * 32) is None
+
+    def test_wider_index_serves_fewer_edits(self, tmp_path):
+        dictionary = tmp_path / "words.padict"
+        build_index(dictionary, WORDS, 2, "cd" * 32).close()
+        index = open_index(dictionary, 1, "cd" * 32)
+        assert index.max_distance == 2
+        assert index.lookup("dragin", 1) == [NearMatch("dragon", 1)]
+        index.close()
+
+    def test_unwritable_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            build_index(tmp_path / "missing" / "words.padict", WORDS, 1, "")
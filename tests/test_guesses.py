@@ -0,0 +1,129 @@
+import math
+
+import pytest
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.checks import check_guesses, default_wordlist, score_guesses
+from password_analyzer.entropy import calculate_entropy
+from password_analyzer.guesses import (
+    MAX_ESTIMATE_LENGTH,
+    REFERENCE_YEAR,
+    date_matches,
+    estimate_guesses,
+    sequence_matches,
+)
+from password_analyzer.registry import GUESSES_CHECK, default_registry
+from password_analyzer.wordlist import MemoryWordList
+
+
+def patterns(password, wordlist=None):
+    estimate = estimate_guesses(password, wordlist or default_wordlist())
+    return [(m.pattern, password[m.start:m.end]) for m in estimate.sequence]
+
+
+class TestEstimateGuesses:
+    def test_decomposition(self):
+        assert patterns("Password2024!") == [
+            ("dictionary", "Password"), ("date", "2024"), ("bruteforce", "!"),
+        ]
+
+    def test_far_below_uniform_entropy(self):
+        estimate = estimate_guesses("Password2024!", default_wordlist())
+        assert estimate.log10 < 8
+        assert calculate_entropy("Password2024!") * math.log10(2) > 20
+
+    def test_keyboard_walks(self):
+        assert patterns("xsw2cde3") == [("walk", "xsw2"), ("walk", "cde3")]
+
+    def test_repeat_and_sequence(self):
+        assert patterns("abcabcabc") == [("repeat", "abcabcabc")]
+        assert patterns("2468") == [("sequence", "2468")]
+
+    def test_dates(self):
+        assert patterns("13051990") == [("date", "13051990")]
+        assert patterns("12/05/1990") == [("date", "12/05/1990")]
+
+    def test_random_is_bruteforced(self):
+        estimate = estimate_guesses("Xk9#mP2$vL5@nQ8", default_wordlist())
+        assert [m.pattern for m in estimate.sequence] == ["bruteforce"]
+        assert estimate.log10 == pytest.approx(15)
+
+    def test_case_variations_cost_guesses(self):
+        wordlist = MemoryWordList(["dragon", *(f"word{i}" for i in range(1000))])
+        lower = estimate_guesses("dragon", wordlist)
+        mixed = estimate_guesses("dRaGoN", wordlist)
+        assert mixed.log10 > lower.log10
+
+    def test_leet_words(self):
+        wordlist = MemoryWordList(["dragon", *(f"word{i}" for i in range(1000))])
+        assert patterns("dr4g0n!", wordlist) == [("leet", "dr4g0n"), ("bruteforce", "!")]
+        # Two distinct substitutions, each used or not.
+        plain = estimate_guesses("dragon", wordlist).log10
+        assert estimate_guesses("dr4g0n", wordlist).log10 == pytest.approx(plain + math.log10(4))
+
+    def test_empty(self):
+        estimate = estimate_guesses("")
+        assert (estimate.log10, estimate.sequence, estimate.guesses) == (0.0, [], 1.0)
+
+    def test_tail_beyond_limit_is_bruteforced(self):
+        password = "a" * (MAX_ESTIMATE_LENGTH + 10)
+        estimate = estimate_guesses(password)
+        last = estimate.sequence[-1]
+        assert (last.pattern, last.start) == ("bruteforce", MAX_ESTIMATE_LENGTH)
+        assert last.end == len(password)
+
+    def test_huge_estimates_do_not_overflow(self):
+        estimate = estimate_guesses("Xk9#mP2$vL5@nQ8!" * 40)
+        assert estimate.guesses == math.inf
+        assert math.isfinite(estimate.log10)
+
+    def test_sequence_covers_password(self):
+        password = "myqwerty1990dragon!!!!"
+        estimate = estimate_guesses(password, default_wordlist())
+        position = 0
+        for match in estimate.sequence:
+            assert match.start == position
+            position = match.end
+        assert position == len(password)
+
+
+class TestMatchers:
+    def test_descending_sequence_costs_more(self):
+        [up] = sequence_matches("abcd")
+        [down] = sequence_matches("dcba")
+        assert down.guesses > up.guesses
+
+    def test_old_years_cost_more(self):
+        recent = min(m.guesses for m in date_matches(str(REFERENCE_YEAR - 1)))
+        old = min(m.guesses for m in date_matches("1950"))
+        assert old > recent
+
+    def test_invalid_date(self):
+        assert not [m for m in date_matches("99/99/3000")]
+
+
+class TestGuessesCheck:
+    def test_scores(self):
+        weak = check_guesses(estimate_guesses("password", default_wordlist()))
+        strong = check_guesses(estimate_guesses("Xk9#mP2$vL5@nQ8", default_wordlist()))
+        assert (weak.score, weak.max_score) == (0, 4)
+        assert strong.score == 4
+        assert weak.messages[0].is_suggestion
+        assert not strong.messages[0].is_suggestion
+
+    def test_score_only_matches(self):
+        for password in ["password", "Password2024!", "xsw2cde3", "Xk9#mP2$vL5@nQ8"]:
+            estimate = estimate_guesses(password, default_wordlist())
+            assert score_guesses(estimate) == check_guesses(estimate).score
+
+    def test_opt_in_registry_check(self):
+        registry = default_registry()
+        registry.register(GUESSES_CHECK)
+        analyzer = PasswordAnalyzer(registry=registry)
+        result = analyzer.analyze("Password2024!")
+        assert result.checks[-1].name == "Guesses"
+        for password in ["Password2024!", "abc", "Xk9#mP2$vL5@nQ8"]:
+            assert analyzer.strength(password) == analyzer.analyze(password).strength
+
+    def test_not_in_default_checks(self):
+        assert "Guesses" not in default_registry()
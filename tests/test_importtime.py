@@ -0,0 +1,98 @@
+import subprocess
+import sys
+
+from password_analyzer.importtime import (
+    cold_start,
+    format_report,
+    measure,
+    parse_importtime,
+)
+
+# Cumulative import time allowed for the CLI module in a fresh interpreter.
+COLD_START_BUDGET_MS = 100
+
+# Modules that only specific commands need; none may load on a plain start.
+DEFERRED = {
+    "asyncio",
+    "concurrent.futures",
+    "getpass",
+    "secrets",
+    "numpy",
+    "password_analyzer.bloom",
+    "password_analyzer.breach",
+    "password_analyzer.cache",
+    "password_analyzer.analyzer",
+    "password_analyzer.checks",
+    "password_analyzer.common_passwords",
+    "password_analyzer.compiled",
+    "password_analyzer.daemon",
+    "password_analyzer.server",
+    "password_analyzer.vectorized",
+}
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | io
+import time:      1500 |       1920 |     password_analyzer.checks
+"""
+
+
+class TestParse:
+    def test_parse_importtime(self):
+        costs = parse_importtime(SAMPLE)
+        assert [c.module for c in costs] == ["_io", "io", "password_analyzer.checks"]
+        assert costs[1].self_us == 300
+        assert costs[1].cumulative_us == 420
+        assert [c.depth for c in costs] == [1, 0, 2]
+
+    def test_format_report(self):
+        report = format_report(parse_importtime(SAMPLE), top=2)
+        lines = report.splitlines()
+        assert len(lines) == 3
+        assert lines[1].endswith("password_analyzer.checks")
+
+
+class TestColdStart:
+    def test_package_import_is_lazy(self):
+        modules = {c.module for c in measure("password_analyzer")}
+        assert not {m for m in modules if m.startswith("password_analyzer.")}
+
+    def test_lazy_attributes(self):
+        import password_analyzer
+
+        assert password_analyzer.PasswordAnalyzer().analyze("abc").score >= 0
+        assert "generate_password" in dir(password_analyzer)
+
+    def test_cli_defers_heavy_modules(self):
+        modules = {c.module for c in measure("password_analyzer.cli")}
+        assert not modules & DEFERRED
+
+    def test_plain_run_skips_data_backends(self):
+        script = (
+            "import sys\n"
+            "from password_analyzer.cli import main\n"
+            "main(['--no-daemon', '--no-color', 'x'])\n"
+            "print(*sys.modules, sep='\\n', file=sys.stderr)\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+        )
+        modules = set(proc.stderr.splitlines())
+        assert "password_analyzer.analyzer" in modules
+        assert not modules & {
+            "password_analyzer.bloom",
+            "password_analyzer.breach",
+            "password_analyzer.compiled",
+            "password_analyzer.fuzzy",
+            "hashlib",
+            "tempfile",
+        }
+
+    def test_cli_cold_start_budget(self):
+        elapsed = cold_start("password_analyzer.cli")
+        assert elapsed < COLD_START_BUDGET_MS, (
+            f"importing the CLI took {elapsed:.1f} ms "
+            f"(budget {COLD_START_BUDGET_MS} ms); see "
+            f"{sys.executable} -m password_analyzer.importtime"
+        )
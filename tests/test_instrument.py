@@ -0,0 +1,82 @@
+import pytest
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.instrument import (
+    PROFILE_STEP,
+    Histogram,
+    Instrumentation,
+    _bucket,
+    _bucket_bounds,
+)
+
+CHECKS = ["Length", "Character variety", "Common password", "Patterns", "Entropy"]
+
+
+class TestHistogram:
+    def test_buckets_cover_values(self):
+        for ns in [0, 1, 15, 16, 17, 100, 1023, 1024, 123_456_789]:
+            low, high = _bucket_bounds(_bucket(ns))
+            assert low <= ns <= high
+            assert high - low <= max(1, ns // 8)
+
+    def test_percentiles(self):
+        h = Histogram()
+        for ns in range(1, 1001):
+            h.record(ns * 1000)
+        assert h.count == 1000
+        assert h.max_ns == 1_000_000
+        assert h.mean_ns == pytest.approx(500_500)
+        assert 500_000 <= h.percentile(50) <= 500_000 * 9 // 8
+        assert 990_000 <= h.percentile(99) <= 1_000_000
+
+    def test_empty(self):
+        assert Histogram().percentile(99) == 0
+
+    def test_merge(self):
+        a, b = Histogram(), Histogram()
+        a.record(10)
+        b.record(1000)
+        a.merge(b)
+        assert a.count == 2
+        assert a.max_ns == 1000
+        assert a.percentile(100) == 1000
+
+
+class TestInstrumentation:
+    def test_records_every_check(self):
+        instrumentation = Instrumentation()
+        analyzer = PasswordAnalyzer(instrumentation=instrumentation)
+        list(analyzer.analyze_many(["abc", "Hello123!", "password"]))
+        report = {t.name: t for t in instrumentation.report()}
+        assert list(report) == [PROFILE_STEP, *CHECKS]
+        assert all(t.calls == 3 for t in report.values())
+        assert all(t.p99_us >= t.p50_us for t in report.values())
+
+    def test_results_unchanged(self):
+        plain = PasswordAnalyzer()
+        timed = PasswordAnalyzer(instrumentation=Instrumentation())
+        for password in ["abc", "Hello123!", "j8$Kp2!mX@nQ9vL#", "пароль"]:
+            assert timed.analyze(password) == plain.analyze(password)
+
+    def test_hooks(self):
+        calls = []
+        instrumentation = Instrumentation()
+        instrumentation.add_hook(
+            before=lambda name: calls.append(("before", name)),
+            after=lambda name, result, ns: calls.append(("after", name, result.name)),
+        )
+        PasswordAnalyzer(instrumentation=instrumentation).analyze("abc")
+        assert calls[:2] == [("before", "Length"), ("after", "Length", "Length")]
+        assert [c[1] for c in calls if c[0] == "after"] == CHECKS
+        assert all(c[2] == c[1] for c in calls if c[0] == "after")
+
+    def test_reset_keeps_running_pipelines(self):
+        instrumentation = Instrumentation()
+        results = PasswordAnalyzer(instrumentation=instrumentation).analyze_many(
+            ["abc", "def"],
+        )
+        next(results)
+        instrumentation.reset()
+        assert instrumentation.report() == []
+        next(results)
+        assert all(t.calls == 1 for t in instrumentation.report())
@@ -0,0 +1,67 @@
+import pytest
+
+from password_analyzer.keyboard import LAYOUTS, adjacency_tables, find_walks
+
+
+def spans(password, **kwargs):
+    return [(w.start, w.end, w.layout) for w in find_walks(password, **kwargs)]
+
+
+class TestAdjacency:
+    @pytest.mark.parametrize(
+        "a, b", [("q", "w"), ("q", "a"), ("q", "1"), ("q", "2"), ("z", "a"), ("z", "s")],
+    )
+    def test_qwerty_neighbours(self, a, b):
+        masks = adjacency_tables().pair_masks
+        assert masks.get((a, b), 0) & 1
+        assert masks.get((b, a), 0) & 1
+
+    def test_not_neighbours(self):
+        masks = adjacency_tables().pair_masks
+        assert not masks.get(("q", "e"), 0) & 1
+        assert not masks.get(("a", "a"), 0)
+
+    def test_shifted_keys_share_positions(self):
+        masks = adjacency_tables().pair_masks
+        assert masks[("Q", "@")] & 1
+
+    def test_keypad_diagonals(self):
+        keypad = 1 << [layout.name for layout in LAYOUTS].index("keypad")
+        masks = adjacency_tables().pair_masks
+        assert masks[("7", "5")] & keypad
+        assert not masks.get(("7", "3"), 0) & keypad
+
+
+class TestFindWalks:
+    def test_diagonal_walks(self):
+        assert spans("xsw2cde3") == [(0, 4, "QWERTY"), (4, 8, "QWERTY")]
+
+    def test_row_walk(self):
+        assert spans("poiuy") == [(0, 5, "QWERTY")]
+
+    def test_other_layouts(self):
+        assert spans("yxcv") == [(0, 4, "QWERTZ")]
+        assert spans("wxcvbn") == [(0, 6, "AZERTY")]
+        assert spans("8520") == [(0, 4, "keypad")]
+
+    def test_shift_and_turns(self):
+        [walk] = find_walks("zaq1@WSX")
+        assert (walk.length, walk.turns, walk.shifted) == (8, 2, 4)
+        assert walk.deliberate
+
+    def test_erratic_walk_is_not_deliberate(self):
+        [walk] = find_walks("UhGz")
+        assert walk.turns == 2
+        assert not walk.deliberate
+
+    def test_minimum_length(self):
+        assert find_walks("qwe") == []
+        assert spans("qwe", min_length=3) == [(0, 3, "QWERTY")]
+
+    def test_no_walks(self):
+        assert find_walks("j8Kp2mXn") == []
+        assert find_walks("") == []
+
+    def test_walks_inside_longer_walks_dropped(self):
+        # "qwert" is also a walk on QWERTZ, but lies inside the QWERTY walk.
+        assert spans("qwerty") == [(0, 6, "QWERTY")]
@@ -0,0 +1,142 @@
+import pytest
+
+from password_analyzer.common_passwords import COMMON_PASSWORDS
+from password_analyzer.leet import (
+    MAX_LEET_LENGTH,
+    SUBSTITUTIONS,
+    LeetMatch,
+    LeetMatcher,
+    leet_entry,
+    leet_matcher,
+    leet_matches,
+)
+from password_analyzer.wordlist import (
+    MemoryWordList,
+    SortedFileWordList,
+    WordList,
+    write_sorted_wordlist,
+)
+
+WORDS = ["password", "pass", "sunshine", "dragon", "lily", "tilt"]
+
+
+class SetWordList(WordList):
+    """A backend with only exact lookups, using the generic trie walk."""
+
+    def __init__(self, words):
+        self.words = set(words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+
+def make_wordlist(kind, tmp_path):
+    if kind == "memory":
+        return MemoryWordList(WORDS)
+    if kind == "sorted":
+        path = tmp_path / "words.txt"
+        write_sorted_wordlist(WORDS, path)
+        return SortedFileWordList(path)
+    return SetWordList(WORDS)
+
+
+@pytest.fixture(params=["memory", "sorted", "generic"])
+def wordlist(request, tmp_path):
+    wordlist = make_wordlist(request.param, tmp_path)
+    yield wordlist
+    wordlist.close()
+
+
+@pytest.fixture(params=["memory", "sorted"])
+def pruning_wordlist(request, tmp_path):
+    wordlist = make_wordlist(request.param, tmp_path)
+    yield wordlist
+    wordlist.close()
+
+
+def brute_force(text, words, min_length):
+    """Every span that some spelling of ``text`` turns into an entry."""
+    found = set()
+    for word in words:
+        for start in range(len(text) - len(word) + 1):
+            written = text[start:start + len(word)]
+            if len(word) >= min_length and written != word and all(
+                c == w or w in SUBSTITUTIONS.get(c, "") for c, w in zip(written, word)
+            ):
+                found.add((start, start + len(word), word))
+    return found
+
+
+class TestLeetEntry:
+    def test_whole_password(self, wordlist):
+        match = leet_entry("p@ssw0rd", wordlist)
+        assert match == LeetMatch(0, 8, "password", (("@", "a"), ("0", "o")))
+
+    def test_several_letters_for_one_character(self, wordlist):
+        assert leet_entry("$un$h1ne", wordlist).word == "sunshine"
+        assert leet_entry("1i|y", wordlist).word == "lily"
+        assert leet_entry("7i17", wordlist).word == "tilt"
+
+    def test_verbatim_entry_is_not_a_leet_match(self, wordlist):
+        assert leet_entry("password", wordlist) is None
+
+    def test_partial_match_is_not_an_entry(self, wordlist):
+        assert leet_entry("p@ssw0rd1", wordlist) is None
+        assert leet_entry("p@ss", wordlist).word == "pass"
+
+    def test_substitutions_reported_once_in_order(self, wordlist):
+        match = leet_entry("$un$h1n3", wordlist)
+        assert match.substitutions == (("$", "s"), ("1", "i"), ("3", "e"))
+        assert match.describe() == "'$' for 's', '1' for 'i', '3' for 'e'"
+
+    def test_custom_table(self, wordlist):
+        assert leet_entry("dr*gon", wordlist) is None
+        assert leet_entry("dr*gon", wordlist, {"*": "a"}).word == "dragon"
+        assert leet_entry("dr4gon", wordlist, {}) is None
+
+
+class TestLeetMatches:
+    def test_finds_words_inside_text(self, pruning_wordlist):
+        wordlist = pruning_wordlist
+        spans = {(m.start, m.end, m.word) for m in leet_matches("xp@ssw0rd!dr4g0n", wordlist, 4)}
+        assert spans == {(1, 5, "pass"), (1, 9, "password"), (10, 16, "dragon")}
+
+    def test_matches_brute_force(self, pruning_wordlist):
+        wordlist = pruning_wordlist
+        for text in ["p@ssp4ss", "11|1y7i17", "$un$h1nedr4g0n", "0000", "p@s$w0rdp@s$"]:
+            found = {(m.start, m.end, m.word) for m in leet_matches(text, wordlist, 3)}
+            assert found == brute_force(text, WORDS, 3)
+
+    def test_generic_backend_short_text(self):
+        # Without prefix pruning every walk stays live, so only short texts
+        # are searched completely.
+        found = leet_matches("xp@ss", SetWordList(WORDS), 4)
+        assert [(m.start, m.word) for m in found] == [(1, "pass")]
+
+    def test_no_substitution_characters(self, wordlist):
+        assert leet_matches("password", wordlist) == []
+
+    def test_only_leading_characters_searched(self, pruning_wordlist):
+        wordlist = pruning_wordlist
+        text = "x" * (MAX_LEET_LENGTH - 2) + "p@ssw0rd"
+        assert leet_matches(text, wordlist, 4) == []
+        assert [m.word for m in leet_matches(text[6:], wordlist, 4)] == ["pass", "password"]
+
+    def test_ambiguous_input_stays_bounded(self, wordlist):
+        # Every character has three spellings; the walk must not branch 3^n ways.
+        assert leet_matches("|" * 200, wordlist) == []
+
+
+class TestLeetMatcher:
+    def test_shared_per_wordlist_and_table(self):
+        wordlist = MemoryWordList(WORDS)
+        assert leet_matcher(wordlist) is leet_matcher(wordlist)
+        table = {"4": "a"}
+        assert leet_matcher(wordlist, table) is not leet_matcher(wordlist)
+        assert leet_matcher(wordlist, table).substitutions == table
+
+    def test_cached_transitions_give_same_answers(self):
+        matcher = LeetMatcher(MemoryWordList(COMMON_PASSWORDS))
+        first = [matcher.matches(text, 4) for text in ["p@ssw0rd", "d4rkn3ss", "p@ssw0rd"]]
+        assert first[0] == first[2]
+        assert [m.word for m in first[0]] == ["pass", "passw0rd", "password"]
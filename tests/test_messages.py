@@ -0,0 +1,84 @@
+import pytest
+
+from password_analyzer.analyzer import AnalysisResult, PasswordAnalyzer
+from password_analyzer.checks import CheckResult, check_common_password, check_entropy
+from password_analyzer.messages import Message, MessageCode
+
+
+class TestMessage:
+    def test_renders_template(self):
+        assert str(Message(MessageCode.BREACHED, (12345,))) == (
+            "Found in breach data 12,345 times — never use a breached password."
+        )
+        assert str(Message(MessageCode.ENTROPY_GOOD, (61.234,))) == "Good entropy (61.2 bits)."
+
+    def test_classification_from_code(self):
+        assert Message(MessageCode.MISSING_CLASS, ("digits",)).is_suggestion
+        assert not Message(MessageCode.HAS_CLASS, ("digits",)).is_suggestion
+
+    def test_text_messages(self):
+        assert str(Message.text("Custom")) == "Custom"
+        assert not Message.text("Custom").is_suggestion
+        assert Message.text("Custom", suggestion=True).is_suggestion
+
+
+class TestCheckResultMessages:
+    def test_checks_store_codes(self):
+        result = check_common_password("password")
+        assert [m.code for m in result.messages] == [MessageCode.COMMON_PASSWORD]
+        result = check_entropy(30.0)
+        assert result.messages == (Message(MessageCode.ENTROPY_MODERATE, (30.0,)),)
+
+    def test_plain_strings_are_wrapped(self):
+        result = CheckResult("Custom", 0, 0, ["Note."])
+        assert result.messages == (Message.text("Note."),)
+        assert result.feedback == ["Note."]
+
+    def test_plain_strings_classified_by_wording(self):
+        result = CheckResult("Custom", 0, 0, ["Add a passphrase instead.", "Nice rhythm."])
+        assert [m.is_suggestion for m in result.messages] == [True, False]
+        assert not Message.text("Add a passphrase instead.", suggestion=False).is_suggestion
+
+    def test_feedback_keyword_deprecated(self):
+        with pytest.warns(DeprecationWarning):
+            result = CheckResult("Custom", 0, 0, feedback=["Note."])
+        assert result.messages == (Message.text("Note."),)
+        with pytest.raises(TypeError), pytest.warns(DeprecationWarning):
+            CheckResult("Custom", 0, 0, ["A."], feedback=["B."])
+
+    def test_analysis_feedback_argument_deprecated(self):
+        result = PasswordAnalyzer().analyze("Hello123!")
+        fields = (result.password_length, result.score, result.strength,
+                  result.strength_color, result.entropy_bits, result.checks)
+        with pytest.warns(DeprecationWarning):
+            assert AnalysisResult(*fields, feedback=["ignored"]) == result
+        with pytest.warns(DeprecationWarning):
+            assert AnalysisResult(*fields, result.feedback).feedback == result.feedback
+
+    def test_no_instance_dict(self):
+        result = PasswordAnalyzer().analyze("Hello123!")
+        for obj in (result, result.checks[0], result.checks[0].messages[0]):
+            assert not hasattr(obj, "__dict__")
+
+
+class TestSerialization:
+    def test_round_trip(self):
+        result = PasswordAnalyzer().analyze("qwerty12345")
+        assert AnalysisResult.from_dict(result.to_dict()) == result
+
+    def test_dict_has_rendered_feedback(self):
+        result = PasswordAnalyzer().analyze("abc")
+        data = result.to_dict()
+        assert data["feedback"] == result.feedback
+        assert data["checks"][0]["feedback"] == ["Too short — use at least 8 characters."]
+
+    def test_feedback_only_dict(self):
+        data = {"name": "Custom", "score": 0, "max_score": 0, "feedback": ["Note."]}
+        assert CheckResult.from_dict(data).feedback == ["Note."]
+        data["feedback"] = ["Low entropy (20.0 bits)."]
+        assert CheckResult.from_dict(data).messages[0].is_suggestion
+
+    def test_unknown_code(self):
+        data = {"name": "Custom", "score": 0, "max_score": 0, "messages": [["NOPE"]]}
+        with pytest.raises(ValueError):
+            CheckResult.from_dict(data)
@@ -0,0 +1,80 @@
+import functools
+import io
+
+import pytest
+
+from password_analyzer.audit import audit
+from password_analyzer.cli import open_analyzer
+from password_analyzer.parallel import parallel_audit, split_ranges
+
+PASSWORDS = [
+    "password", "Hello123!", "", "j8$Kp2!mX@nQ9vL#", "qwerty", "Summer2024!",
+    "correcthorse", "abc", "Tr0ub4dor&3", "x" * 40,
+] * 7
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "passwords.txt"
+    path.write_bytes("\n".join(PASSWORDS).encode("utf-8"))
+    return path
+
+
+def sequential(path, fmt="jsonl", analyzer=None):
+    out = io.StringIO()
+    with open(path, "rb") as f:
+        audit(f, out, fmt, analyzer)
+    return out.getvalue()
+
+
+class TestSplitRanges:
+    def test_ranges_cover_buffer_on_line_boundaries(self):
+        data = b"aa\nbbbb\nc\n\ndddddd\ne"
+        for chunks in range(1, 12):
+            ranges = split_ranges(data, chunks)
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == len(data)
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                assert end == start
+                assert data[end - 1:end] == b"\n"
+
+    def test_long_line_not_split(self):
+        assert split_ranges(b"x" * 100 + b"\n", 4) == [(0, 101)]
+
+    def test_empty_buffer(self):
+        assert split_ranges(b"", 4) == []
+
+
+class TestParallelAudit:
+    def test_input_order_matches_sequential(self, source):
+        out = io.StringIO()
+        count = parallel_audit(source, out, "csv", jobs=2, chunk_bytes=64)
+        assert out.getvalue() == sequential(source, "csv")
+        assert count == sum(1 for p in PASSWORDS if p)
+
+    def test_completion_order_has_same_records(self, source):
+        out = io.StringIO()
+        parallel_audit(source, out, jobs=2, order="completion", chunk_bytes=64)
+        assert sorted(out.getvalue().splitlines()) == \
+            sorted(sequential(source).splitlines())
+
+    def test_workers_use_factory(self, source, tmp_path, monkeypatch):
+        monkeypatch.setenv("PASSWORD_ANALYZER_CACHE", str(tmp_path / "cache"))
+        words = tmp_path / "words.txt"
+        words.write_text("correcthorse\n")
+        factory = functools.partial(open_analyzer, str(words))
+
+        out = io.StringIO()
+        parallel_audit(source, out, "tsv", make_analyzer=factory, jobs=2, chunk_bytes=64)
+        assert out.getvalue() == sequential(source, "tsv", factory())
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        out = io.StringIO()
+        assert parallel_audit(path, out, "jsonl", jobs=2) == 0
+        assert out.getvalue() == ""
+
+    def test_unknown_order(self, source):
+        with pytest.raises(ValueError):
+            parallel_audit(source, io.StringIO(), order="random")
@@ -0,0 +1,66 @@
+from password_analyzer.profile import (
+    ASCII_CLASSES,
+    DIGIT,
+    LOWER,
+    SYMBOL,
+    UPPER,
+    build_profile,
+    classify,
+)
+
+SAMPLES = [
+    "", "a", "A", "1", "!", " ", "\t", "aA1!", "password", "Hello123!",
+    "j8$Kp2!mX@nQ9vL#", "ÄÖÜäöü", "пароль2024", "密码123", "ǅungla", "x²y³",
+    "🔒secure🔑", "Ⅻ roman", "ß", "ＡＢＣ１２３",
+]
+
+
+class TestClassify:
+    def test_ascii_table_matches_classify(self):
+        assert ASCII_CLASSES == tuple(classify(chr(i)) for i in range(128))
+
+    def test_ascii_classes(self):
+        assert classify("A") == UPPER
+        assert classify("a") == LOWER
+        assert classify("7") == DIGIT
+        assert classify("#") == SYMBOL
+
+    def test_titlecase_has_no_case_class(self):
+        assert classify("ǅ") == 0
+
+
+class TestBuildProfile:
+    def test_counts(self):
+        profile = build_profile("aA1!bB")
+        assert (profile.upper_count, profile.lower_count,
+                profile.digit_count, profile.symbol_count) == (2, 2, 1, 1)
+
+    def test_lower_and_codepoints(self):
+        profile = build_profile("AbC")
+        assert profile.lower == "abc"
+        assert profile.codepoints == [65, 98, 67]
+
+    def test_empty(self):
+        profile = build_profile("")
+        assert profile.codepoints == []
+        assert not (profile.has_upper or profile.has_lower
+                    or profile.has_digit or profile.has_symbol)
+
+    def test_flags_match_str_predicates(self):
+        for password in SAMPLES:
+            profile = build_profile(password)
+            assert profile.has_upper == any(c.isupper() for c in password)
+            assert profile.has_lower == any(c.islower() for c in password)
+            assert profile.has_digit == any(c.isdigit() for c in password)
+            assert profile.has_symbol == any(not c.isalnum() for c in password)
+            assert profile.codepoints == [ord(c) for c in password]
+            assert profile.lower == password.lower()
+
+    def test_bytes_match_str(self):
+        for password in SAMPLES:
+            data = password.encode("utf-8")
+            for given in (data, bytearray(data), memoryview(data)):
+                assert build_profile(given) == build_profile(password)
+
+    def test_invalid_utf8_replaced(self):
+        assert build_profile(b"abc\xff") == build_profile("abc\ufffd")
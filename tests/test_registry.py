@@ -0,0 +1,142 @@
+import pytest
+
+from password_analyzer.analyzer import PasswordAnalyzer
+from password_analyzer.bench import CORPORA, make_corpus
+from password_analyzer.checks import CheckResult
+from password_analyzer.instrument import Instrumentation
+from password_analyzer.registry import (
+    DEFAULT_CHECKS,
+    CheckRegistry,
+    CheckSpec,
+    default_registry,
+)
+
+
+def digit_suffix(analyzer):
+    return lambda p: CheckResult(
+        "Digit suffix", -1 if p.password[-1:].isdigit() else 0, 0, [],
+    )
+
+
+DIGIT_SUFFIX = CheckSpec("Digit suffix", digit_suffix, cost=0.5, min_score=-1, max_score=0)
+
+
+class TestCheckRegistry:
+    def test_default_order(self):
+        assert default_registry().names() == [spec.name for spec in DEFAULT_CHECKS]
+
+    def test_register_before(self):
+        registry = default_registry()
+        registry.register(DIGIT_SUFFIX, before="Patterns")
+        names = registry.names()
+        assert names.index("Digit suffix") == names.index("Patterns") - 1
+
+    def test_duplicate_name(self):
+        with pytest.raises(ValueError):
+            default_registry().register(DEFAULT_CHECKS[0])
+
+    def test_empty_score_range(self):
+        spec = CheckSpec("Bad", digit_suffix, cost=1, min_score=1, max_score=0)
+        with pytest.raises(ValueError):
+            CheckRegistry().register(spec)
+
+    def test_unregister(self):
+        registry = default_registry()
+        assert registry.unregister("Entropy").name == "Entropy"
+        assert "Entropy" not in registry
+        with pytest.raises(ValueError):
+            registry.unregister("Entropy")
+
+    def test_copies_are_independent(self):
+        registry = default_registry()
+        copy = registry.copy()
+        copy.unregister("Length")
+        assert "Length" in registry
+
+
+class TestAnalyzerRegistry:
+    def test_custom_check_in_results(self):
+        registry = default_registry()
+        registry.register(DIGIT_SUFFIX)
+        result = PasswordAnalyzer(registry=registry).analyze("Hello123")
+        assert [c.name for c in result.checks][-1] == "Digit suffix"
+        assert result.checks[-1].score == -1
+
+    def test_without_entropy_check(self):
+        registry = default_registry()
+        registry.unregister("Entropy")
+        result = PasswordAnalyzer(registry=registry).analyze("Hello123!")
+        assert "Entropy" not in [c.name for c in result.checks]
+        assert result.entropy_bits > 0
+
+    def test_empty_registry(self):
+        result = PasswordAnalyzer(registry=CheckRegistry()).analyze("abc")
+        assert result.checks == []
+        assert result.strength == "Weak"
+
+
+class TestScoreOnly:
+    @pytest.mark.parametrize("kind", list(CORPORA))
+    def test_matches_full_analysis(self, kind):
+        analyzer = PasswordAnalyzer()
+        for password in make_corpus(kind, 300):
+            assert analyzer.strength(password) == analyzer.analyze(password).strength
+
+    def test_custom_registry_matches(self):
+        registry = default_registry()
+        registry.register(DIGIT_SUFFIX)
+        analyzer = PasswordAnalyzer(registry=registry)
+        for password in make_corpus("random", 300) + ["", "abc", "Hello123"]:
+            assert analyzer.strength(password) == analyzer.analyze(password).strength
+
+    def test_stops_early(self):
+        instrumentation = Instrumentation()
+        analyzer = PasswordAnalyzer(instrumentation=instrumentation)
+        assert analyzer.strength("abc") == "Weak"
+        ran = [t.name for t in instrumentation.report()]
+        assert "Common password" not in ran
+        assert ran[1] == "Length"
+
+    def test_uses_cached_result(self):
+        from password_analyzer.cache import ResultCache
+
+        analyzer = PasswordAnalyzer(cache=ResultCache())
+        analyzer.analyze("Hello123!")
+        hits = analyzer.cache.hits
+        assert analyzer.strength("Hello123!") == analyzer.analyze("Hello123!").strength
+        assert analyzer.cache.hits == hits + 2
+
+
+class TestMeets:
+    @pytest.mark.parametrize("kind", list(CORPORA))
+    def test_matches_full_analysis(self, kind):
+        analyzer = PasswordAnalyzer()
+        for password in make_corpus(kind, 100):
+            score = analyzer.analyze(password).score
+            for min_score in (0, 26, 51, 76, 100):
+                assert analyzer.meets(password, min_score) == (score >= min_score)
+
+    def test_batch_form(self):
+        analyzer = PasswordAnalyzer()
+        passwords = make_corpus("common", 50) + make_corpus("random", 50)
+        expected = [analyzer.analyze(p).score >= 51 for p in passwords]
+        assert list(analyzer.meets_many(passwords, 51)) == expected
+
+    def test_out_of_range_thresholds(self):
+        analyzer = PasswordAnalyzer()
+        assert analyzer.meets("", 0)
+        assert not analyzer.meets("Xk9#mP2$vL5@nQ8!zR4", 101)
+
+    def test_stops_early(self):
+        instrumentation = Instrumentation()
+        analyzer = PasswordAnalyzer(instrumentation=instrumentation)
+        assert not analyzer.meets("abc", 51)
+        ran = [t.name for t in instrumentation.report()]
+        assert "Common password" not in ran
+
+    def test_after_hooks_get_scores(self):
+        instrumentation = Instrumentation()
+        seen = []
+        instrumentation.add_hook(after=lambda name, score, ns: seen.append(score))
+        PasswordAnalyzer(instrumentation=instrumentation).meets("abc", 51)
+        assert seen and all(isinstance(score, (int, float)) for score in seen)
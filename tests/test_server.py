@@ -0,0 +1,213 @@
+import asyncio
+import json
+
+from password_analyzer.analyzer import AnalysisResult, PasswordAnalyzer
+from password_analyzer.server import LatencyRecorder, MicroBatcher, ScoringServer
+
+
+async def request(reader, writer, method, path, payload=None, headers=""):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n{headers}"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode()
+    status = int(head.split(" ", 2)[1])
+    length = int(head.lower().split("content-length: ", 1)[1].split("\r\n", 1)[0])
+    return status, head, json.loads(await reader.readexactly(length))
+
+
+def run_with_server(scenario, **options):
+    async def main():
+        server = ScoringServer(PasswordAnalyzer(), **options)
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            return await scenario(server, port)
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+class TestLatencyRecorder:
+    def test_percentiles(self):
+        recorder = LatencyRecorder()
+        for ms in range(1, 101):
+            recorder.record(ms / 1000)
+        assert recorder.percentile(50) == 0.05
+        assert recorder.percentile(99) == 0.099
+        assert recorder.summary()["requests"] == 100
+
+    def test_empty(self):
+        assert LatencyRecorder().percentile(99) == 0.0
+
+
+class TestMicroBatcher:
+    def test_coalesces_concurrent_requests(self):
+        async def main():
+            batcher = MicroBatcher(PasswordAnalyzer(), max_batch=8, max_wait=0.05)
+            batcher.start()
+            passwords = [f"password{i}" for i in range(20)]
+            results = await asyncio.gather(*(batcher.submit(p) for p in passwords))
+            await batcher.stop()
+            return batcher, results
+
+        batcher, results = asyncio.run(main())
+        assert [r.password_length for r in results] == [9] * 10 + [10] * 10
+        assert batcher.batched == 20
+        assert batcher.batches == 3
+
+    def test_failure_only_fails_its_request(self):
+        class Failing(PasswordAnalyzer):
+            def _run(self, password, pipeline):
+                if password == "bad":
+                    raise RuntimeError(password)
+                return super()._run(password, pipeline)
+
+        async def main():
+            batcher = MicroBatcher(Failing(), max_batch=8, max_wait=0.05)
+            batcher.start()
+            results = await asyncio.gather(
+                *(batcher.submit(p) for p in ["good", "bad", "fine"]), return_exceptions=True,
+            )
+            await batcher.stop()
+            return batcher, results
+
+        batcher, results = asyncio.run(main())
+        assert batcher.batches == 1
+        assert isinstance(results[1], RuntimeError)
+        assert [results[0].password_length, results[2].password_length] == [4, 4]
+
+
+class TestScoringServer:
+    def test_score_matches_analyzer(self):
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            response = await request(reader, writer, "POST", "/score", {"password": "Hello123!"})
+            writer.close()
+            return response
+
+        status, _, payload = run_with_server(scenario)
+        assert status == 200
+        assert AnalysisResult.from_dict(payload) == PasswordAnalyzer().analyze("Hello123!")
+
+    def test_keep_alive_and_stats(self):
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for password in ["a", "b", "c"]:
+                status, head, _ = await request(
+                    reader, writer, "POST", "/score", {"password": password},
+                )
+                assert status == 200
+                assert "Connection: keep-alive" in head
+            response = await request(reader, writer, "GET", "/stats")
+            writer.close()
+            return response
+
+        status, _, stats = run_with_server(scenario)
+        assert status == 200
+        assert stats["requests"] == 3
+        assert stats["batches"] == 3
+        assert stats["p99_ms"] >= stats["p50_ms"] > 0
+
+    def test_concurrent_requests_are_batched(self):
+        async def scenario(server, port):
+            async def one(i):
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                response = await request(
+                    reader, writer, "POST", "/score", {"password": f"pw{i}"},
+                    headers="Connection: close\r\n",
+                )
+                writer.close()
+                return response
+
+            responses = await asyncio.gather(*(one(i) for i in range(10)))
+            return responses, server.stats()
+
+        responses, stats = run_with_server(scenario, max_batch=64, max_wait=0.2)
+        assert all(status == 200 for status, _, _ in responses)
+        assert stats["batches"] < 10
+
+    def test_errors(self):
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            results = [
+                (await request(reader, writer, "POST", "/score", {"pw": "x"}))[0],
+                (await request(reader, writer, "POST", "/score", {"password": 5}))[0],
+                (await request(reader, writer, "GET", "/score"))[0],
+                (await request(reader, writer, "GET", "/nope"))[0],
+                (await request(reader, writer, "GET", "/health"))[0],
+            ]
+            writer.close()
+            return results
+
+        assert run_with_server(scenario) == [400, 400, 405, 404, 200]
+
+    def test_unencodable_password_rejected(self):
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = [
+                await request(reader, writer, "POST", "/score", {"password": "ab\ud800"}),
+                await request(reader, writer, "POST", "/score", {"password": "abc"}),
+            ]
+            writer.close()
+            return responses
+
+        (bad, _, error), (good, _, _) = run_with_server(scenario)
+        assert (bad, good) == (400, 200)
+        assert "error" in error
+
+    def test_analysis_failure_returns_500(self, monkeypatch):
+        def fail(self, passwords):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(PasswordAnalyzer, "analyze_many", fail)
+        monkeypatch.setattr(PasswordAnalyzer, "analyze", fail)
+
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            response = await request(reader, writer, "POST", "/score", {"password": "abc"})
+            writer.close()
+            return response
+
+        status, _, payload = run_with_server(scenario)
+        assert status == 500
+        assert payload == {"error": "analysis failed"}
+
+    def test_connection_close(self):
+        async def scenario(server, port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            _, head, _ = await request(
+                reader, writer, "GET", "/health", headers="Connection: close\r\n",
+            )
+            eof = await reader.read()
+            writer.close()
+            return head, eof
+
+        head, eof = run_with_server(scenario)
+        assert "Connection: close" in head
+        assert eof == b""
+
+    def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "score.sock")
+
+        async def main():
+            server = ScoringServer(PasswordAnalyzer())
+            listener = await server.start(unix_path=path)
+            try:
+                reader, writer = await asyncio.open_unix_connection(path)
+                response = await request(reader, writer, "POST", "/score", {"password": "abc"})
+                writer.close()
+                return response
+            finally:
+                listener.close()
+                await listener.wait_closed()
+                await server.stop()
+
+        status, _, payload = asyncio.run(main())
+        assert status == 200
+        assert payload["score"] == PasswordAnalyzer().analyze("abc").score
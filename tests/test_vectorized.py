@@ -0,0 +1,110 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from password_analyzer.analyzer import PasswordAnalyzer  # noqa: E402
+from password_analyzer.vectorized import analyze_batch, pack  # noqa: E402
+
+FIXED = [
+    "", "a", "aaa", "abc", "cba", "xcba99", "x12345", "paaassword", "password",
+    "PASSWORD", "mypassword99", "Hello123!", "j8$Kp2!mX@nQ9vL#", "myqwerty1",
+    "1QAZ2WSXx", "Пароль123!", "ÄQWERTY", "ǅ9qwerty", "x²y³", "🔒secure🔑",
+    "\x00\x00\x00", "İstanbulasdf", "a" * 40, "xsw2cde3", "Poiuy!", "UhGz",
+    "8520", "yxcv", "wxcvbn", "ü+#äp", "P@ssw0rd", "$unsh1ne", "xM0nk3y!",
+    "passwprd", "Sunshone", "Summer2024!", "#1Dragon",
+]
+
+
+def random_corpus(seed, size=300):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$ äé€"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        for _ in range(size)
+    ]
+
+
+def assert_matches_scalar(passwords, analyzer=None):
+    analyzer = analyzer or PasswordAnalyzer()
+    table = analyze_batch(passwords, analyzer)
+    strengths = table.strengths
+    for i, password in enumerate(passwords):
+        expected = analyzer.analyze(password)
+        assert table.scores[i] == expected.score, password
+        assert strengths[i] == expected.strength, password
+        assert table.entropy_bits[i] == expected.entropy_bits, password
+        assert table.lengths[i] == expected.password_length, password
+        for check in expected.checks:
+            assert table.check_scores[check.name][i] == check.score, (password, check.name)
+
+
+class TestPack:
+    def test_padded_matrix(self):
+        codes, lengths = pack(["ab", "", "xyz"])
+        assert codes.shape == (3, 3)
+        assert lengths.tolist() == [2, 0, 3]
+        assert codes[0].tolist() == [97, 98, 0]
+        assert codes[2].tolist() == [120, 121, 122]
+
+    def test_non_bmp(self):
+        codes, _ = pack(["🔒"])
+        assert codes[0].tolist() == [ord("🔒")]
+
+    def test_empty_batch(self):
+        codes, lengths = pack([])
+        assert codes.shape == (0, 0)
+        assert len(analyze_batch([])) == 0
+
+
+class TestAnalyzeBatch:
+    def test_fixed_cases_match_scalar(self):
+        assert_matches_scalar(FIXED)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_random_corpus_matches_scalar(self, seed):
+        assert_matches_scalar(random_corpus(seed))
+
+    def test_custom_wordlist(self):
+        from password_analyzer.wordlist import MemoryWordList
+
+        analyzer = PasswordAnalyzer(wordlist=MemoryWordList(["correcthorse"]))
+        assert_matches_scalar(["CorrectHorse", "xcorrecthorsex", "password"], analyzer)
+
+    def test_custom_substitutions(self):
+        analyzer = PasswordAnalyzer(substitutions={"*": "a"})
+        assert_matches_scalar(["dr*gon", "dr4gon", "P@ssw0rd"], analyzer)
+
+    def test_near_miss_distance(self):
+        analyzer = PasswordAnalyzer(near_miss_distance=2)
+        assert_matches_scalar(["pasxwprd", "passwprd", "sunshxne!"], analyzer)
+
+    def test_breach_index(self, tmp_path):
+        import hashlib
+
+        from password_analyzer.breach import BreachIndex, convert_dump
+
+        lines = sorted(
+            f"{hashlib.sha1(p.encode()).hexdigest().upper()}:{n}"
+            for p, n in [("Hello123!", 77), ("password", 5)]
+        )
+        convert_dump(lines, tmp_path / "breach.idx")
+        analyzer = PasswordAnalyzer(breach_index=BreachIndex(tmp_path / "breach.idx"))
+        assert_matches_scalar(FIXED, analyzer)
+
+    def test_rejects_custom_registry(self):
+        from password_analyzer.registry import default_registry
+
+        registry = default_registry()
+        registry.unregister("Patterns")
+        with pytest.raises(ValueError):
+            analyze_batch(FIXED, PasswordAnalyzer(registry=registry))
+
+    def test_strengths_follow_thresholds(self):
+        from password_analyzer.scoring import get_strength_label
+        from password_analyzer.vectorized import ScoreTable
+
+        scores = np.arange(101)
+        table = ScoreTable(scores, scores, scores.astype(float), {})
+        assert table.strengths == [get_strength_label(s)[0] for s in range(101)]
@@ -0,0 +1,158 @@
+import pytest
+
+from password_analyzer.checks import check_common_password
+from password_analyzer.common_passwords import COMMON_PASSWORDS
+from password_analyzer.wordlist import (
+    MemoryWordList,
+    SortedFileWordList,
+    is_sorted_wordlist,
+    write_sorted_wordlist,
+)
+
+
+@pytest.fixture
+def sorted_wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    write_sorted_wordlist(COMMON_PASSWORDS, path)
+    wordlist = SortedFileWordList(path)
+    yield wordlist
+    wordlist.close()
+
+
+class TestWriteSortedWordlist:
+    def test_normalizes_entries(self, tmp_path):
+        path = tmp_path / "words.txt"
+        count = write_sorted_wordlist(["Zebra", "apple", " apple ", "", "Émile"], path)
+        assert count == 3
+        assert path.read_bytes() == "apple\nzebra\némile\n".encode("utf-8")
+
+
+class TestIsSortedWordlist:
+    def test_written_list_is_sorted(self, tmp_path):
+        path = tmp_path / "words.txt"
+        write_sorted_wordlist(COMMON_PASSWORDS, path)
+        assert is_sorted_wordlist(path)
+
+    @pytest.mark.parametrize("data", [
+        b"b\na\n", b"a\na\n", b"A\nb\n", b"a\n\nb\n", b"a \nb\n", b"a\r\nb\r\n", b"\xff\n",
+    ])
+    def test_rejects_unnormalized(self, tmp_path, data):
+        path = tmp_path / "words.txt"
+        path.write_bytes(data)
+        assert not is_sorted_wordlist(path)
+
+
+class TestMemoryWordList:
+    def test_contains(self):
+        wordlist = MemoryWordList(["password", "dragon"])
+        assert "dragon" in wordlist
+        assert "dragons" not in wordlist
+
+    def test_longest_substring(self):
+        wordlist = MemoryWordList(["pass", "password"])
+        assert wordlist.longest_substring("mypassword1", 4) == "password"
+
+    def test_matches(self):
+        wordlist = MemoryWordList(["pass", "password", "word"])
+        assert sorted(wordlist.matches("mypassword1", 4)) == [(2, 6), (2, 10), (6, 10)]
+
+    def test_min_length_respected(self):
+        wordlist = MemoryWordList(["abc"])
+        assert wordlist.longest_substring("xabcx", 4) is None
+
+    def test_trie_step(self):
+        wordlist = MemoryWordList(["pa", "pass"])
+        node, is_entry = wordlist.trie_step(wordlist.trie_root(), "p")
+        assert not is_entry
+        node, is_entry = wordlist.trie_step(node, "a")
+        assert is_entry
+        assert wordlist.trie_step(node, "x") is None
+
+
+class TestSortedFileWordList:
+    def test_every_entry_found(self, sorted_wordlist):
+        for word in COMMON_PASSWORDS:
+            assert word in sorted_wordlist
+
+    def test_missing_entries(self, sorted_wordlist):
+        for word in ["", "0", "zzzzzz", "passwor", "password1234", "aaaa"]:
+            assert word not in sorted_wordlist
+
+    def test_non_string_not_contained(self, sorted_wordlist):
+        assert 123 not in sorted_wordlist
+
+    def test_longest_substring_matches_memory_backend(self, sorted_wordlist):
+        memory = MemoryWordList(COMMON_PASSWORDS)
+        for text in ["mypassword99", "xdragonx", "qwerty123abc", "j8kp2mxnq9", "zz"]:
+            assert sorted_wordlist.longest_substring(text, 4) == \
+                memory.longest_substring(text, 4)
+
+    def test_matches_match_memory_backend(self, sorted_wordlist):
+        memory = MemoryWordList(COMMON_PASSWORDS)
+        for text in ["mypassword1", "xdragonx", "iloveyou2", "zzzz", "qwerty123abc"]:
+            assert sorted(sorted_wordlist.matches(text, 3)) == sorted(memory.matches(text, 3))
+
+    def test_trie_walk_matches_memory_backend(self, sorted_wordlist):
+        memory = MemoryWordList(COMMON_PASSWORDS)
+
+        def walk(wordlist, text):
+            node, steps = wordlist.trie_root(), []
+            for char in text:
+                step = wordlist.trie_step(node, char)
+                if step is None:
+                    break
+                node = step[0]
+                steps.append(step[1])
+            return steps
+
+        for text in ["password1", "dragon", "qwertyuiop", "zzz", "sunshine"]:
+            assert walk(sorted_wordlist, text) == walk(memory, text)
+
+    def test_near_miss_index(self, sorted_wordlist):
+        assert check_common_password("passwprd", sorted_wordlist).score == -1
+        sorted_wordlist.build_deletion_index(1)
+        assert check_common_password("passwprd", sorted_wordlist).score == -2
+        assert sorted_wordlist.deletion_index(1).path.endswith(".d1.pafuzzy")
+
+    def test_file_without_trailing_newline(self, tmp_path):
+        path = tmp_path / "words.txt"
+        path.write_bytes(b"alpha\nbravo\ncharlie")
+        wordlist = SortedFileWordList(path)
+        assert "charlie" in wordlist
+        assert "alpha" in wordlist
+        assert "delta" not in wordlist
+        wordlist.close()
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        wordlist = SortedFileWordList(path)
+        assert "password" not in wordlist
+        assert wordlist.longest_substring("password", 4) is None
+
+    def test_unicode_entries(self, tmp_path):
+        path = tmp_path / "words.txt"
+        write_sorted_wordlist(["contraseña", "mot de passe", "пароль"], path)
+        wordlist = SortedFileWordList(path)
+        assert "пароль" in wordlist
+        assert wordlist.longest_substring("моипароль1", 4) == "пароль"
+        wordlist.close()
+
+    def test_lone_surrogates_miss(self, sorted_wordlist):
+        text = "pass\ud800word"
+        assert text not in sorted_wordlist
+        assert sorted_wordlist.longest_substring(text, 4) == "pass"
+        assert list(sorted_wordlist.matches("\udcff" + "dragon", 4)) == [(1, 7)]
+        assert sorted_wordlist.trie_step(sorted_wordlist.trie_root(), "\ud800") is None
+        assert check_common_password("ab\ud800cd", sorted_wordlist).score == 0
+
+
+class TestCommonPasswordWithWordlist:
+    def test_exact_match(self, sorted_wordlist):
+        assert check_common_password("PASSWORD", sorted_wordlist).score == -3
+
+    def test_substring_match(self, sorted_wordlist):
+        assert check_common_password("mypassword99", sorted_wordlist).score == -1
+
+    def test_safe_password(self, sorted_wordlist):
+        assert check_common_password("j8Kp2mXnQ9", sorted_wordlist).score == 0